@@ -0,0 +1,13 @@
+from django.contrib import admin
+from .models import DailyStats, RollupWatermark
+
+
+@admin.register(DailyStats)
+class DailyStatsAdmin(admin.ModelAdmin):
+    list_display = ("day", "signups", "jobs_posted", "applications")
+    date_hierarchy = "day"
+
+
+@admin.register(RollupWatermark)
+class RollupWatermarkAdmin(admin.ModelAdmin):
+    list_display = ("name", "last_id", "updated_at")
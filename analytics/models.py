@@ -0,0 +1,89 @@
+from django.db import models
+
+
+class DailyStats(models.Model):
+    """
+    Platform counts per day, rolled up by analytics.rollups.
+    """
+    day = models.DateField(unique=True)
+    signups = models.PositiveIntegerField(default=0)
+    jobs_posted = models.PositiveIntegerField(default=0)
+    applications = models.PositiveIntegerField(default=0)
+
+    KEY = ("day",)
+
+    class Meta:
+        ordering = ["day"]
+
+    def __str__(self):
+        return str(self.day)
+
+
+class DailyJobStats(models.Model):
+    """
+    Applications received per job and day. The job's category is
+    copied in so per-category series never join the jobs table.
+    """
+    day = models.DateField()
+    job = models.ForeignKey(
+        "jobs.Job",
+        on_delete=models.CASCADE,
+        related_name="daily_stats",
+    )
+    category = models.ForeignKey(
+        "categories.Category",
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="+",
+    )
+    applications = models.PositiveIntegerField(default=0)
+
+    KEY = ("day", "job_id")
+
+    class Meta:
+        ordering = ["day"]
+        constraints = [
+            models.UniqueConstraint(fields=["job", "day"], name="analytics_job_day_uniq"),
+        ]
+        indexes = [
+            models.Index(fields=["day", "category"], name="analytics_day_category_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.job_id} {self.day}"
+
+
+class JobStatusCount(models.Model):
+    """
+    Current number of applications per job and status.
+    """
+    job = models.ForeignKey(
+        "jobs.Job",
+        on_delete=models.CASCADE,
+        related_name="status_counts",
+    )
+    status = models.CharField(max_length=32)
+    count = models.IntegerField(default=0)
+
+    KEY = ("job_id", "status")
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["job", "status"], name="analytics_job_status_uniq"),
+        ]
+
+    def __str__(self):
+        return f"{self.job_id} {self.status}: {self.count}"
+
+
+class RollupWatermark(models.Model):
+    """
+    High-water mark of a rollup source: the last id rolled up.
+    """
+    name = models.CharField(max_length=64, primary_key=True)
+    last_id = models.BigIntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self):
+        return f"{self.name}: {self.last_id}"
@@ -0,0 +1,171 @@
+"""
+Incremental analytics rollups, maintained by Celery
+(analytics.tasks.update_rollups).
+
+Each source (signups, jobs posted, application status changes) is
+read past its RollupWatermark, in id order and in batches. A batch
+is aggregated with GROUP BY over its id range, added to the rollup
+tables and the watermark moved, all in one transaction, so a batch
+is counted exactly once. Rows newer than ANALYTICS_ROLLUP_LAG are
+left for the next run: ids are allocated before commit, so a
+transaction still in flight could otherwise commit a lower id
+behind the watermark.
+
+Application counts come from the append-only ApplicationStatusChange
+log: a creation adds to the day's applications and to its status,
+every later change moves one application between statuses.
+"""
+from collections import Counter
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from applications.models import ApplicationStatusChange
+from jobs.models import Job
+from users.models import User
+from .models import DailyJobStats, DailyStats, JobStatusCount, RollupWatermark
+
+
+def add_counts(model, field, deltas, defaults=None):
+    """
+    Add `deltas` ({key: n}, keys in model.KEY order) to `field`,
+    creating the missing rows (with `defaults[key]` fields).
+    """
+    deltas = {key: n for key, n in deltas.items() if n}
+    if not deltas:
+        return
+    lookups = {
+        f"{name}__in": {key[i] for key in deltas}
+        for i, name in enumerate(model.KEY)
+    }
+    existing = {
+        tuple(getattr(row, name) for name in model.KEY): row
+        for row in model.objects.filter(**lookups)
+    }
+    changed, created = [], []
+    for key, n in deltas.items():
+        row = existing.get(key)
+        if row is None:
+            row = model(**dict(zip(model.KEY, key)), **(defaults or {}).get(key, {}))
+            setattr(row, field, n)
+            created.append(row)
+        else:
+            setattr(row, field, getattr(row, field) + n)
+            changed.append(row)
+    model.objects.bulk_update(changed, [field])
+    model.objects.bulk_create(created)
+
+
+def per_day(queryset, time_field, *fields):
+    """
+    {(day, *fields): count} of `queryset`.
+    """
+    rows = (
+        queryset.annotate(day=TruncDate(time_field))
+        .values("day", *fields)
+        .annotate(n=Count("pk"))
+        .order_by()
+    )
+    return {(row["day"], *(row[name] for name in fields)): row["n"] for row in rows}
+
+
+def roll_signups(users):
+    add_counts(DailyStats, "signups", per_day(users, "date_joined"))
+
+
+def roll_jobs(jobs):
+    add_counts(DailyStats, "jobs_posted", per_day(jobs, "created_at"))
+
+
+def roll_status_changes(changes):
+    created = per_day(changes.filter(from_status=""), "changed_at", "job_id")
+    daily = Counter()
+    for (day, _), n in created.items():
+        daily[(day,)] += n
+    add_counts(DailyStats, "applications", daily)
+
+    moves = Counter()
+    for row in (
+        changes.values("job_id", "from_status", "to_status")
+        .annotate(n=Count("pk")).order_by()
+    ):
+        if row["from_status"]:
+            moves[(row["job_id"], row["from_status"])] -= row["n"]
+        if row["to_status"]:
+            moves[(row["job_id"], row["to_status"])] += row["n"]
+
+    # deleted jobs took their rollups with them
+    job_ids = {job_id for _, job_id in created} | {job_id for job_id, _ in moves}
+    categories = dict(
+        Job.objects.filter(pk__in=job_ids).values_list("pk", "category_id")
+    )
+    add_counts(
+        DailyJobStats,
+        "applications",
+        {key: n for key, n in created.items() if key[1] in categories},
+        defaults={key: {"category_id": categories.get(key[1])} for key in created},
+    )
+    add_counts(
+        JobStatusCount,
+        "count",
+        {key: n for key, n in moves.items() if key[0] in categories},
+    )
+
+
+# watermark name -> (source queryset, its time field, rollup function)
+SOURCES = {
+    "signups": (User.objects.all(), "date_joined", roll_signups),
+    "jobs": (Job.objects.all(), "created_at", roll_jobs),
+    "application_status_changes": (
+        ApplicationStatusChange.objects.all(), "changed_at", roll_status_changes
+    ),
+}
+
+
+def advance(name, batch_size=None, lag=None):
+    """
+    Roll up source `name` from its watermark; returns the number
+    of source rows rolled up.
+    """
+    queryset, time_field, roll = SOURCES[name]
+    batch_size = batch_size or getattr(settings, "ANALYTICS_ROLLUP_BATCH_SIZE", 5000)
+    if lag is None:
+        lag = getattr(settings, "ANALYTICS_ROLLUP_LAG", 60)
+    cutoff = timezone.now() - timedelta(seconds=lag)
+    RollupWatermark.objects.get_or_create(name=name)
+
+    rolled = 0
+    while True:
+        with transaction.atomic():
+            # one run per source at a time
+            mark = RollupWatermark.objects.select_for_update().get(name=name)
+            batch = list(
+                queryset.filter(pk__gt=mark.last_id)
+                .order_by("pk")
+                .values_list("pk", time_field)[:batch_size]
+            )
+            # stop at the first row inside the lag window
+            ready = 0
+            while ready < len(batch) and batch[ready][1] <= cutoff:
+                ready += 1
+            if not ready:
+                break
+            last_id = batch[ready - 1][0]
+            roll(queryset.filter(pk__gt=mark.last_id, pk__lte=last_id))
+            mark.last_id = last_id
+            mark.save(update_fields=["last_id", "updated_at"])
+        rolled += ready
+        if ready < batch_size:
+            break
+    return rolled
+
+
+def update_rollups(batch_size=None, lag=None):
+    """
+    Advance every source; {source name: rows rolled up}.
+    """
+    return {name: advance(name, batch_size, lag) for name in SOURCES}
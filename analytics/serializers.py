@@ -0,0 +1,24 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.utils import timezone
+from rest_framework import serializers
+
+
+class StatsRangeSerializer(serializers.Serializer):
+    """
+    Query parameters of the stats endpoints: an inclusive day range,
+    the last 30 days by default.
+    """
+    start = serializers.DateField(required=False)
+    end = serializers.DateField(required=False)
+
+    def validate(self, attrs):
+        end = attrs.get("end") or timezone.localdate()
+        start = attrs.get("start") or end - timedelta(days=29)
+        if start > end:
+            raise serializers.ValidationError("start must not be after end.")
+        limit = getattr(settings, "ANALYTICS_MAX_DAYS", 366)
+        if (end - start).days >= limit:
+            raise serializers.ValidationError(f"At most {limit} days per request.")
+        return {"start": start, "end": end}
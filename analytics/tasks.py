@@ -0,0 +1,23 @@
+"""
+Periodic analytics rollups, scheduled by Celery beat
+(see CELERY_BEAT_SCHEDULE in the settings).
+"""
+import logging
+
+from celery import shared_task
+
+from . import rollups
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def update_rollups():
+    """
+    Fold the signups, jobs and application status changes made
+    since the last run into the rollup tables.
+    """
+    rolled = rollups.update_rollups()
+    if any(rolled.values()):
+        logger.info("Rolled up %s", rolled)
+    return rolled
@@ -0,0 +1,47 @@
+from collections import Counter
+
+from django.test import TestCase, override_settings
+
+from applications.apply import apply_for_job
+from applications.models import Application
+from applications.transitions import transition_applications
+from jobs.models import Job
+from users.models import User
+from .models import DailyJobStats, DailyStats, JobStatusCount
+from .rollups import update_rollups
+
+LOCAL_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCAL_CACHE)
+class RollupTests(TestCase):
+    def test_incremental_rollups_match_live_counts(self):
+        job = Job.objects.create(
+            title="Backend Engineer", description="Build APIs", location="Remote",
+            job_type="full_time", company_name="Acme",
+            slug="https://example.com/jobs/backend-engineer",
+        )
+        users = [
+            User.objects.create_user(f"applicant{i}@example.com", "Ada", "Obi", "pw")
+            for i in range(4)
+        ]
+        for user in users[:3]:
+            apply_for_job(user, job.pk)
+        update_rollups(lag=0)
+
+        apply_for_job(users[3], job.pk)
+        transition_applications(
+            list(Application.objects.values_list("pk", flat=True)[:2]), "rejected"
+        )
+        update_rollups(lag=0)
+        # nothing new: nothing counted twice
+        self.assertEqual(update_rollups(lag=0), {
+            "signups": 0, "jobs": 0, "application_status_changes": 0,
+        })
+
+        day = DailyStats.objects.get()
+        self.assertEqual((day.signups, day.jobs_posted, day.applications), (4, 1, 4))
+        self.assertEqual(DailyJobStats.objects.get(job=job).applications, 4)
+        live = Counter(Application.objects.values_list("status", flat=True))
+        rolled = dict(JobStatusCount.objects.filter(count__gt=0).values_list("status", "count"))
+        self.assertEqual(rolled, dict(live))
@@ -0,0 +1,7 @@
+from rest_framework import routers
+from .views import StatsViewSet
+
+router = routers.DefaultRouter()
+router.register(r"analytics", StatsViewSet, basename="analytics")
+
+urlpatterns = router.urls
@@ -0,0 +1,93 @@
+from django.db.models import Sum
+from django.shortcuts import get_object_or_404
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
+from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from jobs.models import Job
+from users.permissions import IsAdmin
+from .models import DailyJobStats, DailyStats, JobStatusCount
+from .serializers import StatsRangeSerializer
+
+RANGE_PARAMETERS = [
+    openapi.Parameter(
+        "start", openapi.IN_QUERY, type=openapi.TYPE_STRING, format="date",
+        description="First day (default: 29 days before end)"),
+    openapi.Parameter(
+        "end", openapi.IN_QUERY, type=openapi.TYPE_STRING, format="date",
+        description="Last day (default: today)"),
+]
+
+
+def by_status(counts):
+    return dict(
+        counts.values_list("status").annotate(total=Sum("count"))
+        .filter(total__gt=0).order_by("status")
+    )
+
+
+class StatsViewSet(viewsets.ViewSet):
+    """
+    Platform and per-job statistics for admins, read from the
+    rollup tables only (see analytics.rollups); figures lag the
+    live data by up to one rollup interval.
+    """
+    permission_classes = [IsAdmin]
+
+    def get_range(self, request):
+        serializer = StatsRangeSerializer(data=request.query_params)
+        serializer.is_valid(raise_exception=True)
+        return serializer.validated_data["start"], serializer.validated_data["end"]
+
+    @swagger_auto_schema(
+        operation_summary="Daily signups, jobs posted and applications",
+        manual_parameters=RANGE_PARAMETERS,
+    )
+    @action(detail=False, methods=["get"])
+    def platform(self, request):
+        start, end = self.get_range(request)
+        days = DailyStats.objects.filter(day__range=(start, end))
+        fields = ("signups", "jobs_posted", "applications")
+        totals = days.aggregate(**{field: Sum(field) for field in fields})
+        categories = (
+            DailyJobStats.objects.filter(day__range=(start, end))
+            .values("category", "category__name")
+            .annotate(applications=Sum("applications"))
+            .order_by("-applications")
+        )
+        return Response({
+            "start": start,
+            "end": end,
+            "totals": {field: totals[field] or 0 for field in fields},
+            "daily": list(days.values("day", *fields)),
+            "applications_by_category": [
+                {
+                    "category": row["category"],
+                    "category_name": row["category__name"],
+                    "applications": row["applications"],
+                }
+                for row in categories
+            ],
+            "applications_by_status": by_status(JobStatusCount.objects.all()),
+        })
+
+    @swagger_auto_schema(
+        operation_summary="Daily applications and status counts of a job",
+        manual_parameters=RANGE_PARAMETERS,
+    )
+    @action(detail=False, methods=["get"], url_path=r"jobs/(?P<job_id>\d+)")
+    def job(self, request, job_id):
+        start, end = self.get_range(request)
+        job = get_object_or_404(Job.objects.only("pk", "title"), pk=job_id)
+        days = DailyJobStats.objects.filter(job=job, day__range=(start, end))
+        return Response({
+            "job": job.pk,
+            "title": job.title,
+            "start": start,
+            "end": end,
+            "applications": days.aggregate(total=Sum("applications"))["total"] or 0,
+            "daily": list(days.values("day", "applications")),
+            "applications_by_status": by_status(job.status_counts.all()),
+        })
@@ -0,0 +1,97 @@
+"""
+Per-user cached set of the jobs a user has applied to (withdrawn
+applications excluded), so job cards can carry `has_applied`
+without a query per card, or per request on a warm cache.
+
+The set is cached under the user's id with the time it was built.
+Applying, withdrawing and deleting an application drop the entry
+once their transaction commits; APPLIED_SET_TIMEOUT bounds how long
+a set built concurrently with such a write can stay stale.
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.cache import quote_etag
+
+from .models import Application
+
+APPLIED_KEY = "applied:{user_id}"
+
+
+def get_applied_set(user):
+    """
+    (build time in ns, frozenset of job ids) of `user`.
+    """
+    key = APPLIED_KEY.format(user_id=user.pk)
+    entry = cache.get(key)
+    if entry is None:
+        job_ids = (
+            Application.objects.filter(user=user)
+            .exclude(status=Application.STATUS_WITHDRAWN)
+            .values_list("job_id", flat=True)
+        )
+        entry = (time.time_ns(), frozenset(job_ids))
+        cache.set(key, entry, getattr(settings, "APPLIED_SET_TIMEOUT", 3600))
+    return entry
+
+
+def forget_applied_set(user_id):
+    """
+    Drop the cached set of `user_id` once the current transaction
+    (if any) commits.
+    """
+    transaction.on_commit(lambda: cache.delete(APPLIED_KEY.format(user_id=user_id)))
+
+
+class HasAppliedMixin:
+    """
+    Adds `has_applied` to the job cards of `has_applied_actions` for
+    the requesting user. It runs after the response cache, which is
+    shared by every user of a class, and folds the applied set into
+    the conditional-GET validators (combine with ConditionalGetMixin).
+    """
+    has_applied_actions = ("list", "retrieve", "similar")
+
+    def wants_has_applied(self, request):
+        return (
+            self.action in self.has_applied_actions
+            and request.user
+            and request.user.is_authenticated
+        )
+
+    def get_validators(self, request):
+        etag, last_modified = super().get_validators(request)
+        if not self.wants_has_applied(request):
+            return etag, last_modified
+        built_at, job_ids = get_applied_set(request.user)
+        etag = quote_etag(
+            hashlib.sha1(repr((etag, built_at)).encode("utf-8")).hexdigest()
+        )
+        return etag, max(last_modified or 0, built_at // 1_000_000_000)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        if response.status_code != 200 or not self.wants_has_applied(request):
+            return response
+
+        _, job_ids = get_applied_set(request.user)
+        data = response.data
+        if isinstance(data, dict) and "results" in data:
+            data = {**data, "results": self.mark_applied(data["results"], job_ids)}
+        elif isinstance(data, list):
+            data = self.mark_applied(data, job_ids)
+        elif isinstance(data, dict) and "id" in data:
+            data = {**data, "has_applied": data["id"] in job_ids}
+        response.data = data
+        return response
+
+    @staticmethod
+    def mark_applied(cards, job_ids):
+        # the cached cards are shared: copies, never mutated in place
+        return [
+            {**card, "has_applied": card["id"] in job_ids} if "id" in card else card
+            for card in cards
+        ]
@@ -0,0 +1,116 @@
+"""
+Creating an application in a single round trip.
+
+On PostgreSQL one statement checks that the job is open (active and
+not expired), inserts the application with ON CONFLICT DO NOTHING
+on the (job, user) unique index and, when a row was inserted, logs
+it in ApplicationStatusChange and bumps the stored applications
+counter of the job and its listing. A concurrent double submit
+therefore waits on the unique index and comes back as a duplicate
+instead of an IntegrityError.
+
+Other databases take the equivalent ORM path inside a transaction.
+"""
+from django.db import IntegrityError, connections, router, transaction
+from django.utils import timezone
+
+from jobs.models import Job, JobListing, unexpired
+from remosphere.cache import bump_generation
+from .applied import forget_applied_set
+from .models import Application, ApplicationStatusChange
+
+APPLIED = "applied"
+DUPLICATE = "duplicate"
+UNAVAILABLE = "unavailable"
+
+APPLY_SQL = """
+WITH open_job AS (
+    SELECT id FROM {job}
+    WHERE id = %(job_id)s AND is_active AND (expiry_at IS NULL OR expiry_at > %(now)s)
+), inserted AS (
+    INSERT INTO {application} (job_id, user_id, resume_url, status, applied_at)
+    SELECT id, %(user_id)s, %(resume_url)s, %(status)s, %(now)s FROM open_job
+    ON CONFLICT (job_id, user_id) DO NOTHING
+    RETURNING id
+), logged AS (
+    INSERT INTO {log} (application_id, job_id, from_status, to_status, changed_at)
+    SELECT id, %(job_id)s, '', %(status)s, %(now)s FROM inserted
+), counted AS (
+    UPDATE {job} SET applications_count = applications_count + 1
+    WHERE id = %(job_id)s AND EXISTS (SELECT 1 FROM inserted)
+), listed AS (
+    UPDATE {listing} SET applications_count = applications_count + 1
+    WHERE id = %(job_id)s AND EXISTS (SELECT 1 FROM inserted)
+)
+SELECT (SELECT id FROM inserted), EXISTS (SELECT 1 FROM open_job)
+"""
+
+
+def apply_for_job(user, job_id, resume_url=None):
+    """
+    (outcome, application): APPLIED with the new Application,
+    DUPLICATE if the user already applied, UNAVAILABLE if the job
+    does not exist or is closed; the application is None for both.
+    """
+    application = Application(
+        job_id=job_id,
+        user_id=user.pk,
+        resume_url=resume_url,
+        status=Application.STATUS_PENDING,
+        applied_at=timezone.now(),
+    )
+    db = router.db_for_write(Application)
+    if connections[db].vendor == "postgresql":
+        outcome = _insert(application, db)
+    else:
+        outcome = _create(application)
+    if outcome == APPLIED:
+        bump_generation(Job)
+        forget_applied_set(user.pk)
+        return outcome, application
+    return outcome, None
+
+
+def _insert(application, db):
+    sql = APPLY_SQL.format(
+        job=Job._meta.db_table,
+        application=Application._meta.db_table,
+        listing=JobListing._meta.db_table,
+        log=ApplicationStatusChange._meta.db_table,
+    )
+    params = {
+        "job_id": application.job_id,
+        "user_id": application.user_id,
+        "resume_url": application.resume_url,
+        "status": application.status,
+        "now": application.applied_at,
+    }
+    with connections[db].cursor() as cursor:
+        cursor.execute(sql, params)
+        application_id, job_open = cursor.fetchone()
+    if application_id is not None:
+        application.pk = application_id
+        application._state.adding = False
+        application._state.db = db
+        return APPLIED
+    return DUPLICATE if job_open else UNAVAILABLE
+
+
+def _create(application):
+    with transaction.atomic():
+        job_open = Job.objects.filter(
+            unexpired(application.applied_at), pk=application.job_id, is_active=True
+        ).exists()
+        if not job_open:
+            return UNAVAILABLE
+        try:
+            with transaction.atomic():
+                application.save(force_insert=True)
+        except IntegrityError:
+            return DUPLICATE
+        Job.adjust_applications_count(application.job_id, 1)
+        ApplicationStatusChange.record(
+            [(application.pk, application.job_id, "", application.status)],
+            now=application.applied_at,
+        )
+    return APPLIED
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class ApplicationsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'applications'
+
+    def ready(self):
+        """
+        Registering the signals that keep the applications
+        counters and status log in step with user deletes
+        """
+        import applications.signals
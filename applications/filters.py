@@ -0,0 +1,30 @@
+import django_filters
+from .models import Application
+
+
+class CharInFilter(django_filters.BaseInFilter, django_filters.CharFilter):
+    pass
+
+
+class ApplicationFilter(django_filters.FilterSet):
+    """
+    Filtering of applications by:
+
+    - status (comma separated, e.g. `status=applied,shortlisted`)
+    - job
+    - applicant
+    - application date range
+
+    Served by the composite indexes on Application.
+    """
+    status = CharInFilter(field_name="status")
+    applied_after = django_filters.IsoDateTimeFilter(
+        field_name="applied_at", lookup_expr="gte"
+    )
+    applied_before = django_filters.IsoDateTimeFilter(
+        field_name="applied_at", lookup_expr="lt"
+    )
+
+    class Meta:
+        model = Application
+        fields = ["status", "job", "user", "applied_after", "applied_before"]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:56
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+def log_existing_applications(apps, schema_editor):
+    """
+    Existing applications enter the log as created in their current
+    status, on the day they were applied, in one INSERT ... SELECT.
+    """
+    Application = apps.get_model("applications", "Application")
+    ApplicationStatusChange = apps.get_model("applications", "ApplicationStatusChange")
+    with schema_editor.connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {ApplicationStatusChange._meta.db_table} "
+            "(application_id, job_id, from_status, to_status, changed_at) "
+            f"SELECT id, job_id, '', status, applied_at FROM {Application._meta.db_table} "
+            "ORDER BY id"
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0002_listing_indexes'),
+        ('jobs', '0011_normalized_location'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ApplicationStatusChange',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('from_status', models.CharField(blank=True, default='', max_length=32)),
+                ('to_status', models.CharField(blank=True, default='', max_length=32)),
+                ('changed_at', models.DateTimeField(default=django.utils.timezone.now)),
+                ('application', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='status_changes', to='applications.application')),
+                ('job', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='jobs.job')),
+            ],
+        ),
+        migrations.RunPython(log_existing_applications, migrations.RunPython.noop),
+    ]
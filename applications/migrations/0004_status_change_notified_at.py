@@ -0,0 +1,32 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:59
+
+from django.db import migrations, models
+from django.db.models import F
+
+
+def mark_history_notified(apps, schema_editor):
+    """
+    Changes made before digests existed are not emailed now.
+    """
+    ApplicationStatusChange = apps.get_model("applications", "ApplicationStatusChange")
+    ApplicationStatusChange.objects.update(notified_at=F("changed_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('applications', '0003_status_change_log'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='applicationstatuschange',
+            name='notified_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(mark_history_notified, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='applicationstatuschange',
+            index=models.Index(condition=models.Q(('notified_at__isnull', True), ('to_status__in', ['shortlisted', 'rejected'])), fields=['changed_at'], name='application_change_unsent_idx'),
+        ),
+    ]
@@ -21,6 +21,17 @@ class Application(models.Model):
         (STATUS_PENDING, "Pending"),
     ]
 
+    # status moves an admin may make; withdrawn belongs to the applicant
+    ALLOWED_TRANSITIONS = {
+        STATUS_PENDING: {STATUS_SHORTLISTED, STATUS_REJECTED},
+        STATUS_APPLIED: {STATUS_SHORTLISTED, STATUS_REJECTED},
+        STATUS_SHORTLISTED: {STATUS_REJECTED},
+        STATUS_REJECTED: {STATUS_SHORTLISTED},
+    }
+    REVIEW_STATUSES = [STATUS_SHORTLISTED, STATUS_REJECTED]
+    # changes the applicant is emailed about (in a digest)
+    NOTIFY_STATUSES = REVIEW_STATUSES
+
     job = models.ForeignKey(
         "jobs.Job",
         on_delete=models.CASCADE,
@@ -45,6 +56,80 @@ class Application(models.Model):
         #     models.UniqueConstraint(fields=["job", "user"], name="unique_job_user_application")
         # ]
         unique_together = ("job", "user")  # prevents duplicate applications
+        # keyset pagination seeks on (applied_at, id) under each filter
+        indexes = [
+            models.Index(fields=["-applied_at", "-id"], name="application_applied_id_idx"),
+            models.Index(
+                fields=["status", "-applied_at", "-id"],
+                name="application_status_applied_idx",
+            ),
+            models.Index(
+                fields=["user", "-applied_at", "-id"],
+                name="application_user_applied_idx",
+            ),
+            models.Index(fields=["job", "status"], name="application_job_status_idx"),
+        ]
 
     def __str__(self):
         return f"{self.user_id} -> {self.job_id} ({self.status})"
+
+
+class ApplicationStatusChange(models.Model):
+    """
+    Append-only log of application status changes, read by the
+    analytics rollups and the applicant digests. Creation is logged
+    with an empty from_status, deletion with an empty to_status.
+    The references are plain ids (no constraint, no cascade), so
+    the log outlives deleted rows.
+    """
+    application = models.ForeignKey(
+        Application,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="status_changes",
+    )
+    job = models.ForeignKey(
+        "jobs.Job",
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+    )
+    from_status = models.CharField(max_length=32, blank=True, default="")
+    to_status = models.CharField(max_length=32, blank=True, default="")
+    changed_at = models.DateTimeField(default=timezone.now)
+    # set once the applicant's digest covering it was sent
+    notified_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # the digest queue: small, whatever the size of the log
+            models.Index(
+                fields=["changed_at"],
+                condition=models.Q(
+                    notified_at__isnull=True,
+                    to_status__in=Application.NOTIFY_STATUSES,
+                ),
+                name="application_change_unsent_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.application_id}: {self.from_status or '-'} -> {self.to_status or '-'}"
+
+    @classmethod
+    def record(cls, changes, now=None):
+        """
+        Log (application_id, job_id, from_status, to_status) tuples
+        in one INSERT. Call it inside the transaction of the change.
+        """
+        now = now or timezone.now()
+        return cls.objects.bulk_create([
+            cls(
+                application_id=application_id,
+                job_id=job_id,
+                from_status=from_status,
+                to_status=to_status,
+                changed_at=now,
+            )
+            for application_id, job_id, from_status, to_status in changes
+        ])
@@ -1,49 +1,30 @@
+from django.conf import settings
 from rest_framework import serializers
 from .models import Application
+from jobs.models import Job
 from jobs.serializers import JobSerializer  # optional nested job view
 from users.serializers import UserSerializer  # optional nested user view
-from jobs.models import Job
 
 
 class ApplicationCreateSerializer(serializers.ModelSerializer):
-    # Accept job as ID
+    # Accept job as ID; whether it is open (and not applied to yet)
+    # is checked by the INSERT itself, see applications.apply
     # job = serializers.PrimaryKeyRelatedField(queryset=None)
+    job = serializers.IntegerField(source="job_id", min_value=1)
 
     class Meta:
         model = Application
         fields = ["id", "job", "resume_url", "status", "applied_at"]
         read_only_fields = ["id", "status", "applied_at"]
 
-    def __init__(self, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        # avoid circular import at module load
-        # from jobs.models import Job
-        self.fields["job"].queryset = Job.objects.filter(
-            is_active=True)  # Job.objects.all()
-
     def validate(self, attrs):
         user = self.context["request"].user
-        job = attrs["job"]
 
         if not user or not user.is_authenticated:
             raise serializers.ValidationError("Authentication required.")
 
-        # optionally: disallow applying if job is inactive
-        if not job.is_active:
-            raise serializers.ValidationError(
-                "Cannot apply to an inactive job.")
-
-        # check existing application
-        if Application.objects.filter(job=job, user=user).exists():
-            raise serializers.ValidationError(
-                "You have already applied for this job.")
-
         return attrs
 
-    def create(self, validated_data):
-        user = self.context["request"].user
-        return Application.objects.create(user=user, **validated_data)
-
 
 class ApplicationDetailSerializer(serializers.ModelSerializer):
     # job = JobSerializer(read_only=True)
@@ -60,3 +41,51 @@ class ApplicationDetailSerializer(serializers.ModelSerializer):
     def get_user(self, obj):
         # keep small user representation (email + id)
         return {"id": obj.user_id, "email": getattr(obj.user, "email", None)}
+
+
+class JobSummarySerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Job
+        fields = [
+            "id",
+            "title",
+            "slug",
+            "company_name",
+            "location",
+            "job_type",
+            "salary_range",
+            "is_active",
+            "expiry_at",
+        ]
+        read_only_fields = fields
+
+
+class MyApplicationSerializer(serializers.ModelSerializer):
+    """
+    An applicant's own application with the job card it is for.
+    """
+    job = JobSummarySerializer(read_only=True)
+
+    # Job columns read by the joined query
+    JOB_FIELDS = JobSummarySerializer.Meta.fields
+
+    class Meta:
+        model = Application
+        fields = ["id", "status", "applied_at", "resume_url", "job"]
+        read_only_fields = fields
+
+
+class ApplicationTransitionSerializer(serializers.Serializer):
+    """
+    Body of the bulk status transition: application ids and a target.
+    """
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1), allow_empty=False
+    )
+    status = serializers.ChoiceField(choices=Application.REVIEW_STATUSES)
+
+    def validate_ids(self, ids):
+        limit = getattr(settings, "APPLICATION_TRANSITION_MAX_ITEMS", 500)
+        if len(ids) > limit:
+            raise serializers.ValidationError(f"At most {limit} applications per request.")
+        return ids
@@ -0,0 +1,32 @@
+from collections import Counter
+
+from django.db.models.signals import pre_delete
+from django.dispatch import receiver
+
+from jobs.models import Job
+from users.models import User
+from .models import Application, ApplicationStatusChange
+
+
+@receiver(pre_delete, sender=User)
+def retire_user_applications(sender, instance, **kwargs):
+    """
+    Deleting a user cascades to their applications outside the API
+    write paths: decrement the stored counters of their live
+    applications and log the deletions (see the analytics rollups),
+    as ApplicationViewSet.perform_destroy does.
+    """
+    applications = list(
+        Application.objects.filter(user=instance).values_list("pk", "job_id", "status")
+    )
+    if not applications:
+        return
+    ApplicationStatusChange.record(
+        [(pk, job_id, status, "") for pk, job_id, status in applications]
+    )
+    live = Counter(
+        job_id for _, job_id, status in applications
+        if status != Application.STATUS_WITHDRAWN
+    )
+    for job_id, n in live.items():
+        Job.adjust_applications_count(job_id, -n)
@@ -0,0 +1,144 @@
+"""
+Applicant notifications, sent by Celery beat
+(see CELERY_BEAT_SCHEDULE in the settings).
+
+Status changes are only logged on the write path (one INSERT into
+ApplicationStatusChange, in the same transaction). A periodic task
+coalesces each applicant's unsent changes into one digest email,
+once their oldest change has waited APPLICATION_DIGEST_WINDOW
+seconds, so a bulk triage sends one email per applicant.
+"""
+import logging
+from datetime import timedelta
+
+from celery import shared_task
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.db.models import Exists, Min, OuterRef
+from django.utils import timezone
+
+from .models import Application, ApplicationStatusChange
+
+logger = logging.getLogger(__name__)
+
+STATUS_MESSAGES = {
+    Application.STATUS_SHORTLISTED: "Good news: you have been shortlisted",
+    Application.STATUS_REJECTED: "Your application was not selected this time",
+}
+
+
+def digest_message(email, first_name, updates):
+    """
+    The digest of one applicant; `updates` are
+    (status, job title, company name) tuples.
+    """
+    lines = [
+        f"- {job_title} at {company_name}: "
+        f"{STATUS_MESSAGES.get(status, f'your application is now {status}')}"
+        for status, job_title, company_name in updates
+    ]
+    subject = (
+        f"RemoSphere — Update on your application for {updates[0][1]}"
+        if len(updates) == 1
+        else f"RemoSphere — Updates on {len(updates)} of your applications"
+    )
+    body = (
+        f"Hi {first_name},\n\n"
+        "There is news about your applications:\n\n"
+        + "\n".join(lines)
+        + "\n\nCheers,\nThe RemoSphere Team"
+    )
+    return EmailMessage(subject, body, settings.DEFAULT_FROM_EMAIL, [email])
+
+
+@shared_task(bind=True, max_retries=3)
+def send_status_digests(self, batch_size=None):
+    """
+    Email every applicant whose oldest unsent status change is past
+    the coalescing window one digest of all their unsent changes,
+    a batch of applicants per SMTP connection. Changes are marked
+    notified in the transaction that sent them; locked ones (another
+    worker) are skipped, and those of applications withdrawn or
+    deleted since are dropped.
+    """
+    batch_size = batch_size or getattr(settings, "APPLICATION_DIGEST_BATCH_SIZE", 200)
+    window = getattr(settings, "APPLICATION_DIGEST_WINDOW", 900)
+    now = timezone.now()
+    unsent = ApplicationStatusChange.objects.filter(
+        notified_at__isnull=True,
+        to_status__in=Application.NOTIFY_STATUSES,
+    )
+
+    # changes of applications deleted since (admin delete, job or
+    # user cascades) match no applicant: retire them so they do not
+    # stay in the unsent index forever
+    unsent.filter(
+        ~Exists(Application.objects.filter(pk=OuterRef("application_id")))
+    ).update(notified_at=now)
+
+    sent = 0
+    done = set()
+    while True:
+        with transaction.atomic():
+            due = list(
+                unsent.exclude(application__user__in=done)
+                .values("application__user")
+                .annotate(first=Min("changed_at"))
+                .filter(first__lte=now - timedelta(seconds=window))
+                .order_by("first")
+                .values_list("application__user", flat=True)[:batch_size]
+            )
+            if not due:
+                break
+            rows = list(
+                unsent.filter(application__user__in=due)
+                .select_for_update(skip_locked=True, of=("self",))
+                .order_by("changed_at", "pk")
+                .values_list(
+                    "pk",
+                    "application_id",
+                    "to_status",
+                    "application__status",
+                    "application__user__email",
+                    "application__user__first_name",
+                    "application__job__title",
+                    "application__job__company_name",
+                )
+            )
+
+            # the latest change of each application wins; withdrawn
+            # ones are marked notified without an email
+            digests = {}
+            for _, application_id, status, current, email, first_name, title, company in rows:
+                if current == Application.STATUS_WITHDRAWN:
+                    continue
+                applicant = digests.setdefault((email, first_name), {})
+                applicant[application_id] = (status, title, company)
+            messages = [
+                digest_message(email, first_name, list(updates.values()))
+                for (email, first_name), updates in digests.items()
+            ]
+            if messages:
+                try:
+                    # one connection for the whole batch
+                    get_connection(fail_silently=False).send_messages(messages)
+                except Exception as exc:
+                    logger.exception(
+                        "send_status_digests failed for %s applicants", len(messages)
+                    )
+                    # retry with exponential backoff; nothing was marked sent
+                    raise self.retry(exc=exc, countdown=60 * 2 ** self.request.retries)
+            ApplicationStatusChange.objects.filter(
+                pk__in=[row[0] for row in rows]
+            ).update(notified_at=now)
+
+        sent += len(messages)
+        # users whose changes another worker holds are left to it
+        done.update(due)
+        if len(due) < batch_size:
+            break
+
+    if sent:
+        logger.info("Sent %s application status digests", sent)
+    return sent
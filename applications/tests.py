@@ -1,3 +1,339 @@
-from django.test import TestCase
+import threading
+import unittest
+from datetime import timedelta
 
-# Create your tests here.
+from django.conf import settings
+from django.core import mail
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from jobs.models import Job, JobListing
+from users.models import User
+from .apply import APPLIED, DUPLICATE, apply_for_job
+from .models import Application, ApplicationStatusChange
+from .tasks import send_status_digests
+
+LOCAL_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+def make_job(**kwargs):
+    fields = {
+        "title": "Backend Engineer",
+        "description": "Build APIs",
+        "location": "Remote",
+        "job_type": "full_time",
+        "company_name": "Acme",
+        "slug": "https://example.com/jobs/backend-engineer",
+    }
+    fields.update(kwargs)
+    return Job.objects.create(**fields)
+
+
+@override_settings(CACHES=LOCAL_CACHE)
+class ApplyTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("applicant@example.com", "Ada", "Obi", "pw")
+        self.job = make_job()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def apply(self, job_id):
+        return self.client.post("/api/applications/", {"job": job_id}, format="json")
+
+    def test_apply_then_duplicate(self):
+        response = self.apply(self.job.pk)
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.data["job"], self.job.pk)
+        self.assertEqual(response.data["status"], Application.STATUS_PENDING)
+
+        response = self.apply(self.job.pk)
+        self.assertEqual(response.status_code, 409)
+        self.assertEqual(Application.objects.filter(job=self.job).count(), 1)
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.applications_count, 1)
+        self.assertEqual(JobListing.objects.get(pk=self.job.pk).applications_count, 1)
+
+    def test_closed_or_missing_job(self):
+        closed = make_job(slug="https://example.com/jobs/closed", is_active=False)
+        self.assertEqual(self.apply(closed.pk).status_code, 400)
+        self.assertEqual(self.apply(closed.pk + 1000).status_code, 400)
+        self.assertFalse(Application.objects.exists())
+
+
+@override_settings(CACHES=LOCAL_CACHE)
+class MyApplicationsTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create_user("applicant@example.com", "Ada", "Obi", "pw")
+        self.job = make_job()
+        self.client = APIClient()
+        self.client.force_authenticate(self.user)
+
+    def has_applied(self):
+        return self.client.get(f"/api/jobs/{self.job.pk}/").data["has_applied"]
+
+    def test_has_applied_follows_apply_and_withdraw(self):
+        self.assertFalse(self.has_applied())
+        # the cached set is dropped once the write commits
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.post("/api/applications/", {"job": self.job.pk}, format="json")
+        self.assertTrue(self.has_applied())
+
+        application = Application.objects.get(user=self.user)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.client.delete(f"/api/applications/{application.pk}/")
+        self.assertFalse(self.has_applied())
+
+    def test_mine_embeds_job_summary(self):
+        self.client.post("/api/applications/", {"job": self.job.pk}, format="json")
+        response = self.client.get("/api/applications/mine/")
+        self.assertEqual(response.status_code, 200)
+        [application] = response.data["results"]
+        self.assertEqual(application["job"]["title"], self.job.title)
+        self.assertEqual(application["job"]["slug"], self.job.slug)
+
+
+@override_settings(CACHES=LOCAL_CACHE)
+class ApplicationsCountTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser("admin@example.com", "Ada", "Admin", "pw")
+        self.job = make_job()
+        self.users = [
+            User.objects.create_user(f"applicant{i}@example.com", "Ada", "Obi", "pw")
+            for i in range(4)
+        ]
+        self.client = APIClient()
+
+    def as_user(self, user):
+        self.client.force_authenticate(user)
+        return self.client
+
+    def assertCounted(self, expected):
+        live = Application.objects.filter(job=self.job).exclude(
+            status=Application.STATUS_WITHDRAWN
+        ).count()
+        self.job.refresh_from_db()
+        self.assertEqual(
+            (live, self.job.applications_count,
+             JobListing.objects.get(pk=self.job.pk).applications_count),
+            (expected,) * 3,
+        )
+
+    def test_counter_follows_every_write_path(self):
+        for user in self.users:
+            self.as_user(user).post("/api/applications/", {"job": self.job.pk}, format="json")
+        self.assertCounted(4)
+        first, second, third, _ = [
+            Application.objects.get(user=user) for user in self.users
+        ]
+
+        self.as_user(self.users[0]).delete(f"/api/applications/{first.pk}/")
+        self.assertCounted(3)
+        self.as_user(self.admin).delete(f"/api/applications/{second.pk}/")
+        self.assertCounted(2)
+        # cascades: a live application, then a withdrawn one
+        self.users[2].delete()
+        self.assertCounted(1)
+        self.users[0].delete()
+        self.assertCounted(1)
+
+        # the deletions are logged for the analytics rollups
+        self.assertEqual(
+            set(ApplicationStatusChange.objects.filter(to_status="").values_list(
+                "application_id", "from_status"
+            )),
+            {
+                (second.pk, Application.STATUS_PENDING),
+                (third.pk, Application.STATUS_PENDING),
+                (first.pk, Application.STATUS_WITHDRAWN),
+            },
+        )
+
+
+@override_settings(CACHES=LOCAL_CACHE)
+class TransitionTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser("admin@example.com", "Ada", "Admin", "pw")
+        self.job = make_job()
+        self.applications = [
+            Application.objects.create(
+                job=self.job,
+                user=User.objects.create_user(f"applicant{i}@example.com", "Ada", "Obi", "pw"),
+                status=status,
+            )
+            for i, status in enumerate(["pending", "withdrawn", "shortlisted"])
+        ]
+        self.client = APIClient()
+        self.client.force_authenticate(self.admin)
+
+    def test_bulk_shortlist(self):
+        ids = [application.pk for application in self.applications]
+        response = self.client.post(
+            "/api/applications/transition/",
+            {"ids": ids + [ids[-1] + 1000], "status": "shortlisted"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["updated"], 1)
+        self.assertEqual(
+            [result["result"] for result in response.data["results"]],
+            ["updated", "invalid_transition", "unchanged", "not_found"],
+        )
+        self.assertEqual(
+            list(Application.objects.order_by("pk").values_list("status", flat=True)),
+            ["shortlisted", "withdrawn", "shortlisted"],
+        )
+        # logged for the applicant's digest
+        self.assertEqual(
+            ApplicationStatusChange.objects.filter(
+                application=self.applications[0], to_status="shortlisted"
+            ).count(),
+            1,
+        )
+
+    def test_admin_only(self):
+        self.client.force_authenticate(self.applications[0].user)
+        response = self.client.post(
+            "/api/applications/transition/",
+            {"ids": [self.applications[0].pk], "status": "rejected"},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 403)
+
+
+@override_settings(CACHES=LOCAL_CACHE)
+class StatusDigestTests(TestCase):
+    def setUp(self):
+        self.admin = User.objects.create_superuser("admin@example.com", "Ada", "Admin", "pw")
+        self.ada = User.objects.create_user("ada@example.com", "Ada", "Obi", "pw")
+        self.bola = User.objects.create_user("bola@example.com", "Bola", "Ade", "pw")
+        jobs = [
+            make_job(title=f"Engineer {i}", slug=f"https://example.com/jobs/{i}")
+            for i in range(2)
+        ]
+        self.applications = [
+            Application.objects.create(job=job, user=user)
+            for job, user in [(jobs[0], self.ada), (jobs[1], self.ada), (jobs[0], self.bola)]
+        ]
+        self.client = APIClient()
+
+    def transition(self, applications, status):
+        self.client.force_authenticate(self.admin)
+        response = self.client.post(
+            "/api/applications/transition/",
+            {"ids": [application.pk for application in applications], "status": status},
+            format="json",
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def age_changes(self):
+        window = timedelta(seconds=settings.APPLICATION_DIGEST_WINDOW + 1)
+        ApplicationStatusChange.objects.update(changed_at=timezone.now() - window)
+
+    def test_one_digest_per_applicant_with_latest_statuses(self):
+        self.transition(self.applications, "shortlisted")
+        self.transition(self.applications[:1], "rejected")
+        # within the window nothing is sent
+        self.assertEqual(send_status_digests(), 0)
+
+        self.age_changes()
+        self.assertEqual(send_status_digests(), 2)
+        digests = {message.to[0]: message.body for message in mail.outbox}
+        self.assertEqual(set(digests), {"ada@example.com", "bola@example.com"})
+        ada = digests["ada@example.com"]
+        self.assertIn("Engineer 0 at Acme: Your application was not selected", ada)
+        self.assertIn("Engineer 1 at Acme: Good news", ada)
+        self.assertNotIn("Engineer 0 at Acme: Good news", ada)
+        self.assertFalse(ApplicationStatusChange.objects.filter(
+            to_status__in=Application.NOTIFY_STATUSES, notified_at__isnull=True
+        ).exists())
+
+        self.assertEqual(send_status_digests(), 0)
+        self.assertEqual(len(mail.outbox), 2)
+
+    def test_withdrawn_applications_are_not_announced(self):
+        self.transition(self.applications[2:], "shortlisted")
+        self.client.force_authenticate(self.bola)
+        self.assertEqual(
+            self.client.delete(f"/api/applications/{self.applications[2].pk}/").status_code, 200
+        )
+
+        self.age_changes()
+        self.assertEqual(send_status_digests(), 0)
+        self.assertEqual(mail.outbox, [])
+        self.assertFalse(ApplicationStatusChange.objects.filter(
+            to_status="shortlisted", notified_at__isnull=True
+        ).exists())
+
+    def test_changes_of_deleted_applications_are_retired(self):
+        self.transition(self.applications, "shortlisted")
+        # admin delete, then a user cascade
+        self.client.force_authenticate(self.admin)
+        self.client.delete(f"/api/applications/{self.applications[0].pk}/")
+        self.bola.delete()
+
+        self.age_changes()
+        self.assertEqual(send_status_digests(), 1)
+        self.assertEqual([message.to for message in mail.outbox], [["ada@example.com"]])
+        self.assertFalse(ApplicationStatusChange.objects.filter(
+            to_status__in=Application.NOTIFY_STATUSES, notified_at__isnull=True
+        ).exists())
+
+
+@unittest.skipUnless(connection.vendor == "postgresql", "needs concurrent connections")
+@override_settings(CACHES=LOCAL_CACHE)
+class ConcurrentApplyTests(TransactionTestCase):
+    """
+    Parallel applies at one job, each from its own connection.
+    """
+    threads = 8
+
+    def setUp(self):
+        self.job = make_job()
+
+    def run_parallel(self, users):
+        barrier = threading.Barrier(len(users))
+        outcomes = []
+        errors = []
+
+        def worker(user):
+            try:
+                barrier.wait()
+                outcomes.append(apply_for_job(user, self.job.pk)[0])
+            except Exception as exc:  # noqa: BLE001 (reported below)
+                errors.append(exc)
+            finally:
+                connection.close()
+
+        workers = [threading.Thread(target=worker, args=(user,)) for user in users]
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+        self.assertEqual(errors, [])
+        return outcomes
+
+    def test_double_submit_applies_once(self):
+        user = User.objects.create_user("applicant@example.com", "Ada", "Obi", "pw")
+        outcomes = self.run_parallel([user] * self.threads)
+
+        self.assertEqual(outcomes.count(APPLIED), 1)
+        self.assertEqual(outcomes.count(DUPLICATE), self.threads - 1)
+        self.assertEqual(Application.objects.filter(job=self.job, user=user).count(), 1)
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.applications_count, 1)
+
+    def test_parallel_applicants_are_all_counted(self):
+        users = [
+            User.objects.create_user(f"applicant{i}@example.com", "Ada", "Obi", "pw")
+            for i in range(self.threads)
+        ]
+        outcomes = self.run_parallel(users)
+
+        self.assertEqual(outcomes, [APPLIED] * self.threads)
+        self.job.refresh_from_db()
+        self.assertEqual(self.job.applications_count, self.threads)
+        self.assertEqual(
+            JobListing.objects.get(pk=self.job.pk).applications_count, self.threads
+        )
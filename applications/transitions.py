@@ -0,0 +1,56 @@
+"""
+Bulk status transitions of applications (admin review).
+
+The selected rows are locked and read in one query, each id gets an
+outcome, and every allowed move is applied by one set-based UPDATE
+(and logged by one INSERT into ApplicationStatusChange). The
+applicants hear about it in their next digest email
+(applications.tasks.send_status_digests).
+"""
+from django.db import transaction
+
+from .models import Application, ApplicationStatusChange
+
+UPDATED = "updated"
+UNCHANGED = "unchanged"
+NOT_FOUND = "not_found"
+INVALID = "invalid_transition"
+
+
+def transition_applications(ids, target):
+    """
+    Move the applications `ids` to status `target`. Returns
+    {"status", "updated", "results"}, one result per distinct id,
+    in request order.
+    """
+    ids = list(dict.fromkeys(ids))
+    results = []
+    with transaction.atomic():
+        current = {
+            pk: (status, job_id)
+            for pk, status, job_id in Application.objects.select_for_update()
+            .filter(pk__in=ids).order_by("pk")
+            .values_list("pk", "status", "job_id")
+        }
+        movable = []
+        for pk in ids:
+            source, _ = current.get(pk, (None, None))
+            if source is None:
+                results.append({"id": pk, "result": NOT_FOUND})
+                continue
+            if source == target:
+                outcome = UNCHANGED
+            elif target in Application.ALLOWED_TRANSITIONS.get(source, ()):
+                outcome = UPDATED
+                movable.append(pk)
+            else:
+                outcome = INVALID
+            results.append({"id": pk, "result": outcome, "from": source})
+
+        if movable:
+            # the counters are untouched: only withdrawals change them
+            Application.objects.filter(pk__in=movable).update(status=target)
+            ApplicationStatusChange.record(
+                (pk, current[pk][1], current[pk][0], target) for pk in movable
+            )
+    return {"status": target, "updated": len(movable), "results": results}
@@ -1,25 +1,53 @@
-from rest_framework import viewsets, status, permissions
+from rest_framework import viewsets, status, permissions, filters
 from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from rest_framework.response import Response
 from rest_framework.decorators import action
+from django.db import transaction
 from django.shortcuts import get_object_or_404
-from .models import Application
-from .serializers import ApplicationCreateSerializer, ApplicationDetailSerializer
+from django_filters.rest_framework import DjangoFilterBackend
+from jobs.models import Job
+from remosphere.compiled import CompiledListMixin
+from remosphere.export import ExportMixin
+from remosphere.pagination import KeysetPagination
+from .applied import forget_applied_set
+from .apply import APPLIED, DUPLICATE, apply_for_job
+from .filters import ApplicationFilter
+from .models import Application, ApplicationStatusChange
+from .serializers import (
+    ApplicationCreateSerializer,
+    ApplicationDetailSerializer,
+    ApplicationTransitionSerializer,
+    MyApplicationSerializer,
+)
+from .transitions import transition_applications
+from users.permissions import IsAdmin
 from drf_yasg.utils import swagger_auto_schema
 
 
-class ApplicationViewSet(viewsets.ModelViewSet):
+class ApplicationViewSet(CompiledListMixin, ExportMixin, viewsets.ModelViewSet):
     """
     Job application management
 
-    - list: authenticated user sees their own applications; admin sees all.
-    - create: authenticated user can apply (creates Application).
+    - list: authenticated user sees their own applications; admin sees all,
+      filtered by status/job/user, newest first, keyset paginated.
+    - create: authenticated user can apply (creates Application);
+      409 if they already did.
     - retrieve: owner or admin can view.
     - destroy: owner can withdraw, admin can delete.
+    - export: admin streams every application as CSV/NDJSON.
+    - transition: admin moves many applications to a review status.
+    - mine: the user's own applications with a summary of each job.
     """
     queryset = Application.objects.all()  # select_related("job", "user").all()
     permission_classes = [IsAuthenticated]  # further checks below
     http_method_names = ["get", "post", "delete", "head", "options"]
+    filter_backends = [DjangoFilterBackend, filters.OrderingFilter]
+    filterset_class = ApplicationFilter
+    # seeks on (applied_at, id); see the composite indexes on Application
+    pagination_class = KeysetPagination
+    ordering_fields = ["applied_at"]
+    ordering = ["-applied_at"]
+    export_name = "applications"
 
     @swagger_auto_schema(
         operation_summary="Apply for an available job",
@@ -32,6 +60,10 @@ class ApplicationViewSet(viewsets.ModelViewSet):
     def get_serializer_class(self):
         if self.action == "create":
             return ApplicationCreateSerializer
+        if self.action == "transition":
+            return ApplicationTransitionSerializer
+        if self.action == "mine":
+            return MyApplicationSerializer
         return ApplicationDetailSerializer
 
     @swagger_auto_schema(
@@ -52,12 +84,18 @@ class ApplicationViewSet(viewsets.ModelViewSet):
         # normalize admin check
         is_admin = getattr(user, "is_admin", False)
 
+        # job_title and user_email are joined in, not loaded per row
+        qs = Application.objects.select_related("job", "user").only(
+            "id", "resume_url", "status", "applied_at",
+            "job__id", "job__title", "user__id", "user__email",
+        )
+
         if is_admin:
-            return Application.objects.all()
+            return qs
             # return super().get_queryset()
 
         if user.is_authenticated:
-            return Application.objects.filter(user=user)
+            return qs.filter(user=user)
 
         # return super().get_queryset().filter(user=user)
         # anonymous user → return empty queryset (prevents errors)
@@ -66,14 +104,24 @@ class ApplicationViewSet(viewsets.ModelViewSet):
     @swagger_auto_schema(
         operation_summary="Apply for an available job",
         responses={
-            200: "Successfully applied for job application",
-            400: "Invalid token",
-            404: "Job application not found",
+            201: "Successfully applied for job application",
+            400: "Invalid token or job not open for applications",
+            409: "Already applied for this job",
         }
     )
-    def perform_create(self, serializer):
-        # serializer.create will set user from request
-        serializer.save()  # .save(user=self.request.user)
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        # one conditional INSERT: no job lookup or duplicate check first
+        outcome, application = apply_for_job(request.user, **serializer.validated_data)
+        if outcome == DUPLICATE:
+            return Response({"detail": "You have already applied for this job."},
+                            status=status.HTTP_409_CONFLICT)
+        if outcome != APPLIED:
+            return Response({"job": ["This job is not open for applications."]},
+                            status=status.HTTP_400_BAD_REQUEST)
+        return Response(self.get_serializer(application).data,
+                        status=status.HTTP_201_CREATED)
 
     @swagger_auto_schema(
         operation_summary="Delete user application for a job. Only the owner of the application or an admin can delete.",
@@ -92,9 +140,81 @@ class ApplicationViewSet(viewsets.ModelViewSet):
                             status=status.HTTP_403_FORBIDDEN)
         # interpret destroy as "withdraw" for owner (set status)
         if instance.user_id == user.id and not user.is_admin:
-            instance.status = instance.STATUS_WITHDRAWN
-            instance.save(update_fields=["status"])
+            with transaction.atomic():
+                # locked and conditional, so a double withdraw only counts
+                # once and the logged previous status is exact
+                previous = Application.objects.select_for_update().filter(
+                    pk=instance.pk
+                ).exclude(status=Application.STATUS_WITHDRAWN).values_list(
+                    "status", flat=True
+                ).first()
+                if previous is not None:
+                    Application.objects.filter(pk=instance.pk).update(
+                        status=Application.STATUS_WITHDRAWN
+                    )
+                    Job.adjust_applications_count(instance.job_id, -1)
+                    ApplicationStatusChange.record([
+                        (instance.pk, instance.job_id, previous, Application.STATUS_WITHDRAWN)
+                    ])
+                    forget_applied_set(instance.user_id)
             return Response({"detail": "Application withdrawn."},
                             status=status.HTTP_200_OK)
         # admin delete
         return super().destroy(request, *args, **kwargs)
+
+    def perform_destroy(self, instance):
+        with transaction.atomic():
+            previous = Application.objects.select_for_update().filter(
+                pk=instance.pk
+            ).values_list("status", flat=True).first()
+            if previous is None:
+                return
+            ApplicationStatusChange.record([(instance.pk, instance.job_id, previous, "")])
+            instance.delete()
+            if previous != Application.STATUS_WITHDRAWN:
+                Job.adjust_applications_count(instance.job_id, -1)
+                forget_applied_set(instance.user_id)
+
+    @swagger_auto_schema(
+        operation_summary="Shortlist or reject many applications at once (admin)",
+        request_body=ApplicationTransitionSerializer,
+        responses={
+            200: "Per-application results",
+            400: "Invalid ids or status",
+        },
+    )
+    @action(detail=False, methods=["post"], permission_classes=[IsAdmin],
+            pagination_class=None)
+    def transition(self, request):
+        """
+        Apply one status to many applications: allowed moves are made
+        in a single UPDATE, the others reported per id. Applicants are
+        emailed in their next status digest.
+        """
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        result = transition_applications(
+            serializer.validated_data["ids"], serializer.validated_data["status"]
+        )
+        return Response(result, status=status.HTTP_200_OK)
+
+    @swagger_auto_schema(
+        operation_summary="My applications, with a summary of each job",
+        responses={200: MyApplicationSerializer(many=True)},
+    )
+    @action(detail=False, methods=["get"])
+    def mine(self, request):
+        """
+        The requesting user's applications, newest first, each with a
+        compact job summary joined in (one query per page), filtered
+        and keyset paginated like the list.
+        """
+        queryset = self.filter_queryset(
+            Application.objects.filter(user=request.user)
+            .select_related("job")
+            .only("id", "status", "applied_at", "resume_url",
+                  *(f"job__{name}" for name in MyApplicationSerializer.JOB_FIELDS))
+        )
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
+        return self.get_paginated_response(serializer.data)
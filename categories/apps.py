@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class CategoriesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'categories'
+
+    def ready(self):
+        """
+        Registering the response cache invalidation signals
+        """
+        import categories.signals
@@ -1,4 +1,6 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 from django.utils import timezone
 from django.utils.text import slugify
 
@@ -16,3 +18,14 @@ class Category(models.Model):
     description = models.TextField(
         blank=True, help_text="Optional description of this category.")
     created_at = models.DateTimeField(default=timezone.now, editable=False)
+    # drives Last-Modified / ETag validators of the category endpoints
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # pg_trgm: serves icontains (UPPER(name) LIKE) and fuzzy filters
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="categories_name_trgm",
+            ),
+        ]
@@ -0,0 +1,14 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from remosphere.cache import bump_generation
+from .models import Category
+
+
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+def invalidate_cached_responses(sender, **kwargs):
+    """
+    Any write invalidates the cached responses that depend on Category.
+    """
+    bump_generation(Category)
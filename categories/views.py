@@ -3,6 +3,7 @@ from rest_framework import viewsets, permissions
 from .models import Category
 from .serializers import CategorySerializer
 from users.permissions import IsAdminOrReadOnly
+from remosphere.cache import CachedResponseMixin, ConditionalGetMixin
 
 # class IsAdminOrReadOnly(permissions.BasePermission):
 #     """
@@ -19,7 +20,7 @@ from users.permissions import IsAdminOrReadOnly
 # request.user.is_admin
 
 
-class CategoryViewSet(viewsets.ModelViewSet):
+class CategoryViewSet(ConditionalGetMixin, CachedResponseMixin, viewsets.ModelViewSet):
     """
     API endpoint to manage job categories.
 
@@ -29,3 +30,5 @@ class CategoryViewSet(viewsets.ModelViewSet):
     queryset = Category.objects.all()
     serializer_class = CategorySerializer
     permission_classes = [IsAdminOrReadOnly]
+    cache_namespace = "categories"
+    cache_dependencies = (Category,)
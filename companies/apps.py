@@ -4,3 +4,9 @@ from django.apps import AppConfig
 class CompaniesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'companies'
+
+    def ready(self):
+        """
+        Registering the response cache invalidation signals
+        """
+        import companies.signals
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:18
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+import django.db.models.functions.text
+from django.db import migrations
+
+from remosphere.operations import PostgresOnly
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0001_initial'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        PostgresOnly(
+            migrations.AddIndex(
+                model_name='company',
+                index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='gin_trgm_ops'), name='companies_name_trgm'),
+            ),
+        ),
+    ]
@@ -0,0 +1,39 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:33
+
+from django.db import migrations, models
+from django.db.models import F
+
+from remosphere.operations import PostgresOnly
+
+
+def backfill_updated_at(apps, schema_editor):
+    """
+    Existing rows were last changed, as far as we know, when created.
+    """
+    Company = apps.get_model("companies", "Company")
+    Company.objects.update(updated_at=F("created_at"))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('companies', '0002_company_companies_name_trgm'),
+    ]
+
+    operations = [
+        # added nullable, then tightened: a NOT NULL column would make
+        # SQLite rebuild the table, which cannot re-create the trigram index
+        migrations.AddField(
+            model_name='company',
+            name='updated_at',
+            field=models.DateTimeField(null=True),
+        ),
+        migrations.RunPython(backfill_updated_at, migrations.RunPython.noop),
+        PostgresOnly(
+            migrations.AlterField(
+                model_name='company',
+                name='updated_at',
+                field=models.DateTimeField(auto_now=True),
+            ),
+        ),
+    ]
@@ -1,4 +1,6 @@
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.db import models
+from django.db.models.functions import Upper
 
 
 class Company(models.Model):
@@ -9,6 +11,17 @@ class Company(models.Model):
     description = models.TextField(blank=True)
     website = models.URLField(blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
+    # drives Last-Modified / ETag validators of the company endpoints
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # pg_trgm: serves icontains (UPPER(name) LIKE) and fuzzy filters
+            GinIndex(
+                OpClass(Upper("name"), name="gin_trgm_ops"),
+                name="companies_name_trgm",
+            ),
+        ]
 
     def __str__(self):
         return self.name
@@ -0,0 +1,14 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from remosphere.cache import bump_generation
+from .models import Company
+
+
+@receiver(post_save, sender=Company)
+@receiver(post_delete, sender=Company)
+def invalidate_cached_responses(sender, **kwargs):
+    """
+    Any write invalidates the cached responses that depend on Company.
+    """
+    bump_generation(Company)
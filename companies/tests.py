@@ -1,3 +1,36 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
 
-# Create your tests here.
+from remosphere.cache import GENERATION_KEY, bump_generation
+from users.models import User
+from .models import Company
+
+LOCAL_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCAL_CACHE)
+class CachedResponseTests(TestCase):
+    def setUp(self):
+        self.company = Company.objects.create(name="Acme")
+        self.client = APIClient()
+        self.client.force_authenticate(
+            User.objects.create_user("applicant@example.com", "Ada", "Obi", "pw")
+        )
+        self.key = GENERATION_KEY.format(label=Company._meta.label)
+
+    def names(self):
+        return [company["name"] for company in self.client.get("/api/companies/").data]
+
+    def test_evicted_generation_does_not_revive_old_responses(self):
+        # a low generation, as a counter restarted from 0 would hold
+        cache.set(self.key, 1, timeout=None)
+        self.assertEqual(self.names(), ["Acme"])
+
+        Company.objects.filter(pk=self.company.pk).update(name="Acme Corp")
+        cache.delete(self.key)
+        with self.captureOnCommitCallbacks(execute=True):
+            bump_generation(Company)
+
+        self.assertNotEqual(cache.get(self.key), 1)
+        self.assertEqual(self.names(), ["Acme Corp"])
@@ -4,9 +4,10 @@ from rest_framework import viewsets
 from .models import Company
 from .serializers import CompanySerializer
 from users.permissions import IsAdminOrReadOnly
+from remosphere.cache import CachedResponseMixin, ConditionalGetMixin
 
 
-class CompanyViewSet(viewsets.ModelViewSet):
+class CompanyViewSet(ConditionalGetMixin, CachedResponseMixin, viewsets.ModelViewSet):
     """
     Company Management and Tracking for posted jobs
 
@@ -16,3 +17,5 @@ class CompanyViewSet(viewsets.ModelViewSet):
     queryset = Company.objects.all()
     serializer_class = CompanySerializer
     permission_classes = [IsAdminOrReadOnly]
+    cache_namespace = "companies"
+    cache_dependencies = (Company,)
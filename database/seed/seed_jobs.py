@@ -1,16 +1,79 @@
 import json
 import os
-from django.core.management.base import BaseCommand
-from django.utils.text import slugify
+import time
+from itertools import islice
+
 from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.db import transaction
 
+from jobs.ingest import allocate_slugs, base_slug
+from jobs.listing import refresh_listings
 from jobs.models import Job
+from locations.normalize import resolve_locations
 from companies.models import Company
 from categories.models import Category
+from remosphere.cache import bump_generation
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
 
+READ_SIZE = 1 << 16
+
+
+def iter_json_array(f):
+    """
+    Yield the items of a top-level JSON array one at a time,
+    reading the file in fixed-size chunks.
+    """
+    decoder = json.JSONDecoder()
+    buffer, pos, started = "", 0, False
+    eof = False
+    while True:
+        # skip whitespace and separators up to the next value
+        while pos < len(buffer) and buffer[pos] in " \t\r\n,":
+            pos += 1
+        if not started and pos < len(buffer):
+            if buffer[pos] != "[":
+                raise ValueError("Seed file must contain a JSON array.")
+            started, pos = True, pos + 1
+            continue
+        if pos < len(buffer) and buffer[pos] == "]":
+            return
+        try:
+            item, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            # the value continues in the next chunk
+            if eof:
+                if buffer[pos:].strip():
+                    raise
+                return
+            chunk = f.read(READ_SIZE)
+            eof = not chunk
+            buffer, pos = buffer[pos:] + chunk, 0
+            continue
+        # a number may be cut short at the end of the buffer
+        if end == len(buffer) and not eof:
+            chunk = f.read(READ_SIZE)
+            eof = not chunk
+            buffer, pos = buffer[pos:] + chunk, 0
+            continue
+        yield item
+        pos = end
+
+
+def iter_items(f, file_name):
+    """
+    Items of a JSON array file, or of a JSON Lines file
+    (.jsonl / .ndjson, one job per line).
+    """
+    if file_name.endswith((".jsonl", ".ndjson")):
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+    else:
+        yield from iter_json_array(f)
+
 
 class Command(BaseCommand):
     help = "Seed the Jobs table with initial data"
@@ -20,7 +83,13 @@ class Command(BaseCommand):
             "--file",
             type=str,
             default="jobs.json",
-            help="JSON file inside database/seed/",
+            help="JSON (array) or JSON Lines file inside database/seed/",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of jobs written per transaction",
         )
 
     def handle(self, *args, **options):
@@ -33,63 +102,112 @@ class Command(BaseCommand):
             self.stdout.write(self.style.ERROR(f"Seed file not found: {seed_file_path}"))
             return
 
-        # Load the JSON file
+        started = time.perf_counter()
+        # references already in the database, resolved without queries
+        self.categories = dict(Category.objects.values_list("name", "pk"))
+        self.companies = {}
+        for pk, name in Company.objects.order_by("-pk").values_list("pk", "name"):
+            self.companies[name] = pk  # names are not unique: oldest wins
+        self.users = {}
+        # jobs are identified by (title, company_name), as before
+        self.existing = set(Job.objects.values_list("title", "company_name").iterator())
+        self.slugs = set(Job.objects.values_list("slug", flat=True).iterator())
+
+        created_count = skipped_count = 0
         with open(seed_file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-
-        created_count = 0
-
-        for item in data:
-            # Handle category (nullable)
-            category_obj = None
-            if "category" in item and item["category"]:
-                category_obj, _ = Category.objects.get_or_create(
-                    name=item["category"]
-                )
+            items = iter_items(f, file_name)
+            while True:
+                batch = list(islice(items, options["batch_size"]))
+                if not batch:
+                    break
+                created = self.seed_batch(batch)
+                created_count += created
+                skipped_count += len(batch) - created
+                if options["verbosity"] > 1:
+                    elapsed = time.perf_counter() - started
+                    self.stdout.write(
+                        f"  {created_count} jobs, {created_count / elapsed:.0f} jobs/s"
+                    )
+
+        # categories and companies were bulk created: no signals fired
+        bump_generation(Job, Category, Company)
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✓ Successfully seeded {created_count} Job entries "
+                f"({skipped_count} skipped) in {elapsed:.1f}s "
+                f"({created_count / elapsed:.0f} jobs/s)."
+            )
+        )
 
-            # Handle company (nullable)
-            company_obj = None
-            if "company" in item and item["company"]:
-                company_obj, _ = Company.objects.get_or_create(
-                    name=item["company"]
+    def seed_batch(self, batch):
+        """
+        Insert the new jobs of `batch` in one transaction:
+        a fixed number of queries whatever the batch size.
+        """
+        items = []
+        for item in batch:
+            key = (item["title"], item["company_name"])
+            if key not in self.existing:
+                self.existing.add(key)
+                items.append(item)
+        if not items:
+            return 0
+
+        with transaction.atomic():
+            self.resolve_references(items)
+            slugs = allocate_slugs([base_slug(item) for item in items], taken=self.slugs)
+            locations = resolve_locations([item["location"] for item in items])
+            jobs = [
+                Job(
+                    title=item["title"],
+                    company_name=item["company_name"],
+                    description=item["description"],
+                    location=item["location"],
+                    normalized_location=locations.get(item["location"]),
+                    job_type=item["job_type"],
+                    salary_range=item.get("salary_range", None),
+                    category_id=self.categories.get(item.get("category")),
+                    company_id=self.companies.get(item.get("company")),
+                    created_by_id=self.users.get(item.get("created_by_email")),
+                    expiry_at=item.get("expiry_at", None),
+                    slug=slug,
+                    is_active=item.get("is_active", True),
                 )
-
-            # Handle created_by user (nullable)
-            created_by_obj = None
-            if "created_by_email" in item and item["created_by_email"]:
-                created_by_obj = User.objects.filter(
-                    email=item["created_by_email"]
-                ).first()
-
-            # Generate slug from title + company
-            base_slug = slugify(f"{item['title']}-{item.get('company_name', '')}")
-            slug = base_slug
-            counter = 1
-            while Job.objects.filter(slug=slug).exists():
-                slug = f"{base_slug}-{counter}"
-                counter += 1
-
-            # Create Job object
-            job, created = Job.objects.get_or_create(
-                title=item["title"],
-                company_name=item["company_name"],
-                defaults={
-                    "description": item["description"],
-                    "location": item["location"],
-                    "job_type": item["job_type"],
-                    "salary_range": item.get("salary_range", None),
-                    "category": category_obj,
-                    "company": company_obj,
-                    "created_by": created_by_obj,
-                    "expiry_at": item.get("expiry_at", None),
-                    "slug": slug,
-                    "is_active": item.get("is_active", True),
-                },
+                for item, slug in zip(items, slugs)
+            ]
+            for job in jobs:
+                job.parse_salary()
+            Job.objects.bulk_create(jobs)
+            # bulk_create skips the signals that keep JobListing in sync
+            refresh_listings([job.pk for job in jobs])
+        return len(jobs)
+
+    def resolve_references(self, items):
+        """
+        Create the batch's missing categories and companies in bulk
+        and look up its unknown creator emails in one query.
+        """
+        names = {item["category"] for item in items if item.get("category")}
+        missing = names - self.categories.keys()
+        if missing:
+            Category.objects.bulk_create(
+                [Category(name=name) for name in missing], ignore_conflicts=True
+            )
+            self.categories.update(
+                Category.objects.filter(name__in=missing).values_list("name", "pk")
             )
 
-            if created:
-                created_count += 1
-
-        self.stdout.write(
-            self.style.SUCCESS(f"✓ Successfully seeded {created_count} Job entries.")
-        )
+        names = {item["company"] for item in items if item.get("company")}
+        missing = names - self.companies.keys()
+        if missing:
+            created = Company.objects.bulk_create([Company(name=name) for name in missing])
+            self.companies.update((company.name, company.pk) for company in created)
+
+        emails = {
+            item["created_by_email"] for item in items if item.get("created_by_email")
+        } - self.users.keys()
+        if emails:
+            found = dict(User.objects.filter(email__in=emails).values_list("email", "pk"))
+            # unknown emails stay None, like the previous .first()
+            self.users.update({email: found.get(email) for email in emails})
@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class JobsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'jobs'
+
+    def ready(self):
+        """
+        Registering the signals that keep
+        denormalized job data (search documents) in sync
+        """
+        import jobs.signals
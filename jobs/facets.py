@@ -0,0 +1,140 @@
+"""
+Facet counts (job type, category, location) for the job list.
+
+On PostgreSQL all requested dimensions are counted in a single pass
+over the filtered jobs with GROUP BY GROUPING SETS; other databases
+run one GROUP BY per dimension.
+"""
+from django.db import connections
+from django.db.models import Count, F
+
+# facet name -> (value column, optional label column)
+FACET_DIMENSIONS = {
+    "job_type": ("job_type", None),
+    "category": ("category_id", "category_name"),
+    "location": ("location", None),
+}
+
+
+def _columns(dimensions):
+    """
+    Aliased columns for each dimension, so the SQL of the
+    filtered queryset exposes predictable names.
+    """
+    columns = {}
+    for name in dimensions:
+        value, label = FACET_DIMENSIONS[name]
+        columns[name] = (f"facet_{name}", f"facet_{name}_label" if label else None)
+    return columns
+
+
+def _aliased(queryset, dimensions, columns):
+    expressions = {}
+    for name in dimensions:
+        value, label = FACET_DIMENSIONS[name]
+        value_alias, label_alias = columns[name]
+        expressions[value_alias] = F(value)
+        if label:
+            expressions[label_alias] = F(label)
+    return queryset.order_by().annotate(**expressions).values(*expressions)
+
+
+def _bucket(value, label, count, with_label):
+    bucket = {"value": value, "count": count}
+    if with_label:
+        bucket["name"] = label
+    return bucket
+
+
+def _grouping_sets(queryset, dimensions, columns, limit=None):
+    connection = connections[queryset.db]
+    qn = connection.ops.quote_name
+    inner_sql, params = _aliased(queryset, dimensions, columns).query.sql_with_params()
+
+    select, sets, values = [], [], []
+    for name in dimensions:
+        value_alias, label_alias = columns[name]
+        group = [qn(value_alias)] + ([qn(label_alias)] if label_alias else [])
+        select.extend(group)
+        select.append(f"GROUPING({qn(value_alias)})")
+        sets.append(f"({', '.join(group)})")
+        values.append(qn(value_alias))
+
+    # the top `limit` buckets of each grouping set are cut in SQL, so
+    # high-cardinality dimensions (location) return few rows; ties
+    # are broken like the sort of compute_facets()
+    rank = (
+        f", ROW_NUMBER() OVER (PARTITION BY GROUPING({', '.join(values)}) "
+        f"ORDER BY COUNT(*) DESC, {', '.join(f'{value}::text' for value in values)}) "
+        f"AS facet_rank"
+    ) if limit else ""
+    sql = (
+        f"SELECT {', '.join(select)}, COUNT(*){rank} FROM ({inner_sql}) AS filtered "
+        f"GROUP BY GROUPING SETS ({', '.join(sets)})"
+    )
+    if limit:
+        sql = f"SELECT * FROM ({sql}) AS ranked WHERE facet_rank <= %s"
+        params = (*params, limit)
+    with connection.cursor() as cursor:
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+
+    facets = {name: [] for name in dimensions}
+    for row in rows:
+        count = row[len(select)]
+        position = 0
+        for name in dimensions:
+            label_alias = columns[name][1]
+            width = 3 if label_alias else 2
+            value = row[position]
+            label = row[position + 1] if label_alias else None
+            grouped_out = row[position + width - 1]
+            position += width
+            # GROUPING() is 0 for the dimension this row counts
+            if not grouped_out:
+                facets[name].append(
+                    _bucket(value, label, count, bool(label_alias))
+                )
+    return facets
+
+
+def _group_by_each(queryset, dimensions, columns, limit=None):
+    aliased = _aliased(queryset, dimensions, columns)
+    facets = {}
+    for name in dimensions:
+        value_alias, label_alias = columns[name]
+        group = [value_alias] + ([label_alias] if label_alias else [])
+        rows = (
+            aliased.values(*group)
+            .annotate(facet_count=Count("*"))
+            .order_by("-facet_count", value_alias)
+        )
+        if limit:
+            rows = rows[:limit]
+        facets[name] = [
+            _bucket(
+                row[value_alias],
+                row.get(label_alias),
+                row["facet_count"],
+                bool(label_alias),
+            )
+            for row in rows
+        ]
+    return facets
+
+
+def compute_facets(queryset, dimensions, limit=None):
+    """
+    Count the jobs of `queryset` per value of each facet dimension.
+    Buckets are sorted by count (then value) and cut to `limit` by
+    the database.
+    """
+    columns = _columns(dimensions)
+    if connections[queryset.db].vendor == "postgresql":
+        facets = _grouping_sets(queryset, dimensions, columns, limit)
+    else:
+        facets = _group_by_each(queryset, dimensions, columns, limit)
+
+    for name, buckets in facets.items():
+        buckets.sort(key=lambda bucket: (-bucket["count"], str(bucket["value"])))
+    return facets
@@ -1,25 +1,68 @@
 import django_filters
-from .models import Job
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db.models import FloatField, Q
+from django.db.models.functions import Cast, Upper
+from django_filters.constants import EMPTY_VALUES
+from rest_framework.exceptions import ValidationError
+from locations.normalize import lookup_location_codes
+from .models import JobListing
+from .search import is_postgres
+
+
+class TrigramSimilarFilter(django_filters.CharFilter):
+    """
+    Typo-tolerant match ("lgos" finds "Lagos") ordered by similarity,
+    served by the pg_trgm GIN index on UPPER(field).
+    Falls back to `icontains` on databases without pg_trgm.
+    """
+
+    def filter(self, qs, value):
+        if value in EMPTY_VALUES:
+            return qs
+        if not is_postgres(qs):
+            return qs.filter(**{f"{self.field_name}__icontains": value})
+
+        name = self.field_name.replace("__", "_")
+        value = value.upper()
+        return (
+            qs.annotate(**{f"{name}_upper": Upper(self.field_name)})
+            .filter(**{f"{name}_upper__trigram_similar": value})
+            .annotate(**{
+                f"{name}_similarity": Cast(
+                    TrigramSimilarity(Upper(self.field_name), value), FloatField()
+                )
+            })
+            .order_by(f"-{name}_similarity")
+        )
+
+
+class CharInFilter(django_filters.BaseInFilter, django_filters.CharFilter):
+    pass
 
 
 class JobFilter(django_filters.FilterSet):
     """
     The search and filtering functionality for jobs by:
 
-    - location
+    - location (normalized, see locations.normalize)
     - job type
     - category
     - activeness
     - company name
+    - salary (parsed bounds, within a required currency)
     - a search string
+
+    The `icontains` filters are served by the pg_trgm GIN indexes
+    on UPPER(name); the `*_fuzzy` variants tolerate typos and
+    order results by similarity.
     """
     category_name = django_filters.CharFilter(
-        field_name="category__name",
+        field_name="category_name",
         lookup_expr="icontains"
     )
 
     company_display_name = django_filters.CharFilter(
-        field_name="company__name",
+        field_name="company_display_name",
         lookup_expr="icontains"
     )
 
@@ -27,12 +70,45 @@ class JobFilter(django_filters.FilterSet):
         lookup_expr="iexact"
     )
 
+    # a known spelling ("lagos, NG") matches on the indexed
+    # location_code; the substring match is kept alongside it for
+    # texts that only name it as a secondary place ("Lagos (Remote)")
     location = django_filters.CharFilter(
-        lookup_expr="icontains"
+        method="filter_location"
+    )
+
+    # comma separated Location codes: location_code=lagos,remote
+    location_code = CharInFilter(
+        field_name="location_code"
+    )
+
+    # fuzzy, similarity-ordered variants
+    location_fuzzy = TrigramSimilarFilter(field_name="location")
+
+    category_fuzzy = TrigramSimilarFilter(field_name="category_name")
+
+    company_fuzzy = TrigramSimilarFilter(field_name="company_display_name")
+
+    # "pays at least X" / "pays at most Y", within the required
+    # salary_currency (amounts are not converted); served by the
+    # (salary_currency, salary_min|salary_max) indexes
+    salary_min = django_filters.NumberFilter(
+        field_name="salary_min",
+        lookup_expr="gte"
+    )
+
+    salary_max = django_filters.NumberFilter(
+        field_name="salary_max",
+        lookup_expr="lte"
+    )
+
+    salary_currency = django_filters.CharFilter(
+        method="filter_salary_currency"
     )
 
     class Meta:
-        model = Job
+        # filters run against the flattened read model, no joins
+        model = JobListing
         fields = [
             "location",
             "job_type",
@@ -41,4 +117,40 @@ class JobFilter(django_filters.FilterSet):
             "category",
             "category_name",
             "company_display_name",
+            "location_fuzzy",
+            "category_fuzzy",
+            "company_fuzzy",
+            "salary_min",
+            "salary_max",
+            "salary_currency",
+            "location_code",
         ]
+
+    # parameters comparing amounts, meaningless across currencies
+    SALARY_PARAMS = ("salary_min", "salary_max")
+
+    def filter_queryset(self, queryset):
+        if not self.form.cleaned_data.get("salary_currency"):
+            used = [
+                name for name in self.SALARY_PARAMS
+                if self.form.cleaned_data.get(name) is not None
+            ]
+            ordering = self.data.get("ordering", "").split(",")
+            if "salary_sort" in (term.strip().lstrip("-") for term in ordering):
+                used.append("ordering")
+            if used:
+                raise ValidationError({
+                    name: "Requires salary_currency: amounts are not converted."
+                    for name in used
+                })
+        return super().filter_queryset(queryset)
+
+    def filter_location(self, queryset, name, value):
+        code = lookup_location_codes([value]).get(value)
+        if code is not None:
+            return queryset.filter(Q(location_code=code) | Q(location__icontains=value))
+        return queryset.filter(location__icontains=value)
+
+    def filter_salary_currency(self, queryset, name, value):
+        # stored upper case (ISO 4217), exact match keeps the index usable
+        return queryset.filter(salary_currency=value.upper())
@@ -0,0 +1,213 @@
+"""
+Bulk ingest of job postings (partner feeds).
+
+A batch is validated item by item (invalid items are reported, not
+fatal), then written in one transaction with a fixed number of
+queries whatever its size: one lookup of the referenced categories
+and companies, two of the slugs already in use, a few to resolve the
+locations, the bulk inserts and upserts, and one listing refresh.
+
+Items carrying a `slug` that already exists replace that job's
+fields; the others are created with a slug allocated like the seed command does
+(`<title>-<company_name>`, then `-1`, `-2`... on collisions).
+"""
+from django.db import IntegrityError, transaction
+from django.db.models import Q
+from django.utils.text import slugify
+
+from categories.models import Category
+from companies.models import Company
+from locations.normalize import resolve_locations
+from remosphere.cache import bump_generation
+from .listing import refresh_listings
+from .models import Job
+from .serializers import JobIngestSerializer
+
+# columns an upsert overwrites on an existing job
+UPSERT_FIELDS = [
+    "title",
+    "description",
+    "location",
+    "normalized_location",
+    "job_type",
+    "salary_range",
+    "salary_min",
+    "salary_max",
+    "salary_currency",
+    "company_name",
+    "category",
+    "company",
+    "is_active",
+    "expiry_at",
+    "updated_at",
+]
+
+# concurrent ingests can race for the same free slug
+SLUG_ATTEMPTS = 3
+
+
+def base_slug(item):
+    return slugify(f"{item['title']}-{item.get('company_name', '')}")[:240] or "job"
+
+
+def taken_slugs(bases):
+    """
+    The slugs in use among `bases` and their `-<n>` variants. Equality
+    and prefix lookups are both served by the indexes on Job.slug (a
+    regex would scan the table).
+    """
+    lookups = Q(slug__in=bases)
+    for base in bases:
+        lookups |= Q(slug__startswith=f"{base}-")
+    taken = set()
+    for slug in Job.objects.filter(lookups).values_list("slug", flat=True):
+        base, _, counter = slug.rpartition("-")
+        if slug in bases or (base in bases and counter.isdigit()):
+            taken.add(slug)
+    return taken
+
+
+def allocate_slugs(bases, reserved=(), taken=None):
+    """
+    A unique slug for each of `bases`, in order, avoiding `reserved`.
+    Every slug already derived from them is read in one query, unless
+    the caller keeps the `taken` set itself (it is updated in place).
+    """
+    if not bases:
+        return []
+    if taken is None:
+        taken = taken_slugs(set(bases))
+    taken.update(reserved)
+
+    slugs = []
+    for base in bases:
+        slug, counter = base, 1
+        while slug in taken:
+            slug = f"{base}-{counter}"
+            counter += 1
+        taken.add(slug)
+        slugs.append(slug)
+    return slugs
+
+
+def validate_items(items):
+    """
+    Split a payload into (valid items, errors). Valid items are
+    (index, validated data); errors are {"index", "errors"} dicts.
+    """
+    valid, errors = [], []
+    seen_slugs = set()
+    for index, item in enumerate(items):
+        serializer = JobIngestSerializer(data=item)
+        if not serializer.is_valid():
+            errors.append({"index": index, "errors": serializer.errors})
+            continue
+        data = serializer.validated_data
+        slug = data.get("slug")
+        if slug and slug in seen_slugs:
+            errors.append({"index": index, "errors": {"slug": ["Duplicated in this batch."]}})
+            continue
+        if slug:
+            seen_slugs.add(slug)
+        valid.append((index, data))
+
+    # referenced categories/companies, checked with one query each
+    for field, model in (("category", Category), ("company", Company)):
+        wanted = {data[field] for _, data in valid if data.get(field)}
+        found = set(model.objects.filter(pk__in=wanted).values_list("pk", flat=True))
+        missing = wanted - found
+        if missing:
+            for index, data in valid:
+                if data.get(field) in missing:
+                    errors.append({
+                        "index": index,
+                        "errors": {field: [f'Invalid pk "{data[field]}" - object does not exist.']},
+                    })
+            valid = [(index, data) for index, data in valid if data.get(field) not in missing]
+
+    errors.sort(key=lambda error: error["index"])
+    return valid, errors
+
+
+def ingest_jobs(items, user=None):
+    """
+    Validate and upsert a batch of job payloads.
+    Returns {"created", "updated", "results", "errors"}.
+    """
+    valid, errors = validate_items(items)
+    if not valid:
+        return {"created": 0, "updated": 0, "results": [], "errors": errors}
+
+    for attempt in range(SLUG_ATTEMPTS):
+        try:
+            with transaction.atomic():
+                results = _write(valid, user)
+            break
+        except IntegrityError:
+            if attempt == SLUG_ATTEMPTS - 1:
+                raise
+
+    return {
+        "created": sum(1 for result in results if result["status"] == "created"),
+        "updated": sum(1 for result in results if result["status"] == "updated"),
+        "results": results,
+        "errors": errors,
+    }
+
+
+def _write(valid, user):
+    given = [data["slug"] for _, data in valid if data.get("slug")]
+    existing = set(Job.objects.filter(slug__in=given).values_list("slug", flat=True))
+
+    allocated = iter(allocate_slugs(
+        [base_slug(data) for _, data in valid if not data.get("slug")], reserved=given
+    ))
+
+    locations = resolve_locations([data["location"] for _, data in valid])
+
+    jobs = []
+    for _, data in valid:
+        fields = {
+            key: value for key, value in data.items()
+            if key not in ("category", "company", "slug")
+        }
+        slug = data.get("slug") or next(allocated)
+        job = Job(
+            category_id=data.get("category"),
+            company_id=data.get("company"),
+            created_by=user if slug not in existing else None,
+            normalized_location=locations.get(data["location"]),
+            slug=slug,
+            **fields,
+        )
+        job.parse_salary()
+        jobs.append(job)
+
+    # new slugs are plain inserts, so a slug taken meanwhile by a
+    # concurrent ingest raises (and is retried) instead of overwriting
+    Job.objects.bulk_create([job for job in jobs if job.slug not in existing])
+    if existing:
+        # created_by/created_at of updated jobs are kept
+        Job.objects.bulk_create(
+            [job for job in jobs if job.slug in existing],
+            update_conflicts=True,
+            unique_fields=["slug"],
+            update_fields=UPSERT_FIELDS,
+        )
+
+    # bulk_create skips signals: sync the read model and caches here
+    ids = dict(Job.objects.filter(
+        slug__in=[job.slug for job in jobs]
+    ).values_list("slug", "pk"))
+    refresh_listings(ids.values())
+    bump_generation(Job)
+
+    return [
+        {
+            "index": index,
+            "id": ids[job.slug],
+            "slug": job.slug,
+            "status": "updated" if job.slug in existing else "created",
+        }
+        for (index, _), job in zip(valid, jobs)
+    ]
@@ -0,0 +1,103 @@
+"""
+Keeps the JobListing read model in sync with the write model
+(Job, Category, Company, User).
+
+Whole rows are rebuilt with one joined read and one upsert; renames
+of related objects are pushed to every affected row with a single
+set-based UPDATE.
+"""
+from .models import Job, JobListing
+from .search import update_search_vectors
+
+# JobListing columns copied straight from Job
+COPIED_FIELDS = [
+    "title",
+    "description",
+    "location",
+    "job_type",
+    "salary_range",
+    "salary_min",
+    "salary_max",
+    "salary_currency",
+    "company_name",
+    "slug",
+    "is_active",
+    "expiry_at",
+    "created_at",
+    "updated_at",
+    "applications_count",
+    "category_id",
+    "company_id",
+    "created_by_id",
+    "normalized_location_id",
+]
+
+UPDATE_FIELDS = [
+    field.removesuffix("_id") for field in COPIED_FIELDS
+] + [
+    "category_name",
+    "company_display_name",
+    "created_by_email",
+    "salary_sort",
+    "location_code",
+]
+
+
+def salary_sort(salary_min, salary_max):
+    """
+    JobListing.salary_sort: the best known bound, 0 if unknown.
+    """
+    return salary_max or salary_min or 0
+
+
+def build_listing(job):
+    listing = JobListing(id=job.pk)
+    for field in COPIED_FIELDS:
+        setattr(listing, field, getattr(job, field))
+    listing.category_name = job.category.name if job.category else None
+    listing.company_display_name = job.company.name if job.company else None
+    listing.created_by_email = job.created_by.email if job.created_by else None
+    listing.salary_sort = salary_sort(job.salary_min, job.salary_max)
+    listing.location_code = (
+        job.normalized_location.code if job.normalized_location else None
+    )
+    return listing
+
+
+def refresh_listings(job_ids):
+    """
+    Rebuild the listings of `job_ids` from the write model
+    (deleted jobs lose their listing).
+    """
+    job_ids = list(job_ids)
+    jobs = Job.objects.filter(pk__in=job_ids).select_related(
+        "category", "company", "created_by", "normalized_location"
+    )
+    listings = [build_listing(job) for job in jobs]
+    JobListing.objects.bulk_create(
+        listings,
+        update_conflicts=True,
+        unique_fields=["id"],
+        update_fields=UPDATE_FIELDS,
+    )
+
+    found = {listing.pk for listing in listings}
+    missing = [pk for pk in job_ids if pk not in found]
+    if missing:
+        JobListing.objects.filter(pk__in=missing).delete()
+
+    update_search_vectors(JobListing.objects.filter(pk__in=found))
+    return len(listings)
+
+
+def update_listings(queryset, **values):
+    """
+    Push a change of related data (e.g. a category rename)
+    to every listing in `queryset`.
+    """
+    # resolve the rows first: the update may change the filtered column
+    pks = list(queryset.values_list("pk", flat=True))
+    if pks:
+        JobListing.objects.filter(pk__in=pks).update(**values)
+        update_search_vectors(JobListing.objects.filter(pk__in=pks))
+    return len(pks)
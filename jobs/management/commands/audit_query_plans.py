@@ -0,0 +1,252 @@
+import json
+import os
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.urls import get_resolver, resolve
+from rest_framework.test import APIClient
+from rest_framework.viewsets import ViewSetMixin
+
+from applications.models import Application
+from categories.models import Category
+from companies.models import Company
+from jobs.models import Job
+
+User = get_user_model()
+
+# (case name, user role, URL) - the canonical reads behind each ViewSet,
+# with representative filters. {job}, {category}... are pks of seeded rows.
+CASES = [
+    ("jobs.list", "user", "/api/jobs/"),
+    ("jobs.list.admin", "admin", "/api/jobs/"),
+    ("jobs.list.popular", "user", "/api/jobs/?ordering=-applications_count"),
+    ("jobs.list.title", "user", "/api/jobs/?ordering=title"),
+    ("jobs.search", "user", "/api/jobs/?search=python%20developer"),
+    ("jobs.filter.location", "user", "/api/jobs/?location=remote"),
+    ("jobs.filter.category", "user", "/api/jobs/?category={category}&job_type=full_time"),
+    ("jobs.filter.fuzzy", "user", "/api/jobs/?company_fuzzy=acme"),
+    ("jobs.facets", "user", "/api/jobs/facets/"),
+    ("jobs.retrieve", "user", "/api/jobs/{job}/"),
+    ("applications.list", "user", "/api/applications/"),
+    ("applications.list.admin", "admin", "/api/applications/"),
+    ("applications.retrieve", "admin", "/api/applications/{application}/"),
+    ("categories.list", "user", "/api/categories/"),
+    ("categories.retrieve", "user", "/api/categories/{category}/"),
+    ("companies.list", "user", "/api/companies/"),
+    ("companies.retrieve", "user", "/api/companies/{company}/"),
+    ("users.me", "user", "/api/users/me/"),
+]
+
+
+def registered_viewsets(patterns=None):
+    """
+    Every ViewSet class routed in the URLconf.
+    """
+    found = set()
+    for pattern in patterns if patterns is not None else get_resolver().url_patterns:
+        if hasattr(pattern, "url_patterns"):
+            found |= registered_viewsets(pattern.url_patterns)
+            continue
+        view_class = getattr(pattern.callback, "cls", None)
+        if view_class and issubclass(view_class, ViewSetMixin):
+            found.add(view_class)
+    return found
+
+
+def plan_nodes(node):
+    yield node
+    for child in node.get("Plans", ()):
+        yield from plan_nodes(child)
+
+
+def plan_findings(plan, skew_threshold):
+    """
+    Seq scans, sorts spilling to disk and row estimates off by more
+    than `skew_threshold`x, as stable strings (no costs or timings).
+    """
+    findings = set()
+    for node in plan_nodes(plan["Plan"]):
+        node_type = node["Node Type"]
+        target = node.get("Relation Name") or node.get("Index Name") or ""
+        label = f"{node_type} {target}".strip()
+
+        if node_type == "Seq Scan":
+            findings.add(f"seq scan: {target}")
+        if node.get("Sort Space Type") == "Disk" or "external" in node.get("Sort Method", ""):
+            findings.add(f"sort spilled to disk: {label}")
+
+        estimated = node.get("Plan Rows", 0)
+        actual = node.get("Actual Rows", 0)
+        if node.get("Actual Loops") and max(estimated, actual) >= 100:
+            skew = max(estimated, actual) / max(min(estimated, actual), 1)
+            if skew >= skew_threshold:
+                findings.add(f"row estimate skew: {label}")
+    return findings
+
+
+class Command(BaseCommand):
+    help = (
+        "EXPLAIN (ANALYZE, BUFFERS) the queries behind every API endpoint "
+        "and compare seq scans, disk sorts and row estimate skew to a baseline"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--baseline",
+            default=os.path.join(settings.BASE_DIR, "database", "query_plans.json"),
+            help="Baseline JSON file to compare against",
+        )
+        parser.add_argument(
+            "--update-baseline",
+            action="store_true",
+            help="Store the current findings as the new baseline",
+        )
+        parser.add_argument(
+            "--skew-threshold",
+            type=float,
+            default=10.0,
+            help="Flag plan nodes whose estimated and actual rows differ by this factor",
+        )
+        parser.add_argument(
+            "--case",
+            action="append",
+            help="Only run the named case(s)",
+        )
+        parser.add_argument(
+            "--verbose-plans",
+            action="store_true",
+            help="Print every plan as JSON",
+        )
+
+    def handle(self, *args, **options):
+        if connection.vendor != "postgresql":
+            raise CommandError("Query plan audits need PostgreSQL.")
+
+        cases = [case for case in CASES if not options["case"] or case[0] in options["case"]]
+        self.warn_uncovered_viewsets()
+
+        # nothing an audit runs may persist (EXPLAIN ANALYZE executes)
+        with transaction.atomic():
+            results, failures = self.run_cases(cases, options)
+            transaction.set_rollback(True)
+
+        # a failing request audits an error page, not the endpoint
+        if failures:
+            raise CommandError(f"{len(failures)} case(s) failed: {', '.join(failures)}.")
+
+        if options["update_baseline"]:
+            self.write_baseline(options["baseline"], results)
+            return
+
+        regressions = self.compare(options["baseline"], results)
+        if regressions:
+            raise CommandError(f"{regressions} query plan regression(s) against the baseline.")
+        self.stdout.write(self.style.SUCCESS("✓ No query plan regressions."))
+
+    def warn_uncovered_viewsets(self):
+        placeholders = {"job": 1, "application": 1, "category": 1, "company": 1}
+        covered = {
+            getattr(resolve(url.split("?")[0].format(**placeholders)).func, "cls", None)
+            for _, _, url in CASES
+        }
+        for view_class in sorted(registered_viewsets() - covered, key=lambda cls: cls.__name__):
+            self.stdout.write(self.style.WARNING(f"! {view_class.__name__} has no audit case"))
+
+    def sample_kwargs(self):
+        return {
+            "job": Job.objects.values_list("pk", flat=True).first(),
+            "application": Application.objects.values_list("pk", flat=True).first(),
+            "category": Category.objects.values_list("pk", flat=True).first(),
+            "company": Company.objects.values_list("pk", flat=True).first(),
+        }
+
+    def run_cases(self, cases, options):
+        users = {
+            "user": User.objects.filter(is_admin=False).first(),
+            "admin": User.objects.filter(is_admin=True).first(),
+        }
+        samples = self.sample_kwargs()
+        results = {}
+        failures = []
+
+        for name, role, url in cases:
+            user = users[role]
+            try:
+                path = url.format(**samples)
+            except KeyError:
+                path = None
+            if user is None or path is None or "None" in path:
+                self.stdout.write(self.style.WARNING(f"- {name}: skipped, seed the database first"))
+                continue
+
+            client = APIClient()
+            client.force_authenticate(user=user)
+            # cached responses would hide the queries; the test client's
+            # host is not in production ALLOWED_HOSTS
+            with override_settings(
+                RESPONSE_CACHE_TIMEOUT=0,
+                ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, "testserver"],
+            ), CaptureQueriesContext(connection) as captured:
+                response = client.get(path)
+            if response.status_code != 200:
+                failures.append(name)
+                self.stdout.write(self.style.ERROR(f"✗ {name}: HTTP {response.status_code}"))
+                continue
+
+            findings = set()
+            selects = [
+                query["sql"] for query in captured.captured_queries
+                if query["sql"].lstrip().upper().startswith(("SELECT", "WITH"))
+            ]
+            for sql in selects:
+                plan = self.explain(sql)
+                findings |= plan_findings(plan, options["skew_threshold"])
+                if options["verbose_plans"]:
+                    self.stdout.write(json.dumps(plan, indent=2))
+
+            results[name] = {"queries": len(selects), "findings": sorted(findings)}
+            self.stdout.write(f"{name}: {len(selects)} queries")
+            for finding in sorted(findings):
+                self.stdout.write(f"    {finding}")
+        return results, failures
+
+    def explain(self, sql):
+        with connection.cursor() as cursor:
+            cursor.execute(f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {sql}")
+            plan = cursor.fetchone()[0]
+        return plan[0] if isinstance(plan, list) else json.loads(plan)[0]
+
+    def write_baseline(self, path, results):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+        self.stdout.write(self.style.SUCCESS(f"✓ Baseline written to {path}"))
+
+    def compare(self, path, results):
+        if not os.path.exists(path):
+            self.stdout.write(self.style.WARNING(
+                f"No baseline at {path}; run with --update-baseline to create it."
+            ))
+            return 0
+
+        with open(path, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+        regressions = 0
+        for name, result in results.items():
+            expected = baseline.get(name)
+            if expected is None:
+                self.stdout.write(self.style.WARNING(f"! {name}: not in the baseline"))
+                continue
+            for finding in sorted(set(result["findings"]) - set(expected["findings"])):
+                regressions += 1
+                self.stdout.write(self.style.ERROR(f"✗ {name}: new {finding}"))
+            if result["queries"] > expected["queries"]:
+                regressions += 1
+                self.stdout.write(self.style.ERROR(
+                    f"✗ {name}: {result['queries']} queries (baseline {expected['queries']})"
+                ))
+        return regressions
@@ -0,0 +1,75 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from jobs.listing import salary_sort
+from jobs.models import Job, JobListing
+from remosphere.cache import bump_generation
+
+
+class Command(BaseCommand):
+    help = (
+        "Parse Job.salary_range into salary_min/salary_max/salary_currency "
+        "in batches (resumable: parsed jobs are skipped)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of jobs parsed per transaction",
+        )
+        parser.add_argument(
+            "--after",
+            type=int,
+            default=0,
+            help="Resume after this job id (printed per batch with -v 2)",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Re-parse jobs that already have salary bounds",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        jobs = Job.objects.filter(salary_range__isnull=False).exclude(salary_range="")
+        if not options["all"]:
+            jobs = jobs.filter(
+                salary_min__isnull=True, salary_max__isnull=True, salary_currency=""
+            )
+        jobs = jobs.order_by("pk").only("pk", "salary_range")
+
+        parsed = 0
+        last_pk = options["after"]
+        while True:
+            batch = list(jobs.filter(pk__gt=last_pk)[:batch_size])
+            if not batch:
+                break
+            for job in batch:
+                job.parse_salary()
+
+            # updated_at is left alone: nothing a user wrote has changed
+            with transaction.atomic():
+                Job.objects.bulk_update(batch, Job.SALARY_FIELDS)
+                listings = JobListing.objects.in_bulk([job.pk for job in batch])
+                for job in batch:
+                    listing = listings.get(job.pk)
+                    if listing is not None:
+                        for field in Job.SALARY_FIELDS:
+                            setattr(listing, field, getattr(job, field))
+                        listing.salary_sort = salary_sort(job.salary_min, job.salary_max)
+                JobListing.objects.bulk_update(
+                    listings.values(), [*Job.SALARY_FIELDS, "salary_sort"]
+                )
+
+            parsed += len(batch)
+            last_pk = batch[-1].pk
+            if options["verbosity"] > 1:
+                self.stdout.write(f"  {parsed} jobs parsed, last id {last_pk}")
+
+        if parsed:
+            bump_generation(Job)
+        self.stdout.write(
+            self.style.SUCCESS(f"✓ Parsed salary ranges of {parsed} jobs.")
+        )
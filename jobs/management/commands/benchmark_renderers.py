@@ -0,0 +1,89 @@
+import io
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+
+from jobs.models import JobListing
+from jobs.serializers import JobListingSerializer
+from remosphere import renderers
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare DRF's JSONRenderer/JSONParser with the orjson (and msgpack) "
+        "renderers on job list payloads built from the database"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--rows",
+            default="20,100,1000",
+            help="Comma separated payload sizes (job cards per payload)",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=20,
+            help="Runs per measurement, the best one is reported",
+        )
+
+    def handle(self, *args, **options):
+        sizes = [int(size) for size in options["rows"].split(",")]
+        jobs = list(JobListing.objects.order_by("-created_at")[:max(sizes)])
+        if not jobs:
+            raise CommandError("No jobs found; seed the database first.")
+
+        candidates = [("orjson", renderers.ORJSONRenderer(), renderers.ORJSONParser())]
+        if renderers.msgpack is not None:
+            candidates.append(
+                ("msgpack", renderers.MessagePackRenderer(), renderers.MessagePackParser())
+            )
+
+        for size in sizes:
+            payload = {
+                "next": None,
+                "previous": None,
+                "results": JobListingSerializer(jobs[:size], many=True).data,
+            }
+            reference = JSONRenderer().render(payload)
+            render_time = self.measure(lambda: JSONRenderer().render(payload), options["repeat"])
+            parse_time = self.measure(
+                lambda: JSONParser().parse(io.BytesIO(reference)), options["repeat"]
+            )
+            self.stdout.write(
+                f"{len(payload['results'])} jobs, {len(reference)} bytes: "
+                f"json render {render_time * 1000:.2f} ms, parse {parse_time * 1000:.2f} ms"
+            )
+
+            for name, renderer, parser in candidates:
+                body = renderer.render(payload)
+                if name == "orjson" and body != reference:
+                    raise CommandError("orjson output differs from JSONRenderer.")
+                if parser.parse(io.BytesIO(body)) != JSONParser().parse(io.BytesIO(reference)):
+                    raise CommandError(f"{name} does not round trip the JSON payload.")
+                rendered = self.measure(lambda: renderer.render(payload), options["repeat"])
+                parsed = self.measure(
+                    lambda: parser.parse(io.BytesIO(body)), options["repeat"]
+                )
+                self.stdout.write(
+                    f"  {name:<8} {len(body):>9} bytes  "
+                    f"render {rendered * 1000:.2f} ms (x{render_time / rendered:.1f})  "
+                    f"parse {parsed * 1000:.2f} ms (x{parse_time / parsed:.1f})"
+                )
+
+        self.stdout.write(self.style.SUCCESS(
+            f"✓ orjson output identical to JSONRenderer; "
+            f"{', '.join(name for name, _, _ in candidates)} round trip the payloads."
+        ))
+
+    @staticmethod
+    def measure(run, repeat):
+        best = None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            run()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return best
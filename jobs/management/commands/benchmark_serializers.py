@@ -0,0 +1,123 @@
+import time
+
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.utils import timezone
+
+from applications.models import Application
+from applications.serializers import ApplicationDetailSerializer
+from categories.models import Category
+from companies.models import Company
+from jobs.listing import build_listing
+from jobs.models import Job, JobListing
+from jobs.serializers import JobListingSerializer, JobSerializer
+from remosphere.compiled import compile_serializer
+
+User = get_user_model()
+
+# (label, serializer class, queryset factory for the DRF path)
+TARGETS = [
+    ("JobSerializer", JobSerializer,
+     lambda: Job.objects.select_related("category", "company", "created_by", "normalized_location")),
+    ("JobListingSerializer", JobListingSerializer,
+     lambda: JobListing.objects.all()),
+    ("ApplicationDetailSerializer", ApplicationDetailSerializer,
+     lambda: Application.objects.select_related("job", "user")),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        "Compare DRF serializers with their compiled values() fast path "
+        "on synthetic rows (created in a transaction that is rolled back)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--sizes",
+            default="100,1000,10000",
+            help="Comma separated row counts",
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=3,
+            help="Runs per measurement, the best one is reported",
+        )
+
+    def handle(self, *args, **options):
+        sizes = [int(size) for size in options["sizes"].split(",")]
+
+        with transaction.atomic():
+            self.seed(max(sizes))
+            for label, serializer_class, queryset in TARGETS:
+                compiled = compile_serializer(serializer_class)
+                if compiled is None:
+                    raise CommandError(f"{label} cannot be compiled.")
+
+                self.stdout.write(label)
+                for size in sizes:
+                    rows = queryset().order_by("pk")[:size]
+                    drf_data, drf_time = self.measure(
+                        lambda: serializer_class(list(rows), many=True).data,
+                        options["repeat"],
+                    )
+                    fast_data, fast_time = self.measure(
+                        lambda: compiled.serialize(compiled.rows(rows)),
+                        options["repeat"],
+                    )
+                    if [dict(item) for item in drf_data] != fast_data:
+                        raise CommandError(f"{label}: compiled output differs at {size} rows.")
+                    self.stdout.write(
+                        f"  {size:>6} rows  drf {drf_time * 1000:9.1f} ms  "
+                        f"compiled {fast_time * 1000:8.1f} ms  "
+                        f"x{drf_time / fast_time:.1f}"
+                    )
+            transaction.set_rollback(True)
+
+        self.stdout.write(self.style.SUCCESS("✓ Compiled output identical to DRF for every size."))
+
+    @staticmethod
+    def measure(run, repeat):
+        best, data = None, None
+        for _ in range(repeat):
+            started = time.perf_counter()
+            data = run()
+            elapsed = time.perf_counter() - started
+            best = elapsed if best is None else min(best, elapsed)
+        return data, best
+
+    def seed(self, count):
+        user = User.objects.create_user(
+            email=f"bench-{time.time_ns()}@example.com",
+            first_name="Bench",
+            last_name="Mark",
+            password=None,
+        )
+        category = Category.objects.create(name=f"Bench {time.time_ns()}")
+        company = Company.objects.create(name=f"Bench {time.time_ns()}")
+        now = timezone.now()
+        jobs = Job.objects.bulk_create(
+            Job(
+                title=f"Benchmark job {i}",
+                description="Benchmark description " * 20,
+                category=category if i % 3 else None,
+                location="Remote",
+                job_type=Job.JOB_TYPE_FULL_TIME,
+                salary_range="$1 - $2",
+                company_name="Bench",
+                company=company,
+                created_by=user,
+                slug=f"https://example.com/bench/{now.timestamp()}/{i}",
+                expiry_at=now if i % 2 else None,
+            )
+            for i in range(count)
+        )
+        jobs = Job.objects.filter(pk__in=[job.pk for job in jobs]).select_related(
+            "category", "company", "created_by", "normalized_location"
+        )
+        JobListing.objects.bulk_create(build_listing(job) for job in jobs)
+        Application.objects.bulk_create(
+            Application(job=job, user=user, resume_url=None) for job in jobs
+        )
@@ -0,0 +1,44 @@
+from django.core.management.base import BaseCommand
+
+from jobs.listing import refresh_listings
+from jobs.models import Job, JobListing
+from remosphere.cache import bump_generation
+
+
+class Command(BaseCommand):
+    help = "Rebuild the JobListing read model from the jobs tables in batches"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of jobs rebuilt per batch",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        jobs = Job.objects.order_by("pk")
+
+        rebuilt = 0
+        last_pk = 0
+        while True:
+            pks = list(
+                jobs.filter(pk__gt=last_pk).values_list("pk", flat=True)[:batch_size]
+            )
+            if not pks:
+                break
+            rebuilt += refresh_listings(pks)
+            last_pk = pks[-1]
+
+        # listings whose job no longer exists
+        orphans, _ = JobListing.objects.exclude(
+            pk__in=Job.objects.values("pk")
+        ).delete()
+        bump_generation(Job)
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"✓ Rebuilt {rebuilt} job listings, removed {orphans} orphans."
+            )
+        )
@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+from applications.models import Application
+from jobs.models import Job, JobListing
+
+
+def live_applications_count():
+    """
+    Correlated subquery counting a job's non-withdrawn applications.
+    """
+    counts = (
+        Application.objects.filter(job=OuterRef("pk"))
+        .exclude(status=Application.STATUS_WITHDRAWN)
+        .order_by()
+        .values("job")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    return Coalesce(Subquery(counts), 0)
+
+
+class Command(BaseCommand):
+    help = "Recompute the stored Job.applications_count counters in batches"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of jobs recounted per statement",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        jobs = Job.objects.order_by("pk")
+
+        updated = 0
+        last_pk = 0
+        while True:
+            pks = list(
+                jobs.filter(pk__gt=last_pk).values_list("pk", flat=True)[:batch_size]
+            )
+            if not pks:
+                break
+            updated += Job.objects.filter(pk__in=pks).update(
+                applications_count=live_applications_count()
+            )
+            JobListing.objects.filter(pk__in=pks).update(
+                applications_count=Subquery(
+                    Job.objects.filter(pk=OuterRef("pk")).values("applications_count")[:1]
+                )
+            )
+            last_pk = pks[-1]
+
+        self.stdout.write(
+            self.style.SUCCESS(f"✓ Recounted applications for {updated} jobs.")
+        )
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from jobs.models import JobListing
+from jobs.search import is_postgres, update_search_vectors
+
+
+class Command(BaseCommand):
+    help = "Rebuild the full-text search documents of all job listings in batches"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of jobs updated per statement",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        jobs = JobListing.objects.order_by("pk")
+
+        if not is_postgres(jobs):
+            raise CommandError("Full-text search documents require PostgreSQL.")
+
+        updated = 0
+        last_pk = 0
+        while True:
+            pks = list(
+                jobs.filter(pk__gt=last_pk).values_list("pk", flat=True)[:batch_size]
+            )
+            if not pks:
+                break
+            updated += update_search_vectors(JobListing.objects.filter(pk__in=pks))
+            last_pk = pks[-1]
+
+        self.stdout.write(
+            self.style.SUCCESS(f"✓ Rebuilt search documents for {updated} jobs.")
+        )
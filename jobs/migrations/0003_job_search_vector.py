@@ -0,0 +1,50 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:14
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.conf import settings
+from django.db import migrations
+
+from remosphere.operations import PostgresOnly
+
+
+# mirrors jobs.search.job_search_vector()
+BACKFILL_SEARCH_VECTORS = """
+UPDATE jobs_job AS j SET search_vector =
+    setweight(to_tsvector('english', coalesce(j.title, '')), 'A')
+    || setweight(to_tsvector('english', coalesce(j.company_name, '')), 'A')
+    || setweight(to_tsvector('english', coalesce(
+        (SELECT c.name FROM companies_company c WHERE c.id = j.company_id), '')), 'A')
+    || setweight(to_tsvector('english', coalesce(
+        (SELECT c.name FROM categories_category c WHERE c.id = j.category_id), '')), 'B')
+    || setweight(to_tsvector('english', coalesce(j.location, '')), 'B')
+    || setweight(to_tsvector('english', coalesce(j.job_type, '')), 'C')
+    || setweight(to_tsvector('english', coalesce(j.description, '')), 'D')
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('categories', '0001_initial'),
+        ('companies', '0001_initial'),
+        ('jobs', '0002_alter_job_job_type'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='search_vector',
+            field=django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True),
+        ),
+        PostgresOnly(
+            migrations.AddIndex(
+                model_name='job',
+                index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='jobs_job_search_gin'),
+            ),
+        ),
+        PostgresOnly(
+            migrations.RunSQL(BACKFILL_SEARCH_VECTORS, migrations.RunSQL.noop),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:16
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_applications_count(apps, schema_editor):
+    Application = apps.get_model("applications", "Application")
+    Job = apps.get_model("jobs", "Job")
+    counts = (
+        Application.objects.filter(job=OuterRef("pk"))
+        .exclude(status="withdrawn")
+        .order_by()
+        .values("job")
+        .annotate(total=Count("pk"))
+        .values("total")
+    )
+    Job.objects.update(applications_count=Coalesce(Subquery(counts), 0))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('categories', '0001_initial'),
+        ('companies', '0001_initial'),
+        ('applications', '0001_initial'),
+        ('jobs', '0004_job_keyset_indexes'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='applications_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.RunPython(backfill_applications_count, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(fields=['-applications_count', '-id'], name='jobs_job_popular_id_idx'),
+        ),
+    ]
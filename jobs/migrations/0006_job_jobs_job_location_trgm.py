@@ -0,0 +1,29 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:18
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations
+
+from remosphere.operations import PostgresOnly
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('categories', '0002_category_categories_name_trgm'),
+        ('companies', '0002_company_companies_name_trgm'),
+        ('jobs', '0005_job_applications_count'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        PostgresOnly(
+            migrations.AddIndex(
+                model_name='job',
+                index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('location'), name='gin_trgm_ops'), name='jobs_job_location_trgm'),
+            ),
+        ),
+    ]
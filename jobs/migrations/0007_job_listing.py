@@ -0,0 +1,186 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:21
+
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+import django.db.models.deletion
+import django.db.models.functions.text
+from django.conf import settings
+from django.db import migrations, models
+
+from remosphere.operations import PostgresOnly
+
+
+def populate_listings(apps, schema_editor):
+    """
+    Project every existing job into the read model, in batches.
+    """
+    Job = apps.get_model("jobs", "Job")
+    JobListing = apps.get_model("jobs", "JobListing")
+    copied = [
+        "title", "description", "location", "job_type", "salary_range",
+        "company_name", "slug", "is_active", "expiry_at", "created_at",
+        "updated_at", "applications_count", "category_id", "company_id",
+        "created_by_id",
+    ]
+    jobs = Job.objects.select_related("category", "company", "created_by").order_by("pk")
+    last_pk = 0
+    while True:
+        batch = list(jobs.filter(pk__gt=last_pk)[:1000])
+        if not batch:
+            break
+        listings = []
+        for job in batch:
+            listing = JobListing(id=job.pk)
+            for field in copied:
+                setattr(listing, field, getattr(job, field))
+            listing.category_name = job.category.name if job.category else None
+            listing.company_display_name = job.company.name if job.company else None
+            listing.created_by_email = job.created_by.email if job.created_by else None
+            listings.append(listing)
+        JobListing.objects.bulk_create(listings)
+        last_pk = batch[-1].pk
+
+
+# mirrors jobs.search.listing_search_vector()
+BACKFILL_SEARCH_VECTORS = """
+UPDATE jobs_joblisting SET search_vector =
+    setweight(to_tsvector('english', coalesce(title, '')), 'A')
+    || setweight(to_tsvector('english', coalesce(company_name, '')), 'A')
+    || setweight(to_tsvector('english', coalesce(company_display_name, '')), 'A')
+    || setweight(to_tsvector('english', coalesce(category_name, '')), 'B')
+    || setweight(to_tsvector('english', coalesce(location, '')), 'B')
+    || setweight(to_tsvector('english', coalesce(job_type, '')), 'C')
+    || setweight(to_tsvector('english', coalesce(description, '')), 'D')
+"""
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('categories', '0002_category_categories_name_trgm'),
+        ('companies', '0002_company_companies_name_trgm'),
+        ('jobs', '0006_job_jobs_job_location_trgm'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobListing',
+            fields=[
+                ('id', models.BigIntegerField(primary_key=True, serialize=False)),
+                ('title', models.CharField(max_length=255)),
+                ('description', models.TextField()),
+                ('location', models.CharField(max_length=128)),
+                ('job_type', models.CharField(choices=[('full_time', 'Full time'), ('part_time', 'Part time'), ('contract', 'Contract'), ('internship', 'Internship'), ('remote', 'Remote'), ('other', 'Other')], max_length=32)),
+                ('salary_range', models.CharField(blank=True, max_length=64, null=True)),
+                ('company_name', models.CharField(max_length=255)),
+                ('slug', models.URLField(max_length=255)),
+                ('is_active', models.BooleanField(default=True)),
+                ('expiry_at', models.DateTimeField(blank=True, null=True)),
+                ('created_at', models.DateTimeField()),
+                ('updated_at', models.DateTimeField()),
+                ('applications_count', models.PositiveIntegerField(default=0)),
+                ('category_name', models.CharField(blank=True, max_length=150, null=True)),
+                ('company_display_name', models.CharField(blank=True, max_length=255, null=True)),
+                ('created_by_email', models.EmailField(blank=True, max_length=254, null=True)),
+                ('search_vector', django.contrib.postgres.search.SearchVectorField(blank=True, editable=False, null=True)),
+            ],
+            options={
+                'ordering': ['-created_at'],
+            },
+        ),
+        migrations.AddField(
+            model_name='joblisting',
+            name='category',
+            field=models.ForeignKey(db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='categories.category'),
+        ),
+        migrations.AddField(
+            model_name='joblisting',
+            name='company',
+            field=models.ForeignKey(db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='companies.company'),
+        ),
+        migrations.AddField(
+            model_name='joblisting',
+            name='created_by',
+            field=models.ForeignKey(db_constraint=False, null=True, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.RunPython(populate_listings, migrations.RunPython.noop),
+        PostgresOnly(
+            migrations.RunSQL(BACKFILL_SEARCH_VECTORS, migrations.RunSQL.noop),
+        ),
+        migrations.AddIndex(
+            model_name='joblisting',
+            index=models.Index(fields=['-created_at', '-id'], name='jobs_listing_created_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='joblisting',
+            index=models.Index(fields=['-updated_at', '-id'], name='jobs_listing_updated_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='joblisting',
+            index=models.Index(fields=['title', 'id'], name='jobs_listing_title_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='joblisting',
+            index=models.Index(fields=['-applications_count', '-id'], name='jobs_listing_popular_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='joblisting',
+            index=models.Index(fields=['is_active'], include=('job_type', 'category', 'category_name', 'location'), name='jobs_listing_facets_idx'),
+        ),
+        PostgresOnly(
+            migrations.AddIndex(
+                model_name='joblisting',
+                index=django.contrib.postgres.indexes.GinIndex(fields=['search_vector'], name='jobs_listing_search_gin'),
+            ),
+        ),
+        PostgresOnly(
+            migrations.AddIndex(
+                model_name='joblisting',
+                index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('location'), name='gin_trgm_ops'), name='jobs_listing_location_trgm'),
+            ),
+        ),
+        PostgresOnly(
+            migrations.AddIndex(
+                model_name='joblisting',
+                index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('category_name'), name='gin_trgm_ops'), name='jobs_listing_category_trgm'),
+            ),
+        ),
+        PostgresOnly(
+            migrations.AddIndex(
+                model_name='joblisting',
+                index=django.contrib.postgres.indexes.GinIndex(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('company_display_name'), name='gin_trgm_ops'), name='jobs_listing_company_trgm'),
+            ),
+        ),
+        # not PostgresOnly: SQLite table rebuilds re-create it from the state
+        migrations.RemoveIndex(
+            model_name='job',
+            name='jobs_job_search_gin',
+        ),
+        migrations.RemoveIndex(
+            model_name='job',
+            name='jobs_job_created_id_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='job',
+            name='jobs_job_updated_id_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='job',
+            name='jobs_job_title_id_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='job',
+            name='jobs_job_popular_id_idx',
+        ),
+        PostgresOnly(
+            migrations.RemoveIndex(
+                model_name='job',
+                name='jobs_job_location_trgm',
+            ),
+        ),
+        migrations.RemoveField(
+            model_name='job',
+            name='search_vector',
+        ),
+    ]
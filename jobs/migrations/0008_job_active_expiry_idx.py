@@ -0,0 +1,26 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:25
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('categories', '0002_category_categories_name_trgm'),
+        ('companies', '0002_company_companies_name_trgm'),
+        ('jobs', '0007_job_listing'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='job',
+            name='expiry_at',
+            field=models.DateTimeField(blank=True, help_text='Optional expiry date after which is_active is set to False.', null=True),
+        ),
+        migrations.AddIndex(
+            model_name='job',
+            index=models.Index(condition=models.Q(('expiry_at__isnull', False), ('is_active', True)), fields=['expiry_at'], name='jobs_job_active_expiry_idx'),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:42
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('jobs', '0008_job_active_expiry_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='JobSimilarity',
+            fields=[
+                ('job', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='similarity', serialize=False, to='jobs.job')),
+                ('term_ids', models.JSONField(default=list)),
+                ('term_counts', models.JSONField(default=list)),
+                ('neighbors', models.JSONField(default=list)),
+                ('vectorized_at', models.DateTimeField()),
+                ('computed_at', models.DateTimeField(blank=True, null=True)),
+            ],
+        ),
+    ]
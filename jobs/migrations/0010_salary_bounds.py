@@ -0,0 +1,90 @@
+# Generated by Django 5.2.8 on 2026-10-17 02:45
+
+from django.conf import settings
+from django.db import migrations, models
+
+from remosphere.operations import PostgresOnly
+
+
+def fill_listing_salary_defaults(apps, schema_editor):
+    JobListing = apps.get_model("jobs", "JobListing")
+    JobListing.objects.filter(salary_currency__isnull=True).update(salary_currency="")
+    JobListing.objects.filter(salary_sort__isnull=True).update(salary_sort=0)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('categories', '0003_category_updated_at'),
+        ('companies', '0003_company_updated_at'),
+        ('jobs', '0009_job_similarity'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='job',
+            name='salary_currency',
+            field=models.CharField(blank=True, default='', editable=False, max_length=3),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='salary_max',
+            field=models.PositiveBigIntegerField(blank=True, editable=False, null=True),
+        ),
+        migrations.AddField(
+            model_name='job',
+            name='salary_min',
+            field=models.PositiveBigIntegerField(blank=True, editable=False, null=True),
+        ),
+        # NOT NULL columns are added nullable, filled, then tightened:
+        # otherwise SQLite rebuilds the table, which cannot re-create
+        # the trigram indexes
+        migrations.AddField(
+            model_name='joblisting',
+            name='salary_currency',
+            field=models.CharField(blank=True, null=True, max_length=3),
+        ),
+        migrations.AddField(
+            model_name='joblisting',
+            name='salary_max',
+            field=models.PositiveBigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='joblisting',
+            name='salary_min',
+            field=models.PositiveBigIntegerField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='joblisting',
+            name='salary_sort',
+            field=models.PositiveBigIntegerField(null=True),
+        ),
+        migrations.RunPython(fill_listing_salary_defaults, migrations.RunPython.noop),
+        PostgresOnly(
+            migrations.AlterField(
+                model_name='joblisting',
+                name='salary_currency',
+                field=models.CharField(blank=True, default='', max_length=3),
+            ),
+        ),
+        PostgresOnly(
+            migrations.AlterField(
+                model_name='joblisting',
+                name='salary_sort',
+                field=models.PositiveBigIntegerField(default=0),
+            ),
+        ),
+        migrations.AddIndex(
+            model_name='joblisting',
+            index=models.Index(fields=['-salary_sort', '-id'], name='jobs_listing_salary_id_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='joblisting',
+            index=models.Index(fields=['salary_currency', 'salary_min'], name='jobs_listing_salary_min_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='joblisting',
+            index=models.Index(fields=['salary_currency', 'salary_max'], name='jobs_listing_salary_max_idx'),
+        ),
+    ]
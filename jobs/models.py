@@ -1,7 +1,24 @@
 from django.conf import settings
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models import F, Q
+from django.db.models.functions import Greatest, Upper
+from django.utils import timezone
 from django.utils.text import slugify
 
+from locations.normalize import resolve_locations
+from remosphere.cache import bump_generation
+from .salary import parse_salary_range
+
+
+def unexpired(now=None):
+    """
+    Jobs without an expiry date or whose expiry is still ahead.
+    A plain range test on expiry_at, so it stays index friendly.
+    """
+    return Q(expiry_at__isnull=True) | Q(expiry_at__gt=now or timezone.now())
+
 
 class Job(models.Model):
     """
@@ -23,6 +40,9 @@ class Job(models.Model):
         (JOB_TYPE_OTHER, "Other"),
     ]
 
+    # derived from salary_range
+    SALARY_FIELDS = ("salary_min", "salary_max", "salary_currency")
+
     title = models.CharField(max_length=255)
     description = models.TextField()
     category = models.ForeignKey(
@@ -34,8 +54,21 @@ class Job(models.Model):
         db_index=True
     )
     location = models.CharField(max_length=128, db_index=True)
+    # resolved from `location` on save (see locations.normalize)
+    normalized_location = models.ForeignKey(
+        "locations.Location",
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="jobs",
+        editable=False,
+    )
     job_type = models.CharField(max_length=32, choices=JOB_TYPE_CHOICES)
     salary_range = models.CharField(max_length=64, null=True, blank=True)
+    # parsed from salary_range on save (see jobs.salary)
+    salary_min = models.PositiveBigIntegerField(null=True, blank=True, editable=False)
+    salary_max = models.PositiveBigIntegerField(null=True, blank=True, editable=False)
+    salary_currency = models.CharField(max_length=3, blank=True, default="", editable=False)
     company_name = models.CharField(max_length=255)
     company = models.ForeignKey(
         "companies.Company",
@@ -56,20 +89,210 @@ class Job(models.Model):
     is_active = models.BooleanField(default=True)
     slug = models.URLField(max_length=255, unique=True, blank=True)
 
-    # optional expiry that can flip is_active if you want
+    # once past, jobs.tasks.deactivate_expired_jobs flips is_active
     expiry_at = models.DateTimeField(
         null=True,
         blank=True,
-        help_text="Optional expiry date after which is_active may be set to False.")
+        help_text="Optional expiry date after which is_active is set to False.")
+
+    # number of live (non-withdrawn) applications; maintained by the
+    # API write paths (applications.apply, ApplicationViewSet) and by
+    # user deletes (applications.signals); other bulk or raw deletes
+    # are repaired by `manage.py recount_applications`
+    applications_count = models.PositiveIntegerField(default=0, editable=False)
 
     class Meta:
         ordering = ["-created_at"]
+        # list/search indexes live on JobListing, the read model
         indexes = [
-            models.Index(fields=["title"]),
             models.Index(fields=["location"]),
             models.Index(fields=["category"]),
             models.Index(fields=["job_type"]),
+            # expiry sweeper: only the active jobs that can still expire
+            models.Index(
+                fields=["expiry_at"],
+                condition=Q(is_active=True, expiry_at__isnull=False),
+                name="jobs_job_active_expiry_idx",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.title} @ {self.company_name}"
+
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        derived = set()
+        if update_fields is None or "salary_range" in update_fields:
+            self.parse_salary()
+            derived.update(self.SALARY_FIELDS)
+        if update_fields is None or "location" in update_fields:
+            self.resolve_location()
+            derived.add("normalized_location")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, *derived}
+        super().save(*args, **kwargs)
+
+    def parse_salary(self):
+        """
+        Fill the salary bounds and currency from salary_range.
+        Bulk writes (bulk_create) must call it themselves.
+        """
+        self.salary_min, self.salary_max, self.salary_currency = (
+            parse_salary_range(self.salary_range)
+        )
+
+    def resolve_location(self):
+        """
+        Point normalized_location at the Location of `location`,
+        creating it if needed. Bulk writes use resolve_locations().
+        """
+        self.normalized_location = resolve_locations([self.location]).get(self.location)
+
+    @classmethod
+    def adjust_applications_count(cls, job_id, delta):
+        """
+        Shift the stored applications counter in a single UPDATE.
+        Call it inside the transaction that changes the application.
+        """
+        counter = Greatest(F("applications_count") + delta, 0)
+        updated = cls.objects.filter(pk=job_id).update(applications_count=counter)
+        JobListing.objects.filter(pk=job_id).update(applications_count=counter)
+        bump_generation(cls)
+        return updated
+
+
+class JobListing(models.Model):
+    """
+    Flattened, read-optimized projection of a Job (the job card).
+
+    One row per job with the category, company and creator data
+    already joined in, so the list, search and facets paths read a
+    single table. Job, Category, Company and User stay the write
+    model; `jobs.listing` keeps this table in sync from their signals.
+    """
+    id = models.BigIntegerField(primary_key=True)  # same as Job.id
+    title = models.CharField(max_length=255)
+    description = models.TextField()
+    location = models.CharField(max_length=128)
+    job_type = models.CharField(max_length=32, choices=Job.JOB_TYPE_CHOICES)
+    salary_range = models.CharField(max_length=64, null=True, blank=True)
+    salary_min = models.PositiveBigIntegerField(null=True, blank=True)
+    salary_max = models.PositiveBigIntegerField(null=True, blank=True)
+    salary_currency = models.CharField(max_length=3, blank=True, default="")
+    # non-null sort key for ?ordering=salary_sort: the best known
+    # bound, 0 when the salary is unknown
+    salary_sort = models.PositiveBigIntegerField(default=0)
+    company_name = models.CharField(max_length=255)
+    slug = models.URLField(max_length=255)
+    is_active = models.BooleanField(default=True)
+    expiry_at = models.DateTimeField(null=True, blank=True)
+    created_at = models.DateTimeField()
+    updated_at = models.DateTimeField()
+    applications_count = models.PositiveIntegerField(default=0)
+
+    # denormalized relations: ids for filtering, names for display
+    category = models.ForeignKey(
+        "categories.Category",
+        null=True,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+    )
+    category_name = models.CharField(max_length=150, null=True, blank=True)
+    company = models.ForeignKey(
+        "companies.Company",
+        null=True,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+    )
+    company_display_name = models.CharField(max_length=255, null=True, blank=True)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        null=True,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+    )
+    created_by_email = models.EmailField(null=True, blank=True)
+    normalized_location = models.ForeignKey(
+        "locations.Location",
+        null=True,
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name="+",
+    )
+    # Location.code, for the exact/IN location filters
+    location_code = models.CharField(max_length=128, null=True, blank=True)
+
+    # weighted full-text document (PostgreSQL), see jobs.search
+    search_vector = SearchVectorField(null=True, blank=True, editable=False)
+
+    class Meta:
+        ordering = ["-created_at"]
+        indexes = [
+            # keyset pagination: (ordering column, id) for each ordering
+            models.Index(fields=["-created_at", "-id"], name="jobs_listing_created_id_idx"),
+            models.Index(fields=["-updated_at", "-id"], name="jobs_listing_updated_id_idx"),
+            models.Index(fields=["title", "id"], name="jobs_listing_title_id_idx"),
+            models.Index(fields=["-applications_count", "-id"], name="jobs_listing_popular_id_idx"),
+            models.Index(fields=["-salary_sort", "-id"], name="jobs_listing_salary_id_idx"),
+            models.Index(fields=["location_code"], name="jobs_listing_location_code_idx"),
+            # salary range filters, compared within one currency
+            models.Index(
+                fields=["salary_currency", "salary_min"],
+                name="jobs_listing_salary_min_idx",
+            ),
+            models.Index(
+                fields=["salary_currency", "salary_max"],
+                name="jobs_listing_salary_max_idx",
+            ),
+            # covering index for facet counts (index-only scans)
+            models.Index(
+                fields=["is_active"],
+                include=["job_type", "category", "category_name", "location"],
+                name="jobs_listing_facets_idx",
+            ),
+            GinIndex(fields=["search_vector"], name="jobs_listing_search_gin"),
+            # pg_trgm: serves icontains (UPPER(..) LIKE) and fuzzy filters
+            GinIndex(
+                OpClass(Upper("location"), name="gin_trgm_ops"),
+                name="jobs_listing_location_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("category_name"), name="gin_trgm_ops"),
+                name="jobs_listing_category_trgm",
+            ),
+            GinIndex(
+                OpClass(Upper("company_display_name"), name="gin_trgm_ops"),
+                name="jobs_listing_company_trgm",
+            ),
         ]
 
     def __str__(self):
         return f"{self.title} @ {self.company_name}"
+
+
+class JobSimilarity(models.Model):
+    """
+    Precomputed "similar jobs" data of a job, see jobs.similarity.
+
+    `term_ids` / `term_counts` are the job's hashed term frequencies
+    (title, category and description); `neighbors` is its top-K list
+    of [job id, cosine similarity] under TF-IDF weighting, best first.
+    """
+    job = models.OneToOneField(
+        Job,
+        primary_key=True,
+        on_delete=models.CASCADE,
+        related_name="similarity",
+    )
+    term_ids = models.JSONField(default=list)
+    term_counts = models.JSONField(default=list)
+    neighbors = models.JSONField(default=list)
+    # stale once the job's updated_at moves past it
+    vectorized_at = models.DateTimeField()
+    computed_at = models.DateTimeField(null=True, blank=True)
+
+    def __str__(self):
+        return f"Similar jobs of {self.job_id}"
@@ -0,0 +1,106 @@
+"""
+Parses the free-text `Job.salary_range` ("$120,000 - $150,000",
+"£45k-£55k", "€45.000 - €55.000", "NGN 300,000", "Up to €60K"...)
+into numeric bounds and an ISO 4217 currency code, stored next to it
+for filtering and sorting.
+
+Experience requirements ("3-5 years") are not amounts, and hourly
+rates are left unparsed: the bounds are compared as salaries.
+"""
+import re
+
+CURRENCY_SYMBOLS = {
+    "$": "USD",
+    "£": "GBP",
+    "€": "EUR",
+    "₦": "NGN",
+    "¥": "JPY",
+    "₹": "INR",
+}
+# ISO 4217 (active codes); written upper case in the text, so that
+# words like "per", "all" or "top" are not taken for currencies
+CURRENCY_CODES = frozenset("""
+    AED AFN ALL AMD ANG AOA ARS AUD AWG AZN BAM BBD BDT BGN BHD BIF BMD
+    BND BOB BRL BSD BTN BWP BYN BZD CAD CDF CHF CLP CNY COP CRC CUP CVE
+    CZK DJF DKK DOP DZD EGP ERN ETB EUR FJD FKP GBP GEL GHS GIP GMD GNF
+    GTQ GYD HKD HNL HTG HUF IDR ILS INR IQD IRR ISK JMD JOD JPY KES KGS
+    KHR KMF KPW KRW KWD KYD KZT LAK LBP LKR LRD LSL LYD MAD MDL MGA MKD
+    MMK MNT MOP MRU MUR MVR MWK MXN MYR MZN NAD NGN NIO NOK NPR NZD OMR
+    PAB PEN PGK PHP PKR PLN PYG QAR RON RSD RUB RWF SAR SBD SCR SDG SEK
+    SGD SHP SLE SOS SRD SSP STN SVC SYP SZL THB TJS TMT TND TOP TRY TTD
+    TWD TZS UAH UGX USD UYU UZS VES VND VUV WST XAF XCD XOF XPF YER ZAR
+    ZMW ZWL
+""".split())
+CURRENCY_CODE_RE = re.compile(r"\b([A-Z]{3})\b")
+# 120,000 / 45.000 / 120000 / 120.5k / 1.2M / 45.000,50
+AMOUNT_RE = re.compile(r"(\d(?:[\d.,]*\d)?)\s*([kKmM])?(?![\w])")
+# a separator followed by exactly three digits groups thousands
+THOUSANDS_RE = re.compile(r"[.,]\d{3}$")
+MULTIPLIERS = {"k": 1_000, "m": 1_000_000}
+# "3-5 years", "5+ yrs": experience, not money
+EXPERIENCE_RE = re.compile(
+    r"\d+(?:\s*(?:-|–|to)\s*\d+)?\s*\+?\s*(?:years?|yrs?)\b", re.IGNORECASE
+)
+HOURLY_RE = re.compile(r"/\s*(?:hr|hour|h)\b|\bper hour\b|\bhourly\b|\ban hour\b", re.IGNORECASE)
+UPPER_ONLY_RE = re.compile(r"\b(up to|upto|max(imum)?)\b", re.IGNORECASE)
+LOWER_ONLY_RE = re.compile(r"\b(from|min(imum)?)\b|\+", re.IGNORECASE)
+
+
+def parse_amount(number):
+    """
+    The value of a number written with "," or "." as thousands
+    and/or decimal separators.
+    """
+    separators = [char for char in number if char in ",."]
+    if len(set(separators)) == 2:
+        # "45.000,50" / "45,000.50": the last one is the decimal point
+        decimal = separators[-1]
+        thousands = "," if decimal == "." else "."
+        return float(number.replace(thousands, "").replace(decimal, "."))
+    if len(separators) > 1 or (separators and THOUSANDS_RE.search(number)):
+        return float(number.replace(separators[0], ""))
+    return float(number.replace(",", "."))
+
+
+def parse_salary_range(text):
+    """
+    (salary_min, salary_max, currency) parsed from `text`;
+    unknown parts are None ("" for the currency).
+    """
+    if not text:
+        return None, None, ""
+
+    currency = ""
+    for symbol, code in CURRENCY_SYMBOLS.items():
+        if symbol in text:
+            currency = code
+            break
+    if not currency:
+        for code in CURRENCY_CODE_RE.findall(text):
+            if code in CURRENCY_CODES:
+                currency = code
+                break
+
+    if HOURLY_RE.search(text):
+        return None, None, currency
+
+    text = EXPERIENCE_RE.sub(" ", text)
+    amounts = []
+    for number, suffix in AMOUNT_RE.findall(text):
+        value = parse_amount(number)
+        if suffix:
+            value *= MULTIPLIERS[suffix.lower()]
+        amounts.append(int(value))
+    # "45-55k": the suffix of the upper bound applies to both
+    if len(amounts) == 2 and amounts[0] < 1_000 <= amounts[1] and amounts[0] * 1_000 <= amounts[1]:
+        amounts[0] *= 1_000
+
+    if not amounts:
+        return None, None, currency
+    if len(amounts) == 1:
+        if UPPER_ONLY_RE.search(text):
+            return None, amounts[0], currency
+        if LOWER_ONLY_RE.search(text):
+            return amounts[0], None, currency
+        return amounts[0], amounts[0], currency
+    return min(amounts[:2]), max(amounts[:2]), currency
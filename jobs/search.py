@@ -0,0 +1,80 @@
+"""
+Full-text search for job postings.
+
+On PostgreSQL every JobListing keeps a weighted tsvector document in
+`search_vector` (GIN indexed), so `?search=` is an index lookup
+ranked by relevance instead of a chain of ILIKE '%term%' ORs.
+Other databases (e.g. SQLite for local tests) fall back to
+DRF's SearchFilter over the view's `search_fields`.
+"""
+
+from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVector
+from django.db import connections
+from django.db.models import F, FloatField
+from django.db.models.functions import Cast
+from rest_framework import filters
+
+SEARCH_CONFIG = "english"
+
+
+def is_postgres(queryset):
+    return connections[queryset.db].vendor == "postgresql"
+
+
+def listing_search_vector():
+    """
+    The weighted search document of a job listing.
+    Title and company rank above category and location,
+    which in turn rank above the description.
+    """
+    return (
+        SearchVector("title", weight="A", config=SEARCH_CONFIG)
+        + SearchVector("company_name", weight="A", config=SEARCH_CONFIG)
+        + SearchVector("company_display_name", weight="A", config=SEARCH_CONFIG)
+        + SearchVector("category_name", weight="B", config=SEARCH_CONFIG)
+        + SearchVector("location", weight="B", config=SEARCH_CONFIG)
+        + SearchVector("job_type", weight="C", config=SEARCH_CONFIG)
+        + SearchVector("description", weight="D", config=SEARCH_CONFIG)
+    )
+
+
+def update_search_vectors(queryset):
+    """
+    Recompute the search document for every listing in `queryset`
+    with a single UPDATE. No-op outside PostgreSQL.
+    """
+    if not is_postgres(queryset):
+        return 0
+    return queryset.order_by().update(search_vector=listing_search_vector())
+
+
+class JobSearchFilter(filters.SearchFilter):
+    """
+    Drop-in replacement for SearchFilter on the `search=` parameter.
+
+    PostgreSQL: matches `search_vector` with a websearch query and
+    orders by relevance (annotated as `search_rank`), newest first
+    on ties. An explicit `?ordering=` still takes precedence.
+    """
+    rank_field = "search_rank"
+
+    def filter_queryset(self, request, queryset, view):
+        if not is_postgres(queryset):
+            return super().filter_queryset(request, queryset, view)
+
+        terms = self.get_search_terms(request)
+        if not terms:
+            return queryset
+
+        query = SearchQuery(
+            " ".join(terms), search_type="websearch", config=SEARCH_CONFIG
+        )
+        return (
+            queryset.filter(search_vector=query)
+            .annotate(**{
+                self.rank_field: Cast(
+                    SearchRank(F("search_vector"), query), FloatField()
+                )
+            })
+            .order_by(f"-{self.rank_field}", "-created_at")
+        )
@@ -1,10 +1,55 @@
 from rest_framework import serializers
-from .models import Job
+from .models import Job, JobListing
 from categories.models import Category
 from companies.models import Company
 
 
-class JobSerializer(serializers.ModelSerializer):
+class SparseFieldsMixin:
+    """
+    Serializes only the fields named in context["fields"] (a sparse
+    fieldset, see JobViewSet), and knows which columns and joins
+    those fields read, so the view can defer everything else.
+    """
+    # columns a field reads besides its own source
+    sparse_extra_columns = {}
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        selected = self.context.get("fields")
+        if selected is not None:
+            for field_name in list(self.fields):
+                if field_name not in selected:
+                    self.fields.pop(field_name)
+
+    @classmethod
+    def field_names(cls):
+        return list(cls().fields)
+
+    @classmethod
+    def sparse_queryset(cls, queryset, field_names, extra_columns=()):
+        """
+        Load only the columns (and select_related joins) that
+        `field_names` need. Returns `queryset` untouched if a field
+        reads something that is not a model field.
+        """
+        fields = cls().fields
+        opts = queryset.model._meta
+        columns, joins = {"pk", *extra_columns}, set()
+        for field_name in field_names:
+            source = fields[field_name].source
+            path = source.split(".")
+            if source == "*" or path[0] not in {f.name for f in opts.get_fields()}:
+                return queryset
+            columns.update(cls.sparse_extra_columns.get(field_name, ()))
+            columns.add("__".join(path))
+            for depth in range(1, len(path)):
+                relation = "__".join(path[:depth])
+                joins.add(relation)
+                columns.add(relation)
+        return queryset.select_related(*joins).only(*columns)
+
+
+class JobSerializer(SparseFieldsMixin, serializers.ModelSerializer):
     """
     The Serializer for Job Postings.
     """
@@ -24,6 +69,11 @@ class JobSerializer(serializers.ModelSerializer):
 
     applications_count = serializers.IntegerField(read_only=True)
 
+    location_code = serializers.CharField(
+        source="normalized_location.code",
+        read_only=True
+    )
+
     class Meta:
         model = Job
         fields = "__all__"
@@ -34,7 +84,10 @@ class JobSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
             "slug",
-            "applications_count"
+            "applications_count",
+            "salary_min",
+            "salary_max",
+            "salary_currency",
         ]
 
     def __init__(self, *args, **kwargs):
@@ -46,3 +99,89 @@ class JobSerializer(serializers.ModelSerializer):
 
         if "company" in self.fields:
             self.fields["company"].queryset = Company.objects.all()
+
+
+class JobIngestSerializer(serializers.ModelSerializer):
+    """
+    One item of a bulk ingest (see jobs.ingest). Relations are plain
+    ids and the slug is not checked here: both are resolved for the
+    whole batch at once.
+    """
+    category = serializers.IntegerField(required=False, allow_null=True)
+    company = serializers.IntegerField(required=False, allow_null=True)
+    slug = serializers.CharField(max_length=255, required=False, allow_blank=True)
+
+    class Meta:
+        model = Job
+        fields = [
+            "title",
+            "description",
+            "location",
+            "job_type",
+            "salary_range",
+            "company_name",
+            "category",
+            "company",
+            "is_active",
+            "expiry_at",
+            "slug",
+        ]
+
+
+class JobListingSerializer(SparseFieldsMixin, serializers.ModelSerializer):
+    """
+    Read-only job card served from the JobListing read model.
+    Produces exactly the same representation as JobSerializer.
+    """
+    created_by = serializers.CharField(source="created_by_email", read_only=True)
+    company_name = serializers.CharField(
+        source="company_display_name",
+        read_only=True
+    )
+
+    # JobSerializer skips these keys when the relation is empty
+    # (its dotted sources cannot be resolved), so do the same
+    relation_fields = {
+        "created_by": "created_by_id",
+        "category_name": "category_id",
+        "company_name": "company_id",
+        "location_code": "normalized_location_id",
+    }
+    sparse_extra_columns = {
+        field_name: [column] for field_name, column in relation_fields.items()
+    }
+
+    class Meta:
+        model = JobListing
+        fields = [
+            "id",
+            "created_by",
+            "category_name",
+            "company_name",
+            "applications_count",
+            "location_code",
+            "title",
+            "description",
+            "location",
+            "job_type",
+            "salary_range",
+            "salary_min",
+            "salary_max",
+            "salary_currency",
+            "created_at",
+            "updated_at",
+            "is_active",
+            "slug",
+            "expiry_at",
+            "category",
+            "normalized_location",
+            "company",
+        ]
+        read_only_fields = fields
+
+    def to_representation(self, instance):
+        data = super().to_representation(instance)
+        for field_name, relation in self.relation_fields.items():
+            if field_name in data and getattr(instance, relation) is None:
+                data.pop(field_name, None)
+        return data
@@ -0,0 +1,113 @@
+from django.contrib.auth import get_user_model
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from categories.models import Category
+from companies.models import Company
+from locations.models import Location
+from remosphere.cache import bump_generation
+from .listing import refresh_listings, update_listings
+from .models import Job, JobListing
+
+User = get_user_model()
+
+
+@receiver(post_save, sender=Job)
+def refresh_job_listing(sender, instance, **kwargs):
+    """
+    Rebuild the job's listing row (and search document).
+    """
+    refresh_listings([instance.pk])
+
+
+@receiver(post_delete, sender=Job)
+def delete_job_listing(sender, instance, **kwargs):
+    JobListing.objects.filter(pk=instance.pk).delete()
+
+
+@receiver(post_save, sender=Category)
+def rename_category_listings(sender, instance, created, **kwargs):
+    """
+    A renamed category changes the card and search document of all its jobs.
+    """
+    if not created:
+        update_listings(
+            JobListing.objects.filter(category_id=instance.pk),
+            category_name=instance.name,
+        )
+
+
+@receiver(post_delete, sender=Category)
+def detach_category_listings(sender, instance, **kwargs):
+    # Job.category is SET_NULL through a bulk UPDATE, without signals
+    update_listings(
+        JobListing.objects.filter(category_id=instance.pk),
+        category=None,
+        category_name=None,
+    )
+
+
+@receiver(post_save, sender=Company)
+def rename_company_listings(sender, instance, created, **kwargs):
+    """
+    A renamed company changes the card and search document of all its jobs.
+    """
+    if not created:
+        update_listings(
+            JobListing.objects.filter(company_id=instance.pk),
+            company_display_name=instance.name,
+        )
+
+
+@receiver(post_delete, sender=Company)
+def detach_company_listings(sender, instance, **kwargs):
+    # Job.company is SET_NULL through a bulk UPDATE, without signals
+    update_listings(
+        JobListing.objects.filter(company_id=instance.pk),
+        company=None,
+        company_display_name=None,
+    )
+
+
+@receiver(post_save, sender=Location)
+def recode_location_listings(sender, instance, created, **kwargs):
+    """
+    A changed location code is pushed to the cards of all its jobs.
+    """
+    if not created:
+        JobListing.objects.filter(normalized_location_id=instance.pk).exclude(
+            location_code=instance.code
+        ).update(location_code=instance.code)
+
+
+@receiver(post_delete, sender=Location)
+def detach_location_listings(sender, instance, **kwargs):
+    # Job.normalized_location is SET_NULL through a bulk UPDATE, without signals
+    JobListing.objects.filter(normalized_location_id=instance.pk).update(
+        normalized_location=None, location_code=None
+    )
+
+
+@receiver(post_save, sender=User)
+def update_creator_email_listings(sender, instance, created, update_fields=None, **kwargs):
+    if created or (update_fields and "email" not in update_fields):
+        return
+    JobListing.objects.filter(created_by_id=instance.pk).exclude(
+        created_by_email=instance.email
+    ).update(created_by_email=instance.email)
+
+
+@receiver(post_delete, sender=User)
+def detach_creator_listings(sender, instance, **kwargs):
+    JobListing.objects.filter(created_by_id=instance.pk).update(
+        created_by=None, created_by_email=None
+    )
+
+
+@receiver(post_save, sender=Job)
+@receiver(post_delete, sender=Job)
+def invalidate_cached_job_responses(sender, **kwargs):
+    """
+    Any job write invalidates the cached job responses.
+    """
+    bump_generation(Job)
@@ -0,0 +1,214 @@
+"""
+Content-based "similar jobs", precomputed by Celery
+(jobs.tasks.update_similar_jobs).
+
+Each job's title, category name and description are tokenized into
+hashed term frequencies (stored on JobSimilarity, so unchanged jobs
+are never re-tokenized). The active jobs' vectors form a sparse
+matrix, weighted by TF-IDF and L2-normalized, so a row product is
+the cosine similarity; each job keeps its top-K neighbours.
+
+Incremental runs only vectorize jobs whose `updated_at` moved past
+their `vectorized_at`, recompute those jobs' neighbour lists and
+merge them into the lists of the jobs they are close to. A periodic
+full run recomputes everything (new IDF weights, renamed categories).
+"""
+import math
+import re
+import zlib
+from collections import Counter
+
+import numpy as np
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils import timezone
+from scipy import sparse
+
+from remosphere.cache import bump_generation
+from .models import Job, JobSimilarity
+
+# hashed feature space: no vocabulary to store or keep in sync
+N_FEATURES = 1 << 20
+# title terms count three times, category terms twice
+FIELD_WEIGHTS = (("title", 3), ("category__name", 2), ("description", 1))
+TOKEN_RE = re.compile(r"[a-z0-9][a-z0-9+#]*")
+STOP_WORDS = frozenset("""
+    a about all an and any are as at be but by can do for from has have
+    in into is it its may more must not of on or our over so such that
+    the their them then there these they this to up us was we were what
+    when which while who will with within you your
+""".split())
+# rows multiplied against the whole matrix at once
+BLOCK_SIZE = 256
+
+
+def get_k():
+    return getattr(settings, "SIMILAR_JOBS_K", 20)
+
+
+def feature(token):
+    # crc32, unlike hash(), is stable across processes
+    return zlib.crc32(token.encode("utf-8")) % N_FEATURES
+
+
+def term_frequencies(values):
+    """
+    (term ids, counts) of a job, from its FIELD_WEIGHTS values.
+    """
+    counts = Counter()
+    for (_, weight), text in zip(FIELD_WEIGHTS, values):
+        for token in TOKEN_RE.findall((text or "").lower()):
+            if len(token) > 1 and token not in STOP_WORDS:
+                counts[feature(token)] += weight
+    term_ids = sorted(counts)
+    return term_ids, [counts[term_id] for term_id in term_ids]
+
+
+def vectorize(jobs, now):
+    """
+    Store the term frequencies of `jobs` (a Job queryset).
+    Returns the ids of the vectorized jobs.
+    """
+    fields = [name for name, _ in FIELD_WEIGHTS]
+    vectorized, rows = [], []
+    values_list = jobs.values_list("pk", *fields).iterator(chunk_size=2000)
+    for pk, *values in values_list:
+        term_ids, term_counts = term_frequencies(values)
+        rows.append(JobSimilarity(
+            job_id=pk, term_ids=term_ids, term_counts=term_counts, vectorized_at=now
+        ))
+        vectorized.append(pk)
+        if len(rows) == 2000:
+            _save_vectors(rows)
+            rows = []
+    _save_vectors(rows)
+    return vectorized
+
+
+def _save_vectors(rows):
+    JobSimilarity.objects.bulk_create(
+        rows,
+        update_conflicts=True,
+        unique_fields=["job"],
+        update_fields=["term_ids", "term_counts", "vectorized_at"],
+    )
+
+
+def tfidf_matrix(now):
+    """
+    (job ids, L2-normalized TF-IDF CSR matrix) of the visible jobs.
+    """
+    visible = JobSimilarity.objects.filter(
+        Q(job__expiry_at__isnull=True) | Q(job__expiry_at__gt=now),
+        job__is_active=True,
+    ).order_by("pk")
+    ids, indptr, indices, data = [], [0], [], []
+    for pk, term_ids, term_counts in visible.values_list(
+        "pk", "term_ids", "term_counts"
+    ).iterator(chunk_size=2000):
+        ids.append(pk)
+        indices.extend(term_ids)
+        # sublinear tf: a term repeated ten times is not ten times as relevant
+        data.extend(1.0 + math.log(count) for count in term_counts)
+        indptr.append(len(indices))
+
+    matrix = sparse.csr_matrix(
+        (np.array(data, dtype=np.float32), np.array(indices, dtype=np.int32), indptr),
+        shape=(len(ids), N_FEATURES),
+    )
+    document_frequency = np.bincount(matrix.indices, minlength=N_FEATURES)
+    idf = np.log((1 + len(ids)) / (1 + document_frequency)).astype(np.float32) + 1
+    matrix = matrix.multiply(idf).tocsr()
+
+    norms = np.sqrt(np.asarray(matrix.multiply(matrix).sum(axis=1)).ravel())
+    norms[norms == 0] = 1
+    matrix = sparse.diags(1 / norms).dot(matrix).tocsr()
+    return np.array(ids), matrix
+
+
+def top_neighbors(ids, matrix, rows, k):
+    """
+    {job id: [[neighbour id, score], ...]} for the matrix `rows`.
+    """
+    transposed = matrix.T.tocsr()
+    neighbors = {}
+    for start in range(0, len(rows), BLOCK_SIZE):
+        block = rows[start:start + BLOCK_SIZE]
+        scores = (matrix[block] @ transposed).tocsr()
+        for offset, row in enumerate(block):
+            cols = scores.indices[scores.indptr[offset]:scores.indptr[offset + 1]]
+            vals = scores.data[scores.indptr[offset]:scores.indptr[offset + 1]]
+            keep = cols != row
+            cols, vals = cols[keep], vals[keep]
+            if len(vals) > k:
+                best = np.argpartition(-vals, k)[:k]
+                cols, vals = cols[best], vals[best]
+            order = np.argsort(-vals, kind="stable")
+            neighbors[int(ids[row])] = [
+                [int(ids[col]), round(float(vals[i]), 4)]
+                for i, col in zip(order, cols[order])
+            ]
+    return neighbors
+
+
+def merge_neighbors(current, job_id, score, k):
+    """
+    `current` with job_id's entry replaced by `score`, best k kept.
+    """
+    merged = [entry for entry in current if entry[0] != job_id]
+    merged.append([job_id, score])
+    merged.sort(key=lambda entry: -entry[1])
+    return merged[:k]
+
+
+def update_similar_jobs(full=False):
+    """
+    Refresh the stored vectors and neighbour lists; only the jobs
+    changed since their last run unless `full`. Returns the number
+    of jobs whose neighbours were recomputed.
+    """
+    now = timezone.now()
+    k = get_k()
+    jobs = Job.objects.order_by()
+    if not full:
+        jobs = jobs.filter(
+            Q(similarity__isnull=True) | Q(similarity__vectorized_at__lt=F("updated_at"))
+        )
+    changed = vectorize(jobs, now)
+    if not changed and not full:
+        return 0
+
+    ids, matrix = tfidf_matrix(now)
+    position = {int(pk): row for row, pk in enumerate(ids)}
+    rows = list(range(len(ids))) if full else [
+        position[pk] for pk in changed if pk in position
+    ]
+    neighbors = top_neighbors(ids, matrix, rows, k)
+
+    if not full:
+        # a changed job may now belong in the lists of its neighbours
+        affected = {}
+        for job_id, entries in neighbors.items():
+            for neighbor_id, score in entries:
+                affected.setdefault(neighbor_id, []).append((job_id, score))
+        for similarity in JobSimilarity.objects.filter(
+            pk__in=[pk for pk in affected if pk not in neighbors]
+        ).only("pk", "neighbors"):
+            merged = similarity.neighbors
+            for job_id, score in affected[similarity.pk]:
+                merged = merge_neighbors(merged, job_id, score, k)
+            neighbors[similarity.pk] = merged
+
+    JobSimilarity.objects.bulk_create(
+        [
+            JobSimilarity(job_id=pk, neighbors=entries, vectorized_at=now, computed_at=now)
+            for pk, entries in neighbors.items()
+        ],
+        batch_size=1000,
+        update_conflicts=True,
+        unique_fields=["job"],
+        update_fields=["neighbors", "computed_at"],
+    )
+    bump_generation(JobSimilarity)
+    return len(rows)
+
@@ -0,0 +1,70 @@
+"""
+Periodic job maintenance, scheduled by Celery beat
+(see CELERY_BEAT_SCHEDULE in the settings).
+"""
+import logging
+
+from celery import shared_task
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from remosphere.cache import bump_generation
+from .models import Job, JobListing
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task
+def deactivate_expired_jobs(batch_size=None):
+    """
+    Flip `is_active` off for every active job past its `expiry_at`.
+
+    Works in short batches, each its own transaction, picked with
+    `is_active AND expiry_at <= now ORDER BY expiry_at LIMIT n`,
+    which is a range scan of the partial index jobs_job_active_expiry_idx.
+    Rows locked by another sweeper are skipped.
+    """
+    batch_size = batch_size or getattr(settings, "JOB_EXPIRY_BATCH_SIZE", 500)
+    now = timezone.now()
+    expired = Job.objects.filter(
+        is_active=True, expiry_at__isnull=False, expiry_at__lte=now
+    ).order_by("expiry_at")
+
+    deactivated = 0
+    while True:
+        with transaction.atomic():
+            pks = list(
+                expired.select_for_update(skip_locked=True)
+                .values_list("pk", flat=True)[:batch_size]
+            )
+            if not pks:
+                break
+            deactivated += Job.objects.filter(pk__in=pks, is_active=True).update(
+                is_active=False, updated_at=now
+            )
+            JobListing.objects.filter(pk__in=pks).update(
+                is_active=False, updated_at=now
+            )
+        if len(pks) < batch_size:
+            break
+
+    if deactivated:
+        bump_generation(Job)
+        logger.info("Deactivated %s expired jobs", deactivated)
+    return deactivated
+
+
+@shared_task
+def update_similar_jobs(full=False):
+    """
+    Recompute the "similar jobs" lists: incrementally for the jobs
+    changed since the last run, or everything with `full`.
+    """
+    # numpy/scipy are only needed here, not by the web workers
+    from . import similarity
+
+    recomputed = similarity.update_similar_jobs(full=full)
+    if recomputed:
+        logger.info("Recomputed similar jobs of %s jobs", recomputed)
+    return recomputed
@@ -1,3 +1,332 @@
-from django.test import TestCase
+import base64
+import io
+import json
+import unittest
+from unittest import mock
 
-# Create your tests here.
+from django.db import IntegrityError
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from remosphere import renderers
+from remosphere.cache import bump_generation
+from users.models import User
+from . import ingest
+from .models import Job, JobListing, JobSimilarity
+from .salary import parse_salary_range
+
+LOCAL_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+def make_job(**kwargs):
+    fields = {
+        "title": "Backend Engineer",
+        "description": "Build APIs",
+        "location": "Remote",
+        "job_type": "full_time",
+        "company_name": "Acme",
+        "slug": "https://example.com/jobs/backend-engineer",
+    }
+    fields.update(kwargs)
+    return Job.objects.create(**fields)
+
+
+class ParseSalaryRangeTests(SimpleTestCase):
+    def test_ranges(self):
+        cases = {
+            "$120,000 - $150,000": (120_000, 150_000, "USD"),
+            "£45k-£55k": (45_000, 55_000, "GBP"),
+            "45-55k EUR": (45_000, 55_000, "EUR"),
+            "€45.000 - €55.000": (45_000, 55_000, "EUR"),
+            "€45.000,50 - €55.000,50": (45_000, 55_000, "EUR"),
+            "1.2M - 1.5M NGN": (1_200_000, 1_500_000, "NGN"),
+            "NGN 300,000": (300_000, 300_000, "NGN"),
+            "Up to €60K": (None, 60_000, "EUR"),
+            "From 80k USD": (80_000, None, "USD"),
+        }
+        for text, expected in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(parse_salary_range(text), expected)
+
+    def test_only_iso_currency_codes(self):
+        self.assertEqual(parse_salary_range("90k per year"), (90_000, 90_000, ""))
+        self.assertEqual(parse_salary_range("60k DOE"), (60_000, 60_000, ""))
+        self.assertEqual(parse_salary_range("All inclusive, 70k CHF"), (70_000, 70_000, "CHF"))
+
+    def test_years_of_experience_are_not_amounts(self):
+        self.assertEqual(parse_salary_range("3-5 years, $90k"), (90_000, 90_000, "USD"))
+        self.assertEqual(parse_salary_range("5+ yrs, $90k"), (90_000, 90_000, "USD"))
+
+    def test_hourly_rates_are_skipped(self):
+        self.assertEqual(parse_salary_range("$40/hr - $60/hr"), (None, None, "USD"))
+        self.assertEqual(parse_salary_range("£30 per hour"), (None, None, "GBP"))
+
+    def test_empty(self):
+        self.assertEqual(parse_salary_range(""), (None, None, ""))
+        self.assertEqual(parse_salary_range("Competitive"), (None, None, ""))
+
+
+@unittest.skipIf(renderers.msgpack is None, "msgpack is not installed")
+@override_settings(CACHES=LOCAL_CACHE)
+class MessagePackTests(TestCase):
+    def setUp(self):
+        make_job()
+        self.client = APIClient()
+        self.client.force_authenticate(
+            User.objects.create_user("applicant@example.com", "Ada", "Obi", "pw")
+        )
+
+    def test_list_round_trips_the_json_payload(self):
+        as_json = self.client.get("/api/jobs/", HTTP_ACCEPT="application/json")
+        as_msgpack = self.client.get("/api/jobs/", HTTP_ACCEPT="application/msgpack")
+        self.assertEqual(as_msgpack["Content-Type"], "application/msgpack")
+        self.assertEqual(
+            renderers.MessagePackParser().parse(io.BytesIO(as_msgpack.content)),
+            as_json.json(),
+        )
+
+
+@override_settings(CACHES=LOCAL_CACHE)
+class SimilarJobsCacheTests(TestCase):
+    def setUp(self):
+        self.job, self.first, self.second = [
+            make_job(title=f"Backend Engineer {i}", slug=f"https://example.com/jobs/{i}")
+            for i in range(3)
+        ]
+        JobSimilarity.objects.create(
+            job=self.job, neighbors=[[self.first.pk, 0.9]], vectorized_at=timezone.now()
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(
+            User.objects.create_user("applicant@example.com", "Ada", "Obi", "pw")
+        )
+
+    def similar_ids(self):
+        response = self.client.get(f"/api/jobs/{self.job.pk}/similar/")
+        return [card["id"] for card in response.data]
+
+    def test_similarity_refresh_only_invalidates_similar(self):
+        self.assertEqual(self.similar_ids(), [self.first.pk])
+        etag = self.client.get("/api/jobs/")["ETag"]
+
+        # what jobs.similarity does after rewriting the lists
+        with self.captureOnCommitCallbacks(execute=True):
+            JobSimilarity.objects.filter(pk=self.job.pk).update(
+                neighbors=[[self.second.pk, 0.8]]
+            )
+            bump_generation(JobSimilarity)
+
+        self.assertEqual(self.similar_ids(), [self.second.pk])
+        self.assertEqual(self.client.get("/api/jobs/")["ETag"], etag)
+
+
+@override_settings(CACHES=LOCAL_CACHE)
+class IngestJobsTests(TestCase):
+    def item(self, **kwargs):
+        fields = {
+            "title": "Backend Engineer",
+            "description": "Build APIs",
+            "location": "Lagos, NG",
+            "job_type": "full_time",
+            "company_name": "Acme",
+        }
+        fields.update(kwargs)
+        return fields
+
+    def test_create_and_update_by_slug(self):
+        result = ingest.ingest_jobs([self.item(salary_range="$90k - $120k")])
+        self.assertEqual((result["created"], result["updated"], result["errors"]), (1, 0, []))
+        [created] = result["results"]
+        self.assertEqual(created["slug"], "backend-engineer-acme")
+        job = Job.objects.get(pk=created["id"])
+        self.assertEqual((job.salary_min, job.salary_max), (90_000, 120_000))
+        self.assertEqual(job.normalized_location.code, "lagos-ng")
+
+        result = ingest.ingest_jobs([self.item(slug=job.slug, title="Staff Engineer")])
+        self.assertEqual((result["created"], result["updated"]), (0, 1))
+        self.assertEqual(result["results"][0]["id"], job.pk)
+        job.refresh_from_db()
+        self.assertEqual(job.title, "Staff Engineer")
+        # the read model follows bulk writes too
+        self.assertEqual(JobListing.objects.get(pk=job.pk).title, "Staff Engineer")
+
+    def test_invalid_items_are_reported_by_index(self):
+        result = ingest.ingest_jobs([
+            self.item(),
+            self.item(job_type=None, title=""),
+            self.item(category=999),
+        ])
+        self.assertEqual(result["created"], 1)
+        self.assertEqual([error["index"] for error in result["errors"]], [1, 2])
+        self.assertIn("title", result["errors"][0]["errors"])
+        self.assertIn("category", result["errors"][1]["errors"])
+        self.assertEqual(Job.objects.count(), 1)
+
+    def test_slug_collisions(self):
+        make_job(slug="backend-engineer-acme")
+        result = ingest.ingest_jobs([
+            self.item(),
+            self.item(),
+            self.item(slug="https://example.com/jobs/1"),
+            self.item(slug="https://example.com/jobs/1"),
+        ])
+        self.assertEqual(
+            [item["slug"] for item in result["results"]],
+            ["backend-engineer-acme-1", "backend-engineer-acme-2", "https://example.com/jobs/1"],
+        )
+        self.assertEqual(result["errors"], [
+            {"index": 3, "errors": {"slug": ["Duplicated in this batch."]}},
+        ])
+
+    def test_taken_slugs_ignores_other_prefixes(self):
+        for slug in ["dev", "dev-2", "dev-ops", "developer"]:
+            make_job(slug=slug)
+        self.assertEqual(ingest.taken_slugs({"dev"}), {"dev", "dev-2"})
+
+    def test_slug_race_is_retried(self):
+        write = ingest._write
+        calls = []
+
+        def racing_write(valid, user):
+            calls.append(1)
+            if len(calls) == 1:
+                raise IntegrityError("duplicate key value violates unique constraint")
+            return write(valid, user)
+
+        with mock.patch.object(ingest, "_write", racing_write):
+            result = ingest.ingest_jobs([self.item()])
+        self.assertEqual((len(calls), result["created"]), (2, 1))
+
+
+@override_settings(CACHES=LOCAL_CACHE)
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        # two titles only: pages split ties on the ordering column
+        self.ids = [
+            make_job(title=f"Engineer {i % 2}", slug=f"https://example.com/jobs/{i}").pk
+            for i in range(5)
+        ]
+        self.client = APIClient()
+        self.client.force_authenticate(
+            User.objects.create_user("applicant@example.com", "Ada", "Obi", "pw")
+        )
+
+    def get(self, url):
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return response.data
+
+    def walk(self, url):
+        pages = [self.get(url)]
+        while pages[-1]["next"]:
+            pages.append(self.get(pages[-1]["next"]))
+        return pages
+
+    @staticmethod
+    def ids_of(page):
+        return [card["id"] for card in page["results"]]
+
+    def test_forward_and_backward(self):
+        pages = self.walk("/api/jobs/?page_size=2")
+        self.assertEqual([self.ids_of(page) for page in pages], [
+            self.ids[:-3:-1], self.ids[-3:-5:-1], self.ids[:1],
+        ])
+        self.assertIsNone(pages[0]["previous"])
+        # back from the last page
+        self.assertEqual(self.ids_of(self.get(pages[2]["previous"])), self.ids_of(pages[1]))
+        self.assertEqual(self.ids_of(self.get(pages[1]["previous"])), self.ids_of(pages[0]))
+
+    def test_ties_on_the_ordering_column(self):
+        for ordering in ("title", "-title"):
+            with self.subTest(ordering=ordering):
+                pages = self.walk(f"/api/jobs/?ordering={ordering}&page_size=2")
+                ids = [job_id for page in pages for job_id in self.ids_of(page)]
+                self.assertEqual(sorted(ids), self.ids)
+                titles = [
+                    Job.objects.get(pk=job_id).title for job_id in ids
+                ]
+                self.assertEqual(titles, sorted(titles, reverse=ordering.startswith("-")))
+
+    def test_invalid_cursors(self):
+        next_link = self.get("/api/jobs/?ordering=title&page_size=2")["next"]
+        cursor = next_link.split("cursor=")[1].split("&")[0]
+        # minted for another ordering
+        self.assertEqual(self.client.get(f"/api/jobs/?cursor={cursor}").status_code, 404)
+
+        def encode(payload):
+            return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+        tampered = [
+            {"o": ["-created_at", "-id"], "p": ["T0", "1"], "r": 0},
+            {"o": ["-created_at", "-id"], "p": ["2026-01-01T00:00:00+00:00", "x"], "r": 0},
+            {"o": ["-created_at", "-id"], "p": [None, "1"], "r": 0},
+            {"o": ["-created_at", "-id"], "p": ["2026-01-01T00:00:00+00:00"], "r": 0},
+            {"p": ["2026-01-01T00:00:00+00:00", "1"], "r": 0},
+        ]
+        for payload in tampered:
+            with self.subTest(payload=payload):
+                response = self.client.get(f"/api/jobs/?cursor={encode(payload)}")
+                self.assertEqual(response.status_code, 404)
+        self.assertEqual(self.client.get("/api/jobs/?cursor=not-base64!").status_code, 404)
+
+        # a well-formed position is accepted
+        valid = {"o": ["-created_at", "-id"], "p": ["2100-01-01T00:00:00+00:00", "1"], "r": 0}
+        self.assertEqual(self.client.get(f"/api/jobs/?cursor={encode(valid)}").status_code, 200)
+
+
+@override_settings(CACHES=LOCAL_CACHE)
+class SalaryFilterTests(TestCase):
+    def setUp(self):
+        for i, salary_range in enumerate(["$90k - $120k", "$150k", "₦300,000 - ₦500,000"]):
+            make_job(salary_range=salary_range, slug=f"https://example.com/jobs/{i}")
+        self.client = APIClient()
+        self.client.force_authenticate(
+            User.objects.create_user("applicant@example.com", "Ada", "Obi", "pw")
+        )
+
+    def test_amounts_require_a_currency(self):
+        for query in ("salary_min=100000", "salary_max=200000", "ordering=-salary_sort"):
+            with self.subTest(query=query):
+                response = self.client.get(f"/api/jobs/?{query}")
+                self.assertEqual(response.status_code, 400)
+
+    def test_within_a_currency(self):
+        response = self.client.get("/api/jobs/?salary_min=100000&salary_currency=usd")
+        self.assertEqual([job["salary_range"] for job in response.data["results"]], ["$150k"])
+
+        response = self.client.get("/api/jobs/?ordering=-salary_sort&salary_currency=USD")
+        self.assertEqual(
+            [job["salary_range"] for job in response.data["results"]],
+            ["$150k", "$90k - $120k"],
+        )
+
+
+@override_settings(CACHES=LOCAL_CACHE)
+class FacetTests(TestCase):
+    def setUp(self):
+        locations = ["Lagos", "Lagos", "Lagos", "Nairobi", "Nairobi", "Berlin"]
+        for i, location in enumerate(locations):
+            make_job(location=location, slug=f"https://example.com/jobs/{i}")
+        self.client = APIClient()
+        self.client.force_authenticate(
+            User.objects.create_user("applicant@example.com", "Ada", "Obi", "pw")
+        )
+
+    def test_facet_limit(self):
+        response = self.client.get("/api/jobs/facets/?facets=location,job_type&facet_limit=2")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["location"], [
+            {"value": "Lagos", "count": 3},
+            {"value": "Nairobi", "count": 2},
+        ])
+        self.assertEqual(response.data["job_type"], [{"value": "full_time", "count": 6}])
+
+        response = self.client.get("/api/jobs/facets/?facets=location")
+        self.assertEqual(len(response.data["location"]), 3)
+
+    def test_facet_limit_must_be_positive(self):
+        for limit in ("0", "-1", "x"):
+            with self.subTest(limit=limit):
+                response = self.client.get(f"/api/jobs/facets/?facet_limit={limit}")
+                self.assertEqual(response.status_code, 400)
@@ -1,74 +1,284 @@
+from django.conf import settings
 from rest_framework import viewsets, filters, status
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.response import Response
+from rest_framework.decorators import action
+from rest_framework.exceptions import ValidationError
+from drf_yasg import openapi
+from drf_yasg.utils import swagger_auto_schema
 from rest_framework.permissions import IsAuthenticatedOrReadOnly, IsAuthenticated
-from .models import Job
-from .serializers import JobSerializer
+from .models import Job, JobListing, JobSimilarity, unexpired
+from .serializers import JobListingSerializer, JobSerializer
 # from .permissions import IsAdminOrReadOnly
 from categories.models import Category
+from companies.models import Company
+from locations.models import Location
 from users.permissions import IsAdminOrReadOnly
 from .filters import JobFilter
-from django.db.models import Count
+from .search import JobSearchFilter
+from .facets import FACET_DIMENSIONS, compute_facets
+from .ingest import ingest_jobs
+from applications.applied import HasAppliedMixin
+from remosphere.cache import CachedResponseMixin, ConditionalGetMixin, get_generations
+from remosphere.compiled import CompiledListMixin
+from remosphere.export import ExportMixin
+from remosphere.pagination import KeysetPagination
 
 
-class JobViewSet(viewsets.ModelViewSet):
+class JobViewSet(
+        HasAppliedMixin,
+        ConditionalGetMixin,
+        CachedResponseMixin,
+        CompiledListMixin,
+        ExportMixin,
+        viewsets.ModelViewSet):
     """
     The Job view responsible for the
     searching and filtering of jobs.
     """
     # .order_by("-created_at")  # .select_related("category", "company", "created_by")
-    queryset = Job.objects.all()
+    # the collection's read model; get_queryset() swaps in Job for
+    # retrieve and writes (schema generation also reads this one)
+    queryset = JobListing.objects.all()
     serializer_class = JobSerializer
     permission_classes = [IsAdminOrReadOnly]  # [IsAuthenticated]
     filter_backends = [
         DjangoFilterBackend,
-        filters.SearchFilter,
+        JobSearchFilter,
         filters.OrderingFilter]
     filterset_class = JobFilter
+    # seeks on (ordering column, id); see the composite indexes on JobListing
+    pagination_class = KeysetPagination
+    # job cards embed category and company names; `similar` also
+    # depends on JobSimilarity (see get_request_digest)
+    cache_namespace = "jobs"
+    cache_dependencies = (Job, Category, Company, Location)
+    cached_actions = ("list", "retrieve", "facets", "similar")
+    # collection actions read the JobListing projection instead of Job
+    listing_actions = ("list", "facets", "export")
+    # actions honouring ?fields= / ?omit= (and loading only those columns)
+    sparse_actions = ("list", "retrieve", "export")
+    export_name = "jobs"
 
     # filterset_fields = ["location", "category"]
     # search_fields = ["title", "description", "company_name", "category_name", "location"]
 
+    # full-text search runs on JobListing.search_vector (PostgreSQL);
+    # these fields are only the LIKE fallback for other databases
     search_fields = [
         "title",
         "description",
-        "category__name",   # search by category name
+        "category_name",   # search by category name
         "company_name",    # search by company name
+        "company_display_name",
         "location",
         "job_type",
     ]
 
     # EXACT FILTER FIELDS
     filterset_fields = [
-        "category__name",
+        "category_name",
         "company_name",
         "location",
         "job_type",
         "is_active",
     ]
 
-    ordering_fields = ["created_at", "updated_at", "title"]
+    ordering_fields = ["created_at", "updated_at", "title", "applications_count", "salary_sort"]
 
     def get_queryset(self):
-        qs = Job.objects.all().annotate(
-            applications_count=Count("applications__user", distinct=True)
-        )
+        # list/search read the flattened projection: no joins, and
+        # applications_count is a stored counter, no aggregate needed
+        if self.action in self.listing_actions:
+            qs = JobListing.objects.all()
+        else:
+            qs = Job.objects.all()
         # qs = super().get_queryset()
-        # non-admins only see active jobs
+        # non-admins only see active jobs; expired ones are hidden
+        # even before the sweeper deactivates them
         user = self.request.user
-        if not (user.is_authenticated):  # and user.is_staff):
-            qs = qs.filter(is_active=True)
+        if not getattr(user, "is_admin", False):
+            qs = qs.filter(unexpired(), is_active=True)
+
+        if self.action in self.sparse_actions:
+            serializer_class = self.get_serializer_class()
+            field_names = self.get_sparse_fields() or serializer_class.field_names()
+            # keyset cursors read the ordering columns of each (listing) row
+            extra_columns = self.ordering_fields if qs.model is JobListing else ()
+            qs = serializer_class.sparse_queryset(
+                qs, field_names, extra_columns=extra_columns
+            )
         return qs
 
+    def get_sparse_fields(self):
+        """
+        Field names picked with ?fields= and/or dropped with ?omit=
+        (comma separated), or None when neither is given.
+        """
+        params = self.request.query_params
+        if "fields" not in params and "omit" not in params:
+            return None
+
+        available = self.get_serializer_class().field_names()
+        requested = {
+            key: [name.strip() for name in params.get(key, "").split(",") if name.strip()]
+            for key in ("fields", "omit")
+        }
+        for key, names in requested.items():
+            unknown = [name for name in names if name not in available]
+            if unknown:
+                raise ValidationError({key: f"Unknown fields: {', '.join(unknown)}"})
+
+        selected = [
+            name for name in available
+            if (not requested["fields"] or name in requested["fields"])
+            and name not in requested["omit"]
+        ]
+        if not selected:
+            raise ValidationError({"fields": "No fields left to return."})
+        return selected
+
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        if self.action in self.sparse_actions:
+            context["fields"] = self.get_sparse_fields()
+        return context
+
+    def filter_queryset(self, queryset):
+        # filters, search and ordering target the listing read model
+        if queryset.model is not JobListing:
+            return queryset
+        return super().filter_queryset(queryset)
+
+    def get_serializer_class(self):
+        if self.action in self.listing_actions:
+            return JobListingSerializer
+        return super().get_serializer_class()
+
     def get_serializer(self, *args, **kwargs):
         ser = super().get_serializer(*args, **kwargs)
         # set category queryset dynamically to avoid circular import issues
 
         # Only modify serializer when it is NOT a ListSerializer
-        if hasattr(ser, "fields"):
+        if isinstance(ser, JobSerializer) and "category" in ser.fields:
             ser.fields["category"].queryset = Category.objects.all()
 
         return ser
 
     def perform_create(self, serializer):
         serializer.save(created_by=self.request.user)
+
+    @swagger_auto_schema(
+        operation_summary="Create or update a batch of jobs (admin only)",
+        request_body=openapi.Schema(
+            type=openapi.TYPE_ARRAY,
+            items=openapi.Schema(type=openapi.TYPE_OBJECT),
+            description="Job payloads; an existing `slug` updates that job"),
+        responses={
+            201: "Some items written, per-item results and errors",
+            400: "Nothing written, per-item errors",
+        },
+    )
+    @action(detail=False, methods=["post"], pagination_class=None)
+    def bulk(self, request):
+        """
+        Bulk ingest for partner feeds: invalid items are reported by
+        index, the valid ones are written in one transaction.
+        """
+        items = request.data
+        if not isinstance(items, list) or not items:
+            raise ValidationError({"detail": "Expected a non-empty list of jobs."})
+        limit = getattr(settings, "JOB_INGEST_MAX_ITEMS", 1000)
+        if len(items) > limit:
+            raise ValidationError({"detail": f"At most {limit} jobs per request."})
+
+        result = ingest_jobs(items, user=request.user)
+        written = result["created"] + result["updated"]
+        return Response(
+            result,
+            status=status.HTTP_201_CREATED if written else status.HTTP_400_BAD_REQUEST,
+        )
+
+    @swagger_auto_schema(
+        operation_summary="Job counts per job type, category and location",
+        manual_parameters=[
+            openapi.Parameter(
+                "facets", openapi.IN_QUERY, type=openapi.TYPE_STRING,
+                description="Comma separated dimensions (default: all): "
+                            + ", ".join(FACET_DIMENSIONS)),
+            openapi.Parameter(
+                "facet_limit", openapi.IN_QUERY, type=openapi.TYPE_INTEGER,
+                description="Maximum buckets per dimension"),
+        ],
+    )
+    @action(detail=False, methods=["get"], pagination_class=None)
+    def facets(self, request):
+        """
+        Facet counts under the same filters and search as the list,
+        computed in one SQL pass (GROUPING SETS) and cached per
+        filter fingerprint.
+        """
+        return self.cached_response(self.get_facets_response, request)
+
+    def get_facets_response(self, request):
+        requested = request.query_params.get("facets")
+        dimensions = (
+            [name.strip() for name in requested.split(",") if name.strip()]
+            if requested else list(FACET_DIMENSIONS)
+        )
+        unknown = [name for name in dimensions if name not in FACET_DIMENSIONS]
+        if unknown:
+            raise ValidationError({"facets": f"Unknown facets: {', '.join(unknown)}"})
+
+        limit = request.query_params.get("facet_limit")
+        if limit is not None and (not limit.isdigit() or int(limit) < 1):
+            raise ValidationError({"facet_limit": "Must be a positive integer."})
+
+        queryset = self.filter_queryset(self.get_queryset())
+        return Response(
+            compute_facets(queryset, dimensions, int(limit) if limit else None)
+        )
+
+    @swagger_auto_schema(
+        operation_summary="Active jobs with the most similar content",
+        manual_parameters=[
+            openapi.Parameter(
+                "limit", openapi.IN_QUERY, type=openapi.TYPE_INTEGER,
+                description="Maximum number of jobs (default 10)"),
+        ],
+    )
+    @action(detail=True, methods=["get"], pagination_class=None)
+    def similar(self, request, pk=None):
+        """
+        Job cards closest to this job by title, category and
+        description (TF-IDF cosine similarity, precomputed by
+        jobs.tasks.update_similar_jobs), best first.
+        """
+        return self.cached_response(self.get_similar_response, request, pk=pk)
+
+    def get_request_digest(self, request, *extra):
+        # similarity refreshes only invalidate the similar lists,
+        # not every cached job response and ETag
+        if self.action == "similar":
+            extra = (get_generations(JobSimilarity), *extra)
+        return super().get_request_digest(request, *extra)
+
+    def get_similar_response(self, request, pk=None):
+        limit = request.query_params.get("limit", "10")
+        if not limit.isdigit() or int(limit) < 1:
+            raise ValidationError({"limit": "Must be a positive integer."})
+
+        job = self.get_object()
+        entries = JobSimilarity.objects.filter(pk=job.pk).values_list(
+            "neighbors", flat=True
+        ).first() or []
+        # the lists are precomputed: drop jobs hidden since
+        listings = JobListing.objects.filter(
+            unexpired(), is_active=True, pk__in=[pk for pk, _ in entries]
+        ).in_bulk()
+        data = []
+        for neighbor_id, score in entries:
+            if neighbor_id in listings and len(data) < int(limit):
+                card = JobListingSerializer(listings[neighbor_id]).data
+                data.append({**card, "similarity": score})
+        return Response(data)
@@ -0,0 +1,15 @@
+from django.contrib import admin
+from .models import Location, LocationAlias
+
+
+class LocationAliasInline(admin.TabularInline):
+    model = LocationAlias
+    extra = 1
+
+
+@admin.register(Location)
+class LocationAdmin(admin.ModelAdmin):
+    list_display = ("name", "code", "country_code", "created_at")
+    search_fields = ("name", "code", "aliases__alias")
+    prepopulated_fields = {"code": ("name",)}
+    inlines = [LocationAliasInline]
@@ -0,0 +1,12 @@
+from django.apps import AppConfig
+
+
+class LocationsConfig(AppConfig):
+    default_auto_field = 'django.db.models.BigAutoField'
+    name = 'locations'
+
+    def ready(self):
+        """
+        Registering the response cache invalidation signals
+        """
+        import locations.signals
@@ -0,0 +1,70 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from jobs.models import Job, JobListing
+from locations.normalize import resolve_locations
+from remosphere.cache import bump_generation
+
+
+class Command(BaseCommand):
+    help = (
+        "Resolve Job.location into the Location dictionary in batches, "
+        "creating missing locations and aliases (resumable: resolved jobs are skipped)"
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="Number of jobs resolved per transaction",
+        )
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Also re-resolve jobs that already have a location",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        jobs = Job.objects.exclude(location="")
+        if not options["all"]:
+            jobs = jobs.filter(normalized_location__isnull=True)
+        jobs = jobs.order_by("pk").only("pk", "location")
+
+        resolved = 0
+        last_pk = 0
+        while True:
+            batch = list(jobs.filter(pk__gt=last_pk)[:batch_size])
+            if not batch:
+                break
+
+            with transaction.atomic():
+                locations = resolve_locations([job.location for job in batch])
+                for job in batch:
+                    job.normalized_location = locations.get(job.location)
+                # updated_at is left alone: nothing a user wrote has changed
+                Job.objects.bulk_update(batch, ["normalized_location"])
+
+                listings = JobListing.objects.in_bulk([job.pk for job in batch])
+                for job in batch:
+                    listing = listings.get(job.pk)
+                    if listing is not None:
+                        listing.normalized_location = job.normalized_location
+                        listing.location_code = (
+                            job.normalized_location.code if job.normalized_location else None
+                        )
+                JobListing.objects.bulk_update(
+                    listings.values(), ["normalized_location", "location_code"]
+                )
+
+            resolved += len(batch)
+            last_pk = batch[-1].pk
+            if options["verbosity"] > 1:
+                self.stdout.write(f"  {resolved} jobs resolved, last id {last_pk}")
+
+        if resolved:
+            bump_generation(Job)
+        self.stdout.write(
+            self.style.SUCCESS(f"✓ Resolved the locations of {resolved} jobs.")
+        )
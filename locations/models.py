@@ -0,0 +1,41 @@
+from django.db import models
+from django.utils import timezone
+
+
+class Location(models.Model):
+    """
+    A normalized job location (e.g. Lagos, Remote).
+    - 'code' is a stable, URL-friendly key used by the job filters.
+    - free-text spellings map to it through LocationAlias.
+    """
+    name = models.CharField(max_length=128)
+    code = models.SlugField(max_length=128, unique=True)
+    country_code = models.CharField(
+        max_length=2, blank=True, help_text="ISO 3166-1 alpha-2, if known.")
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ["name"]
+
+    def __str__(self):
+        return self.name
+
+
+class LocationAlias(models.Model):
+    """
+    A normalized spelling of a location ("lagos ng", "lagos nigeria").
+    See locations.normalize for the normalization rules.
+    """
+    alias = models.CharField(max_length=255, unique=True)
+    location = models.ForeignKey(
+        Location,
+        on_delete=models.CASCADE,
+        related_name="aliases",
+    )
+
+    class Meta:
+        verbose_name_plural = "location aliases"
+
+    def __str__(self):
+        return f"{self.alias} -> {self.location_id}"
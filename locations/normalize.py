@@ -0,0 +1,171 @@
+"""
+Maps free-text job locations onto the Location dictionary.
+
+A text is normalized (accents, case and punctuation dropped) into
+its full form ("lagos remote" for "Lagos (Remote)") and its key
+form: the first place named, qualified by the trailing country or
+US state code when there is one ("lagos ng" for "Lagos, NG", so that
+"Lagos, PT" or "Springfield, IL" and "Springfield, MA" stay apart),
+else bare ("lagos"). Either form found among the aliases resolves
+the text. Otherwise a Location is created from the key form, and
+both forms become its aliases, so the next job spelled the same way
+resolves with a single lookup (a full form resolved through its key
+form is recorded as an alias as well).
+
+Only the primary place is resolved; secondary ones (the "Remote" of
+"Lagos (Remote)") are left to the substring match of the job filters.
+"""
+import re
+import unicodedata
+
+from django.utils.text import slugify
+
+from remosphere.cache import bump_generation
+from .countries import COUNTRY_CODES, NON_GEOGRAPHIC, US_STATE_CODES
+from .models import Location, LocationAlias
+
+PARENTHESES_RE = re.compile(r"\([^)]*\)")
+SEPARATORS_RE = re.compile(r"[,/|;]| - ")
+NON_WORD_RE = re.compile(r"[^a-z0-9]+")
+
+
+def _clean(text):
+    text = unicodedata.normalize("NFKD", text).encode("ascii", "ignore").decode("ascii")
+    return NON_WORD_RE.sub(" ", text.lower()).strip()
+
+
+def normalize_location_text(text):
+    """
+    (full form, primary form) of a location text; ("", "") if empty.
+    """
+    if not text:
+        return "", ""
+    full = _clean(text)
+    segments = SEPARATORS_RE.split(PARENTHESES_RE.sub(" ", text))
+    primary = next((_clean(part) for part in segments if _clean(part)), full)
+    return full[:255], primary[:128]
+
+
+def _region(text, primary):
+    """
+    Trailing two-letter country or US state code of `text`, upper
+    case ("NG" for "Lagos, NG"); "" when there is none or when the
+    primary form names no place ("Remote - US").
+    """
+    if primary in NON_GEOGRAPHIC:
+        return ""
+    segments = SEPARATORS_RE.split(PARENTHESES_RE.sub(" ", text))
+    last = segments[-1].strip().upper()
+    if len(segments) < 2 or (last not in COUNTRY_CODES and last not in US_STATE_CODES):
+        return ""
+    return last
+
+
+def _country_code(region):
+    """
+    ISO 3166-1 alpha-2 code of a region, "US" for a US state
+    ("TX"); "" when ambiguous ("CA": Canada or California).
+    """
+    if region in US_STATE_CODES:
+        return "" if region in COUNTRY_CODES else "US"
+    return region
+
+
+def location_forms(text):
+    """
+    (full form, key form, region) of a location text, see above;
+    ("", "", "") if empty.
+    """
+    full, primary = normalize_location_text(text)
+    if not primary:
+        return full, "", ""
+    region = _region(text, primary)
+    key = f"{primary[:125]} {region.lower()}" if region else primary
+    return full, key, region
+
+
+def lookup_location_codes(texts):
+    """
+    {text: Location.code} of the texts whose spelling is known,
+    in one query; unknown texts are left out (nothing is created).
+    """
+    forms = {text: location_forms(text)[:2] for text in texts if text}
+    wanted = {form for pair in forms.values() for form in pair if form}
+    found = dict(
+        LocationAlias.objects.filter(alias__in=wanted)
+        .values_list("alias", "location__code")
+    )
+    codes = {}
+    for text, (full, key) in forms.items():
+        code = found.get(full) or found.get(key)
+        if code:
+            codes[text] = code
+    return codes
+
+
+def resolve_locations(texts):
+    """
+    {text: Location} for every non-empty text, creating the missing
+    locations and aliases in bulk: a fixed number of queries.
+    """
+    forms = {text: location_forms(text) for text in set(texts) if text}
+    forms = {text: triple for text, triple in forms.items() if triple[1]}
+    if not forms:
+        return {}
+
+    wanted = {form for full, key, _ in forms.values() for form in (full, key)}
+    aliases = dict(
+        LocationAlias.objects.filter(alias__in=wanted).values_list("alias", "location_id")
+    )
+
+    # unknown spellings: a location per key form (its code may
+    # exist already, e.g. created by hand without that alias)
+    unresolved = {
+        text: (full, key, region) for text, (full, key, region) in forms.items()
+        if full not in aliases and key not in aliases
+    }
+    # spellings known by their key form only are learned too
+    new_aliases = {
+        full: aliases[key] for full, key, _ in forms.values()
+        if full not in aliases and key in aliases
+    }
+    codes = {}
+    for _, key, region in unresolved.values():
+        codes.setdefault(slugify(key) or "unknown", (key, region))
+    if codes:
+        Location.objects.bulk_create(
+            [
+                Location(
+                    # the name without the region: "Lagos" (country_code NG)
+                    name=(key[:-len(region) - 1] if region else key).title(),
+                    code=code,
+                    country_code=_country_code(region),
+                )
+                for code, (key, region) in codes.items()
+            ],
+            ignore_conflicts=True,
+        )
+        by_code = dict(
+            Location.objects.filter(code__in=codes).values_list("code", "pk")
+        )
+        for full, key, _ in unresolved.values():
+            location_id = by_code[slugify(key) or "unknown"]
+            new_aliases.setdefault(full, location_id)
+            new_aliases.setdefault(key, location_id)
+    if new_aliases:
+        LocationAlias.objects.bulk_create(
+            [
+                LocationAlias(alias=alias, location_id=location_id)
+                for alias, location_id in new_aliases.items()
+            ],
+            ignore_conflicts=True,
+        )
+        aliases.update(new_aliases)
+        # bulk_create sends no signals
+        bump_generation(Location)
+
+    locations = Location.objects.in_bulk(set(aliases.values()))
+    return {
+        text: locations[aliases.get(full) or aliases[key]]
+        for text, (full, key, _) in forms.items()
+    }
@@ -0,0 +1,14 @@
+from rest_framework import serializers
+from .models import Location
+
+
+class LocationSerializer(serializers.ModelSerializer):
+    """
+    A normalized location; `code` is what the job list's
+    `location_code` filter takes.
+    """
+
+    class Meta:
+        model = Location
+        fields = ["id", "name", "code", "country_code", "created_at"]
+        read_only_fields = ["id", "created_at"]
@@ -0,0 +1,16 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from remosphere.cache import bump_generation
+from .models import Location, LocationAlias
+
+
+@receiver(post_save, sender=Location)
+@receiver(post_delete, sender=Location)
+@receiver(post_save, sender=LocationAlias)
+@receiver(post_delete, sender=LocationAlias)
+def invalidate_cached_responses(sender, **kwargs):
+    """
+    Any write invalidates the cached responses that depend on Location.
+    """
+    bump_generation(Location)
@@ -0,0 +1,130 @@
+from django.test import TestCase, override_settings
+from rest_framework.test import APIClient
+
+from jobs.models import Job
+from remosphere.cache import get_generations
+from users.models import User
+from .models import Location, LocationAlias
+from .normalize import lookup_location_codes, resolve_locations
+
+LOCAL_CACHE = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCAL_CACHE)
+class ResolveLocationsTests(TestCase):
+    def test_creates_location_and_aliases(self):
+        generation = get_generations(Location)
+        with self.captureOnCommitCallbacks(execute=True):
+            lagos = resolve_locations(["Lagos (Remote)"])["Lagos (Remote)"]
+        self.assertEqual((lagos.name, lagos.code), ("Lagos", "lagos"))
+        self.assertEqual(
+            set(lagos.aliases.values_list("alias", flat=True)), {"lagos", "lagos remote"}
+        )
+        # bulk_create sends no signals: cached location lists are dropped explicitly
+        self.assertNotEqual(get_generations(Location), generation)
+
+    def test_learns_spellings_through_the_primary_form(self):
+        lagos = resolve_locations(["Lagos"])["Lagos"]
+        self.assertEqual(resolve_locations(["Lagos, Nigeria"])["Lagos, Nigeria"], lagos)
+        self.assertEqual(Location.objects.count(), 1)
+        self.assertTrue(
+            LocationAlias.objects.filter(alias="lagos nigeria", location=lagos).exists()
+        )
+
+    def test_fixed_number_of_queries(self):
+        # read aliases, create locations, read them back, create aliases, load
+        with self.assertNumQueries(5):
+            resolve_locations(["Lagos", "Nairobi, KE", "Berlin / Remote"])
+        with self.assertNumQueries(5):
+            resolve_locations([f"City {i}" for i in range(20)] + ["Lagos, NG"])
+        # every spelling known: aliases and locations only
+        with self.assertNumQueries(2):
+            resolve_locations(["Lagos", "City 3"])
+
+    def test_same_name_in_two_regions(self):
+        locations = resolve_locations(
+            ["Lagos, NG", "Lagos, PT", "Springfield, IL", "Springfield, MA", "Lagos"]
+        )
+        self.assertEqual(
+            {
+                text: (location.code, location.name, location.country_code)
+                for text, location in locations.items()
+            },
+            {
+                "Lagos, NG": ("lagos-ng", "Lagos", "NG"),
+                "Lagos, PT": ("lagos-pt", "Lagos", "PT"),
+                "Springfield, IL": ("springfield-il", "Springfield", ""),
+                "Springfield, MA": ("springfield-ma", "Springfield", ""),
+                "Lagos": ("lagos", "Lagos", ""),
+            },
+        )
+        # later spellings keep to their own country
+        portugal = resolve_locations(["Lagos (Remote), PT"])["Lagos (Remote), PT"]
+        self.assertEqual(portugal, locations["Lagos, PT"])
+
+    def test_country_codes(self):
+        cases = {
+            "Lagos, NG": "NG",
+            "Austin, TX": "US",
+            "New York, NY": "US",
+            "San Francisco, CA": "",
+            "Remote - US": "",
+            "Nairobi": "",
+        }
+        locations = resolve_locations(list(cases))
+        for text, country_code in cases.items():
+            with self.subTest(text=text):
+                self.assertEqual(locations[text].country_code, country_code)
+
+
+class LookupLocationCodesTests(TestCase):
+    def test_known_spellings_only(self):
+        resolve_locations(["Lagos", "Lagos, NG"])
+        self.assertEqual(
+            lookup_location_codes(["lagos ng", "LAGOS", "Lagos, PT", "Atlantis", ""]),
+            {"lagos ng": "lagos-ng", "LAGOS": "lagos"},
+        )
+        self.assertEqual(Location.objects.count(), 2)
+
+
+@override_settings(CACHES=LOCAL_CACHE)
+class LocationFilterTests(TestCase):
+    def setUp(self):
+        self.jobs = {
+            location: Job.objects.create(
+                title="Backend Engineer",
+                description="Build APIs",
+                location=location,
+                job_type="full_time",
+                company_name="Acme",
+                slug=f"https://example.com/jobs/{i}",
+            )
+            for i, location in enumerate(
+                ["Lagos, NG", "Lagos (Remote)", "Berlin / Remote", "Remote"]
+            )
+        }
+        self.client = APIClient()
+        self.client.force_authenticate(
+            User.objects.create_user("applicant@example.com", "Ada", "Obi", "pw")
+        )
+
+    def locations(self, query):
+        response = self.client.get(f"/api/jobs/?{query}")
+        self.assertEqual(response.status_code, 200)
+        return sorted(card["location"] for card in response.data["results"])
+
+    def test_location_keeps_secondary_places(self):
+        self.assertEqual(
+            self.locations("location=Remote"), ["Berlin / Remote", "Lagos (Remote)", "Remote"]
+        )
+        self.assertEqual(self.locations("location=lagos"), ["Lagos (Remote)", "Lagos, NG"])
+        self.assertEqual(self.locations("location=Berl"), ["Berlin / Remote"])
+
+    def test_location_code(self):
+        self.assertEqual(self.locations("location_code=lagos"), ["Lagos (Remote)"])
+        self.assertEqual(
+            self.locations("location_code=lagos,lagos-ng"), ["Lagos (Remote)", "Lagos, NG"]
+        )
+        self.assertEqual(
+            self.locations("location_code=berlin,remote"), ["Berlin / Remote", "Remote"]
+        )
@@ -0,0 +1,7 @@
+from rest_framework import routers
+from .views import LocationViewSet
+
+router = routers.DefaultRouter()
+router.register(r"locations", LocationViewSet, basename="locations")
+
+urlpatterns = router.urls
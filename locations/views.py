@@ -0,0 +1,21 @@
+from rest_framework import filters, viewsets
+from .models import Location
+from .serializers import LocationSerializer
+from users.permissions import IsAdminOrReadOnly
+from remosphere.cache import CachedResponseMixin, ConditionalGetMixin
+
+
+class LocationViewSet(ConditionalGetMixin, CachedResponseMixin, viewsets.ModelViewSet):
+    """
+    API endpoint to manage the location dictionary.
+
+    - List & Retrieve: Any authenticated user
+    - Create, Update, Delete: Admin only
+    """
+    queryset = Location.objects.all()
+    serializer_class = LocationSerializer
+    permission_classes = [IsAdminOrReadOnly]
+    filter_backends = [filters.SearchFilter]
+    search_fields = ["name", "code", "aliases__alias"]
+    cache_namespace = "locations"
+    cache_dependencies = (Location,)
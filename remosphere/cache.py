@@ -0,0 +1,266 @@
+"""
+Generation-versioned response cache for the read-heavy endpoints
+(jobs, categories, companies), stored in CACHES["default"].
+
+Every cached response key embeds the current "generation" of the
+models it depends on. Saving or deleting one of those models bumps
+its generation (a single INCR), so stale entries are never read
+again and simply age out: invalidation is O(1) and needs no key scans.
+"""
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_vary_headers, quote_etag
+from django.utils.http import http_date
+from rest_framework.response import Response
+
+GENERATION_KEY = "gen:{label}"
+CHANGED_KEY = "changed:{label}"
+RESPONSE_KEY = "resp:{namespace}:{digest}"
+VALIDATORS_KEY = "validators:{namespace}:{digest}"
+STATS_KEY = "respcache:{namespace}:{outcome}"
+
+# namespaces of every view using CachedResponseMixin (for the stats view)
+CACHE_NAMESPACES = set()
+
+
+def _label(model):
+    return model if isinstance(model, str) else model._meta.label
+
+
+def _incr(key, initial=0):
+    try:
+        return cache.incr(key)
+    except ValueError:
+        # missing (or evicted): restart from `initial`
+        cache.add(key, initial, timeout=None)
+        return cache.incr(key)
+
+
+def get_generations(*models):
+    """
+    Current generation of each model. A missing (e.g. evicted) counter
+    restarts from the clock, never from a value an old key could hold.
+    """
+    keys = [GENERATION_KEY.format(label=_label(model)) for model in models]
+    found = cache.get_many(keys)
+    for key in keys:
+        if key not in found:
+            cache.add(key, time.time_ns(), timeout=None)
+            found[key] = cache.get(key)
+    return tuple(found[key] for key in keys)
+
+
+def bump_generation(*models):
+    """
+    Invalidate every cached response depending on `models`,
+    once the current transaction (if any) commits.
+    """
+    def bump():
+        now = time.time()
+        for model in models:
+            # reseeded from the clock like get_generations does
+            _incr(GENERATION_KEY.format(label=_label(model)), initial=time.time_ns())
+            cache.set(CHANGED_KEY.format(label=_label(model)), now, timeout=None)
+
+    transaction.on_commit(bump)
+
+
+def get_last_changed(*models):
+    """
+    Unix time of the latest bump of any of `models`, if known.
+    """
+    found = cache.get_many([CHANGED_KEY.format(label=_label(model)) for model in models])
+    return max(found.values(), default=None)
+
+
+def get_user_class(user):
+    if not (user and user.is_authenticated):
+        return "anonymous"
+    return "admin" if getattr(user, "is_admin", False) else "user"
+
+
+def request_fingerprint(request):
+    """
+    Normalized query string: parameter order and repeated keys
+    do not change the fingerprint.
+    """
+    params = sorted(
+        (key, tuple(sorted(request.query_params.getlist(key))))
+        for key in request.query_params
+    )
+    return repr(params)
+
+
+def record_cache_outcome(namespace, outcome):
+    _incr(STATS_KEY.format(namespace=namespace, outcome=outcome))
+
+
+def get_cache_stats():
+    """
+    Hit/miss counters per cached namespace.
+    """
+    keys = {
+        (namespace, outcome): STATS_KEY.format(namespace=namespace, outcome=outcome)
+        for namespace in sorted(CACHE_NAMESPACES)
+        for outcome in ("hits", "misses")
+    }
+    values = cache.get_many(keys.values())
+    stats = {}
+    for (namespace, outcome), key in keys.items():
+        stats.setdefault(namespace, {})[outcome] = values.get(key, 0)
+    for counters in stats.values():
+        total = counters["hits"] + counters["misses"]
+        counters["hit_ratio"] = round(counters["hits"] / total, 4) if total else None
+    return stats
+
+
+class CachedResponseMixin:
+    """
+    Caches the serialized data of `cached_actions` per view, action,
+    URL kwargs, normalized query string and user class
+    (anonymous / user / admin).
+
+    `cache_dependencies` lists the models whose generation is part of
+    the key; their save/delete signals must call `bump_generation`.
+    """
+    cache_namespace = None
+    cache_dependencies = ()
+    cached_actions = ("list", "retrieve")
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        if cls.cache_namespace:
+            CACHE_NAMESPACES.add(cls.cache_namespace)
+
+    def list(self, request, *args, **kwargs):
+        return self.cached_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.cached_response(super().retrieve, request, *args, **kwargs)
+
+    def get_request_digest(self, request, *extra):
+        parts = (
+            self.action,
+            sorted(self.kwargs.items()),
+            request.get_host(),
+            get_user_class(request.user),
+            get_generations(*self.cache_dependencies),
+            request_fingerprint(request),
+            *extra,
+        )
+        return hashlib.sha1(repr(parts).encode("utf-8")).hexdigest()
+
+    def get_response_cache_key(self, request):
+        digest = self.get_request_digest(request)
+        return RESPONSE_KEY.format(namespace=self.cache_namespace, digest=digest)
+
+    def cached_response(self, handler, request, *args, **kwargs):
+        timeout = getattr(settings, "RESPONSE_CACHE_TIMEOUT", 300)
+        if (
+            not timeout
+            or self.action not in self.cached_actions
+            or request.method not in ("GET", "HEAD")
+        ):
+            return handler(request, *args, **kwargs)
+
+        key = self.get_response_cache_key(request)
+        data = cache.get(key)
+        if data is not None:
+            record_cache_outcome(self.cache_namespace, "hits")
+            return Response(data)
+
+        record_cache_outcome(self.cache_namespace, "misses")
+        response = handler(request, *args, **kwargs)
+        if response.status_code == 200:
+            cache.set(key, response.data, timeout)
+        return response
+
+
+class ConditionalGetMixin:
+    """
+    ETag / Last-Modified validators for `conditional_actions`, so
+    clients re-polling unchanged data get a 304 before anything is
+    fetched or serialized. Combine with CachedResponseMixin.
+
+    The validators come from one aggregate over the filtered queryset,
+    max(updated_at) and the row count, hashed with the request digest
+    (query string, user class, model generations, media type). They
+    are cached under the same digest, so a re-poll between two writes
+    costs a single cache read.
+    """
+    conditional_actions = ("list", "retrieve")
+    last_modified_field = "updated_at"
+
+    def list(self, request, *args, **kwargs):
+        return self.conditional_response(super().list, request, *args, **kwargs)
+
+    def retrieve(self, request, *args, **kwargs):
+        return self.conditional_response(super().retrieve, request, *args, **kwargs)
+
+    def get_validator_queryset(self):
+        queryset = self.filter_queryset(self.get_queryset())
+        if self.action == "retrieve":
+            lookup_url_kwarg = self.lookup_url_kwarg or self.lookup_field
+            queryset = queryset.filter(
+                **{self.lookup_field: self.kwargs[lookup_url_kwarg]}
+            )
+        return queryset
+
+    def get_validators(self, request):
+        """
+        (ETag, Last-Modified as a Unix time or None) of the response.
+        """
+        digest = self.get_request_digest(request, request.accepted_media_type)
+        key = VALIDATORS_KEY.format(namespace=self.cache_namespace, digest=digest)
+        timeout = getattr(settings, "RESPONSE_CACHE_TIMEOUT", 300)
+        validators = cache.get(key) if timeout else None
+        if validators is not None:
+            return validators
+
+        state = self.get_validator_queryset().order_by().aggregate(
+            last_modified=Max(self.last_modified_field), count=Count("pk")
+        )
+        etag = quote_etag(
+            hashlib.sha1(
+                repr((digest, state["last_modified"], state["count"])).encode("utf-8")
+            ).hexdigest()
+        )
+        # renames of related rows (e.g. a category in a job card) do
+        # not touch updated_at, the generation bumps record them
+        stamps = [
+            state["last_modified"].timestamp() if state["last_modified"] else None,
+            get_last_changed(*self.cache_dependencies),
+        ]
+        stamps = [stamp for stamp in stamps if stamp is not None]
+        validators = (etag, int(max(stamps)) if stamps else None)
+        if timeout:
+            cache.set(key, validators, timeout)
+        return validators
+
+    def conditional_response(self, handler, request, *args, **kwargs):
+        if (
+            self.action not in self.conditional_actions
+            or request.method not in ("GET", "HEAD")
+        ):
+            return handler(request, *args, **kwargs)
+
+        etag, last_modified = self.get_validators(request)
+        response = get_conditional_response(
+            request, etag=etag, last_modified=last_modified
+        )
+        if response is None:
+            response = handler(request, *args, **kwargs)
+
+        if response.status_code in (200, 304):
+            response["ETag"] = etag
+            if last_modified is not None:
+                response["Last-Modified"] = http_date(last_modified)
+            # always revalidate; responses depend on the caller
+            response["Cache-Control"] = "private, no-cache"
+            patch_vary_headers(response, ("Accept", "Authorization", "Cookie"))
+        return response
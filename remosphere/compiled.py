@@ -0,0 +1,154 @@
+"""
+Compiled (fast path) serialization for high-volume list endpoints.
+
+A DRF ModelSerializer resolves every field of every instance through
+`get_attribute` / `to_representation`, walking dotted sources such as
+`category.name` object by object. For read-only lists the same output
+can be built from `values()` rows: the serializer's fields are
+compiled once into a plan of (output key, row lookup, converter), and
+each row becomes a dict in a single pass. Relations in dotted sources
+are resolved by the database join instead of per-object attribute
+access.
+
+Opt-in with settings.COMPILED_SERIALIZERS; serializers using fields
+the compiler does not understand keep the regular DRF path.
+"""
+from django.conf import settings
+from rest_framework import relations, serializers
+from rest_framework.response import Response
+
+# fields whose to_representation() is the identity for the Python
+# value the database returns
+PASSTHROUGH_FIELDS = (
+    serializers.CharField,
+    serializers.IntegerField,
+    serializers.BooleanField,
+    serializers.ChoiceField,
+    relations.PrimaryKeyRelatedField,
+)
+
+UNSUPPORTED_FIELDS = (
+    serializers.BaseSerializer,
+    serializers.SerializerMethodField,
+    relations.ManyRelatedField,
+    serializers.HiddenField,
+)
+
+_plans = {}
+
+
+class CompiledSerializer:
+    """
+    Precomputed field plan of a serializer class (optionally trimmed
+    to a sparse fieldset). Build it with `compile_serializer()`.
+    """
+
+    def __init__(self, plan):
+        # (key, lookup, presence lookups, converter or None)
+        self.plan = plan
+        lookups = []
+        for _, lookup, presence, _ in plan:
+            for name in (lookup, *presence):
+                if name not in lookups:
+                    lookups.append(name)
+        self.lookups = lookups
+
+    def rows(self, queryset, *extra):
+        """
+        The `values()` queryset the plan reads (plus `extra` lookups,
+        e.g. the ordering columns a paginator needs).
+        """
+        return queryset.values(*self.lookups, *(name for name in extra if name not in self.lookups))
+
+    def serialize(self, rows):
+        data = []
+        append = data.append
+        plan = self.plan
+        for row in rows:
+            item = {}
+            for key, lookup, presence, convert in plan:
+                # a dotted source through an empty relation is skipped,
+                # exactly like DRF's SkipField
+                if presence and any(row[name] is None for name in presence):
+                    continue
+                value = row[lookup]
+                item[key] = value if convert is None or value is None else convert(value)
+            append(item)
+        return data
+
+
+def _compile_field(field, model, relation_fields):
+    if isinstance(field, UNSUPPORTED_FIELDS) or field.source == "*":
+        return None
+    if getattr(field, "write_only", False):
+        return ()
+
+    path = field.source.split(".")
+    model_fields = {f.name for f in model._meta.get_fields()}
+    if path[0] not in model_fields:
+        return None
+
+    lookup = "__".join(path)
+    # every relation traversed by the source must be set
+    presence = ["__".join(path[:depth]) for depth in range(1, len(path))]
+    if field.field_name in relation_fields:
+        presence.append(relation_fields[field.field_name])
+
+    convert = None if isinstance(field, PASSTHROUGH_FIELDS) else field.to_representation
+    return (field.field_name, lookup, tuple(presence), convert)
+
+
+def compile_serializer(serializer_class, fields=None):
+    """
+    The cached CompiledSerializer for `serializer_class` trimmed to
+    `fields` (all when None), or None if it cannot be compiled.
+    """
+    key = (serializer_class, tuple(fields) if fields is not None else None)
+    if key not in _plans:
+        serializer = serializer_class(context={"fields": fields})
+        model = serializer.Meta.model
+        relation_fields = getattr(serializer_class, "relation_fields", {})
+        plan = []
+        for field in serializer.fields.values():
+            step = _compile_field(field, model, relation_fields)
+            if step is None:
+                plan = None
+                break
+            if step:
+                plan.append(step)
+        _plans[key] = CompiledSerializer(plan) if plan is not None else None
+    return _plans[key]
+
+
+class CompiledListMixin:
+    """
+    Serves `list` from values() rows through the compiled serializer
+    when settings.COMPILED_SERIALIZERS is on. The output is the same
+    as the view's serializer; the regular path is used whenever the
+    serializer cannot be compiled.
+    """
+
+    def list(self, request, *args, **kwargs):
+        if not getattr(settings, "COMPILED_SERIALIZERS", False):
+            return super().list(request, *args, **kwargs)
+
+        compiled = compile_serializer(
+            self.get_serializer_class(), self.get_serializer_context().get("fields")
+        )
+        if compiled is None:
+            return super().list(request, *args, **kwargs)
+
+        queryset = self.filter_queryset(self.get_queryset())
+        paginator = self.paginator
+        if paginator is None:
+            return Response(compiled.serialize(compiled.rows(queryset)))
+
+        # cursors are built from the ordering columns of the rows
+        ordering = []
+        if hasattr(paginator, "get_ordering"):
+            ordering = [
+                term.lstrip("-")
+                for term in paginator.get_ordering(request, queryset, self)
+            ]
+        page = self.paginate_queryset(compiled.rows(queryset, *ordering))
+        return self.get_paginated_response(compiled.serialize(page))
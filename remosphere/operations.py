@@ -0,0 +1,48 @@
+"""
+Shared migration operations.
+"""
+from django.db.migrations.operations.base import Operation
+
+
+class PostgresOnly(Operation):
+    """
+    Wraps a migration operation that only makes sense on PostgreSQL
+    (GIN/trigram indexes, extensions, raw SQL...).
+
+    The project state is always updated, so the autodetector stays
+    quiet, but the database is only touched when it is PostgreSQL.
+    This keeps `migrate` working on SQLite for local tests.
+    """
+    reversible = True
+
+    def __init__(self, operation):
+        self.operation = operation
+
+    def deconstruct(self):
+        return (self.__class__.__qualname__, [self.operation], {})
+
+    def state_forwards(self, app_label, state):
+        self.operation.state_forwards(app_label, state)
+
+    def database_forwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            self.operation.database_forwards(
+                app_label, schema_editor, from_state, to_state)
+
+    def database_backwards(self, app_label, schema_editor, from_state, to_state):
+        if schema_editor.connection.vendor == "postgresql":
+            self.operation.database_backwards(
+                app_label, schema_editor, from_state, to_state)
+
+    def describe(self):
+        return f"{self.operation.describe()} (PostgreSQL only)"
+
+    @property
+    def migration_name_fragment(self):
+        return self.operation.migration_name_fragment
+
+    def references_model(self, name, app_label):
+        return self.operation.references_model(name, app_label)
+
+    def references_field(self, model_name, name, app_label):
+        return self.operation.references_field(model_name, name, app_label)
@@ -0,0 +1,183 @@
+"""
+Keyset (seek) pagination shared by the list endpoints.
+"""
+import base64
+import json
+from datetime import date, datetime, time
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+from rest_framework.utils.urls import replace_query_param
+
+
+def _encode_value(value):
+    # full precision; DjangoJSONEncoder would truncate microseconds
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    return str(value)
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Cursor pagination that seeks on the whole ordering tuple.
+
+    DRF's CursorPagination positions on the first ordering column only
+    and skips ties with an OFFSET. Here the cursor carries the value of
+    every ordering column, with `id` appended as a tiebreaker, and the
+    next page is fetched with the expanded form of
+
+        WHERE (a, b, id) < (x, y, z) ORDER BY a, b, id LIMIT n
+
+    so every page costs O(page_size) at any depth, given a composite
+    index on the same columns.
+
+    The ordering is read from the queryset (OrderingFilter, relevance
+    ranking...), then the model's Meta.ordering, then `ordering`.
+    Ordering terms must be plain, non-null field or annotation names.
+    """
+    page_size = 20
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    ordering = "-created_at"
+    tiebreaker = "id"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+
+        self.base_url = request.build_absolute_uri()
+        self.ordering = self.get_ordering(request, queryset, view)
+        position, reverse = self.decode_cursor(request, queryset)
+
+        ordering = self.ordering
+        if reverse:
+            ordering = tuple(_flip(term) for term in ordering)
+
+        queryset = queryset.order_by(*ordering)
+        if position is not None:
+            queryset = queryset.filter(self.seek(ordering, position))
+
+        results = list(queryset[:self.page_size + 1])
+        has_more = len(results) > self.page_size
+        self.page = results[:self.page_size]
+
+        if reverse:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+        return self.page
+
+    def get_ordering(self, request, queryset, view):
+        default = (
+            [self.ordering] if isinstance(self.ordering, str)
+            else list(self.ordering)
+        )
+        ordering = (
+            list(queryset.query.order_by)
+            or list(queryset.model._meta.ordering)
+            or default
+        )
+        if not all(isinstance(term, str) and term != "?" for term in ordering):
+            ordering = default
+
+        names = {term.lstrip("-") for term in ordering}
+        if not names.intersection({self.tiebreaker, "pk"}):
+            prefix = "-" if ordering[-1].startswith("-") else ""
+            ordering.append(f"{prefix}{self.tiebreaker}")
+        return tuple(ordering)
+
+    @staticmethod
+    def seek(ordering, position):
+        """
+        Expand the row-value comparison (a, b, c) > (x, y, z) into
+        a > x OR (a = x AND b > y) OR (a = x AND b = y AND c > z),
+        plus a redundant `a >= x` so the leading index column
+        bounds the scan.
+        """
+        condition = Q()
+        equal = Q()
+        for term, value in zip(ordering, position):
+            name = term.lstrip("-")
+            lookup = "lt" if term.startswith("-") else "gt"
+            condition |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+
+        first = ordering[0]
+        bound = "lte" if first.startswith("-") else "gte"
+        return Q(**{f"{first.lstrip('-')}__{bound}": position[0]}) & condition
+
+    def get_position(self, instance):
+        # model instances, or values() rows (see remosphere.compiled)
+        if isinstance(instance, dict):
+            return [instance[term.lstrip("-")] for term in self.ordering]
+        return [getattr(instance, term.lstrip("-")) for term in self.ordering]
+
+    def get_next_link(self):
+        if not (self.has_next and self.page):
+            return None
+        return self.encode_cursor((self.get_position(self.page[-1]), False))
+
+    def get_previous_link(self):
+        if not (self.has_previous and self.page):
+            return None
+        return self.encode_cursor((self.get_position(self.page[0]), True))
+
+    def encode_cursor(self, cursor):
+        position, reverse = cursor
+        payload = json.dumps(
+            {"o": self.ordering, "p": position, "r": int(reverse)}, default=_encode_value
+        )
+        encoded = base64.urlsafe_b64encode(payload.encode("ascii")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def decode_cursor(self, request, queryset):
+        """
+        (position, reverse) of the requested cursor, (None, False) on
+        the first page. Cursors minted for another ordering, or whose
+        values do not fit the ordering columns, are a 404.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if encoded is None:
+            return None, False
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            ordering, position, reverse = payload["o"], payload["p"], bool(payload["r"])
+        except (TypeError, ValueError, KeyError, UnicodeEncodeError):
+            raise NotFound(self.invalid_cursor_message)
+
+        if (
+            ordering != list(self.ordering)
+            or not isinstance(position, list)
+            or len(position) != len(self.ordering)
+        ):
+            raise NotFound(self.invalid_cursor_message)
+        try:
+            position = [
+                self.get_ordering_field(queryset, term.lstrip("-")).to_python(value)
+                for term, value in zip(self.ordering, position)
+            ]
+        except (ValidationError, TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+        if None in position:
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    @staticmethod
+    def get_ordering_field(queryset, name):
+        # annotations (e.g. a search rank) before model fields
+        annotation = queryset.query.annotations.get(name)
+        if annotation is not None:
+            return annotation.output_field
+        if name == "pk":
+            return queryset.model._meta.pk
+        return queryset.model._meta.get_field(name)
+
+
+def _flip(term):
+    return term[1:] if term.startswith("-") else f"-{term}"
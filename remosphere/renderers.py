@@ -0,0 +1,103 @@
+"""
+Project-wide renderers and parsers (see REST_FRAMEWORK in settings).
+
+JSON goes through orjson instead of the stdlib encoder, with the
+output DRF's JSONRenderer produces: compact, UTF-8, datetimes as
+ISO 8601 with "Z", Decimals as numbers, lazy strings resolved, and
+U+2028/U+2029 escaped. Anything orjson cannot express that way
+(pretty printing, ensure_ascii...) falls back to DRF.
+
+MessagePack (`Accept: application/msgpack`) is available for
+internal services when the optional `msgpack` package is installed.
+"""
+import orjson
+from django.conf import settings
+from rest_framework import parsers, renderers
+from rest_framework.exceptions import ParseError
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import msgpack
+except ImportError:  # optional
+    msgpack = None
+
+# everything orjson does not handle natively (lazy strings, Decimal,
+# UUID, querysets...) or must format like DRF (datetime, date, time)
+# goes through DRF's own encoder
+_encoder = JSONEncoder()
+ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+def encode_default(obj):
+    return _encoder.default(obj)
+
+
+class ORJSONRenderer(renderers.JSONRenderer):
+    """
+    Drop-in JSONRenderer built on orjson.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+
+        indent = self.get_indent(accepted_media_type, renderer_context or {})
+        if indent is not None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(data, default=encode_default, option=ORJSON_OPTIONS)
+        except orjson.JSONEncodeError:
+            # e.g. integers beyond 64 bits: let the stdlib have a go
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # same strict JavaScript subset as JSONRenderer
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+
+
+class ORJSONParser(parsers.JSONParser):
+    """
+    Drop-in JSONParser built on orjson.
+    """
+    renderer_class = ORJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", settings.DEFAULT_CHARSET)
+        if encoding.lower().replace("-", "") != "utf8":
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError(f"JSON parse error - {exc}")
+
+
+class MessagePackRenderer(renderers.BaseRenderer):
+    """
+    Renders `application/msgpack`, with the same value conversions
+    as the JSON renderer.
+    """
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=encode_default, use_bin_type=True)
+
+
+class MessagePackParser(parsers.BaseParser):
+    """
+    Parses `application/msgpack` request bodies.
+    """
+    media_type = "application/msgpack"
+    renderer_class = MessagePackRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read(), raw=False)
+        except (ValueError, TypeError) as exc:
+            raise ParseError(f"MessagePack parse error - {exc}")
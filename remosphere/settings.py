@@ -11,6 +11,7 @@ https://docs.djangoproject.com/en/5.2/ref/settings/
 """
 
 from pathlib import Path
+import importlib.util
 import os
 import environ
 from datetime import timedelta
@@ -59,11 +60,14 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'users',
     'categories',
     'jobs',
     'applications',
     'companies',
+    'locations',
+    'analytics',
     'rest_framework',
     'drf_yasg',
     'rest_framework_simplejwt',
@@ -183,8 +187,25 @@ REST_FRAMEWORK = {
     "DEFAULT_FILTER_BACKENDS": [
         "django_filters.rest_framework.DjangoFilterBackend"
     ],
+    # orjson-backed JSON, see remosphere/renderers.py
+    "DEFAULT_RENDERER_CLASSES": [
+        "remosphere.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "remosphere.renderers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
 }
 
+# application/msgpack negotiation, when the optional msgpack package is installed
+if importlib.util.find_spec("msgpack"):
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"].append(
+        "remosphere.renderers.MessagePackRenderer")
+    REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"].append(
+        "remosphere.renderers.MessagePackParser")
+
 AUTH_USER_MODEL = 'users.User'
 
 # Cookie settings (for cookies created by our login/refresh endpoints)
@@ -257,6 +278,49 @@ if CELERY_RESULT_BACKEND and CELERY_RESULT_BACKEND.startswith('rediss://'):
 # Worker settings for connection stability
 CELERY_WORKER_CANCEL_LONG_RUNNING_TASKS_ON_CONNECTION_LOSS = False
 
+# Periodic tasks (run by `celery -A remosphere beat`)
+JOB_EXPIRY_SWEEP_INTERVAL = env.int("JOB_EXPIRY_SWEEP_INTERVAL", 300)  # seconds
+JOB_EXPIRY_BATCH_SIZE = env.int("JOB_EXPIRY_BATCH_SIZE", 500)
+# "similar jobs": changed jobs every few minutes, everything daily
+SIMILAR_JOBS_UPDATE_INTERVAL = env.int("SIMILAR_JOBS_UPDATE_INTERVAL", 600)  # seconds
+SIMILAR_JOBS_REBUILD_INTERVAL = env.int("SIMILAR_JOBS_REBUILD_INTERVAL", 86400)  # seconds
+SIMILAR_JOBS_K = env.int("SIMILAR_JOBS_K", 20)  # neighbours stored per job
+# analytics rollups: rows newer than the lag wait for the next run
+ANALYTICS_ROLLUP_INTERVAL = env.int("ANALYTICS_ROLLUP_INTERVAL", 300)  # seconds
+ANALYTICS_ROLLUP_BATCH_SIZE = env.int("ANALYTICS_ROLLUP_BATCH_SIZE", 5000)
+ANALYTICS_ROLLUP_LAG = env.int("ANALYTICS_ROLLUP_LAG", 60)  # seconds
+ANALYTICS_MAX_DAYS = env.int("ANALYTICS_MAX_DAYS", 366)  # per stats request
+# applicant status digests: changes are coalesced per user for the window
+APPLICATION_DIGEST_INTERVAL = env.int("APPLICATION_DIGEST_INTERVAL", 300)  # seconds
+APPLICATION_DIGEST_WINDOW = env.int("APPLICATION_DIGEST_WINDOW", 900)  # seconds
+APPLICATION_DIGEST_BATCH_SIZE = env.int("APPLICATION_DIGEST_BATCH_SIZE", 200)  # users per connection
+# per-user set of applied job ids behind `has_applied` (seconds)
+APPLIED_SET_TIMEOUT = env.int("APPLIED_SET_TIMEOUT", 3600)
+
+CELERY_BEAT_SCHEDULE = {
+    "deactivate-expired-jobs": {
+        "task": "jobs.tasks.deactivate_expired_jobs",
+        "schedule": JOB_EXPIRY_SWEEP_INTERVAL,
+    },
+    "update-similar-jobs": {
+        "task": "jobs.tasks.update_similar_jobs",
+        "schedule": SIMILAR_JOBS_UPDATE_INTERVAL,
+    },
+    "rebuild-similar-jobs": {
+        "task": "jobs.tasks.update_similar_jobs",
+        "schedule": SIMILAR_JOBS_REBUILD_INTERVAL,
+        "kwargs": {"full": True},
+    },
+    "update-analytics-rollups": {
+        "task": "analytics.tasks.update_rollups",
+        "schedule": ANALYTICS_ROLLUP_INTERVAL,
+    },
+    "send-application-status-digests": {
+        "task": "applications.tasks.send_status_digests",
+        "schedule": APPLICATION_DIGEST_INTERVAL,
+    },
+}
+
 # Password reset token lifetime (minutes)
 PASSWORD_RESET_TOKEN_LIFETIME_MINUTES = env.int(
     "PASSWORD_RESET_TOKEN_LIFETIME_MINUTES", 30)
@@ -281,6 +345,24 @@ CACHES = {
     }
 }
 
+# Response cache for jobs, categories and companies (seconds, 0 disables).
+# Entries are invalidated by generation counters, the timeout only bounds
+# staleness of data changed outside model signals.
+RESPONSE_CACHE_TIMEOUT = env.int("RESPONSE_CACHE_TIMEOUT", 300)
+
+# Build list responses from values() rows with precompiled serializers
+# (same output, far less per-row overhead); see remosphere.compiled
+COMPILED_SERIALIZERS = env.bool("COMPILED_SERIALIZERS", False)
+
+# Rows fetched per server-side cursor round trip by the streaming exports
+EXPORT_CHUNK_SIZE = env.int("EXPORT_CHUNK_SIZE", 2000)
+
+# Largest batch accepted by POST /api/jobs/bulk/
+JOB_INGEST_MAX_ITEMS = env.int("JOB_INGEST_MAX_ITEMS", 1000)
+
+# Largest batch accepted by POST /api/applications/transition/
+APPLICATION_TRANSITION_MAX_ITEMS = env.int("APPLICATION_TRANSITION_MAX_ITEMS", 500)
+
 CORS_ALLOW_CREDENTIALS = True
 CORS_ALLOWED_ORIGINS = [
     "http://localhost:8080",
@@ -20,7 +20,7 @@ from rest_framework import permissions
 from drf_yasg.views import get_schema_view
 from drf_yasg import openapi
 # from rest_framework_simplejwt.views import TokenRefreshView, TokenVerifyView
-from .views import api_root
+from .views import api_root, cache_stats
 
 # Swagger UI Documentation
 schema_view = get_schema_view(
@@ -87,12 +87,19 @@ urlpatterns = [
     # The companies categories
     path('api/', include('companies.urls')),
 
+    # The normalized job locations
+    path('api/', include('locations.urls')),
+    path('api/', include('analytics.urls')),
+
     # The Authentication
     path("api/auth/", include("authentication.urls")),  # JWT token endpoints,
 
     # The Applications for user application
     path("api/", include("applications.urls")),
     
+    # Response cache counters (admins only)
+    path("api/cache/stats/", cache_stats, name="cache-stats"),
+
     # The Home route
     # path("", api_root, name='api-root'),
 ]
@@ -1,6 +1,8 @@
 from rest_framework.decorators import api_view, permission_classes
 from rest_framework.permissions import AllowAny
 from rest_framework.response import Response
+from users.permissions import IsAdmin
+from .cache import get_cache_stats
 
 @api_view(['GET'])
 @permission_classes([AllowAny])
@@ -23,3 +25,12 @@ def api_root(request):
             "docs": request.build_absolute_uri("/docs/")
         }
     })
+
+
+@api_view(['GET'])
+@permission_classes([IsAdmin])
+def cache_stats(request):
+    """
+    Response cache hit/miss counters per endpoint (admins only).
+    """
+    return Response(get_cache_stats())
@@ -14,3 +14,12 @@ class IsAdminOrReadOnly(BasePermission):
 
         # For write operations — user must be admin
         return request.user.is_authenticated and request.user.is_admin
+
+
+class IsAdmin(BasePermission):
+    """
+    Only admins, whatever the method.
+    """
+
+    def has_permission(self, request, view):
+        return request.user.is_authenticated and request.user.is_admin